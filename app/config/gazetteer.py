@@ -0,0 +1,83 @@
+"""
+Offline gazetteer for the Monterrey metro area.
+
+Lugares con coordenadas aproximadas para resolver ubicaciones sin red
+(GazetteerGeocoder en geo_service.py). Cada lugar lleva su extensión en km:
+un punto de referencia es casi exacto, una colonia mide ~1 km y una avenida
+larga puede medir 10+ km. Solo lo suficientemente preciso (extensión <=
+GAZETTEER_MAX_EXTENT_KM) se usa; lo demás se resuelve con Nominatim. Por eso
+aquí no hay avenidas largas ni municipios: su centroide puede caer dentro del
+radio de un Costco sin que el evento esté cerca (ver ZONE_COORDS).
+
+GAZETTEER es solo una lista semilla (~20 lugares alrededor de las tiendas
+monitoreadas), no un nomenclátor completo del área metropolitana: cualquier
+lugar que no esté aquí pasa a Nominatim. Para cobertura real se genera un
+TSV desde OpenStreetMap con build_gazetteer.py (colonias y puntos de
+referencia de Nuevo León vía Overpass) y se carga con GAZETTEER_PATH (ver
+GazetteerGeocoder.load_tsv): nombre, lat, lon, tipo, extensión_km.
+
+Los nombres de colonia se repiten entre ciudades ("Colonia del Valle" existe
+en San Pedro y en la CDMX). Si el texto sitúa el evento en otra ciudad o
+estado (OTHER_REGIONS), el gazetteer no responde y decide Nominatim.
+
+Una colonia es un centroide de ~1 km: si el texto además nombra una calle
+("Av. Lázaro Cárdenas, col. Valle Oriente"), el resultado a nivel de calle
+de Nominatim es mejor y tiene prioridad; el centroide queda como respaldo.
+Los nombres se comparan en forma canónica (sin acentos, abreviaturas
+expandidas), así que basta una variante por lugar.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class Place(NamedTuple):
+    name: str
+    lat: float
+    lon: float
+    kind: str          # punto | colonia | calle | municipio
+    extent_km: float   # radio aproximado que cubre el nombre
+
+
+GAZETTEER: list[Place] = [
+    # ── Puntos de referencia ──
+    Place("macroplaza", 25.6694, -100.3099, "punto", 0.5),
+    Place("parque fundidora", 25.6785, -100.2846, "punto", 0.8),
+    Place("arena monterrey", 25.6803, -100.2881, "punto", 0.2),
+    Place("estadio bbva", 25.6690, -100.2440, "punto", 0.3),
+    Place("estadio universitario", 25.7222, -100.3114, "punto", 0.3),
+    Place("ciudad universitaria", 25.7262, -100.3125, "punto", 1.0),
+    Place("tec de monterrey", 25.6514, -100.2895, "punto", 0.5),
+    Place("hospital universitario", 25.6880, -100.3480, "punto", 0.3),
+    Place("aeropuerto internacional de monterrey", 25.7785, -100.1069, "punto", 1.5),
+    Place("plaza fiesta san agustin", 25.6494, -100.3353, "punto", 0.3),
+    Place("galerias monterrey", 25.6820, -100.3560, "punto", 0.3),
+    Place("costco valle oriente", 25.6455, -100.3255, "punto", 0.2),
+    Place("costco carretera nacional", 25.5780, -100.2510, "punto", 0.2),
+
+    # ── Colonias ──
+    Place("valle oriente", 25.6397, -100.3176, "colonia", 1.0),
+    Place("bosques de valle alto", 25.5790, -100.2480, "colonia", 1.0),
+    Place("valle alto", 25.5790, -100.2480, "colonia", 1.2),
+    Place("obispado", 25.6760, -100.3440, "colonia", 0.8),
+    Place("mitras centro", 25.6920, -100.3420, "colonia", 1.0),
+    Place("colonia tecnologico", 25.6510, -100.2870, "colonia", 0.8),
+    Place("colonia del valle", 25.6560, -100.3620, "colonia", 1.2),
+    Place("la estanzuela", 25.5550, -100.2450, "colonia", 1.5),
+]
+
+
+# Ciudades y estados fuera del área metropolitana que comparten nombres de
+# colonia con ella. Sin ambigüedad con Nuevo León: no van "león", "juárez"
+# ni "guadalupe" (municipios de NL) ni "méxico" a secas ("Monterrey, México").
+OTHER_REGIONS: list[str] = [
+    "cdmx", "ciudad de mexico", "distrito federal", "estado de mexico", "edomex",
+    "jalisco", "guadalajara", "zapopan",
+    "tamaulipas", "reynosa", "nuevo laredo", "tampico", "matamoros",
+    "coahuila", "saltillo", "torreon", "monclova",
+    "chihuahua", "sonora", "hermosillo", "sinaloa", "culiacan",
+    "puebla", "queretaro", "san luis potosi", "aguascalientes", "guanajuato",
+    "veracruz", "yucatan", "merida", "quintana roo", "cancun",
+    "baja california", "tijuana", "texas",
+]
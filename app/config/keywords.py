@@ -3,8 +3,18 @@ Keyword dictionaries for news categorization.
 
 Used as hints for the AI triage — NOT as hard filters.
 The AI makes the final relevance decision.
+
+Las palabras se escriben una sola vez, con o sin acentos: el matcher
+normaliza diccionario y texto igual ("ráfagas" cubre "rafagas").
 """
 
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from app.domain.text import normalize, trie_regex
+
 IMPACT_KEYWORDS: dict[str, list[str]] = {
     "accidente_vial": [
         "choque", "accidente", "volcadura", "atropello", "colisión",
@@ -20,7 +30,7 @@ IMPACT_KEYWORDS: dict[str, list[str]] = {
     "seguridad": [
         "balacera", "disparos", "tiroteo", "persecución",
         "enfrentamiento", "baleado", "herido de bala", "hombres armados",
-        "detonaciones", "rafagas", "ráfagas", "fuego cruzado",
+        "detonaciones", "ráfagas", "fuego cruzado",
         "resguardo policial", "acordonamiento", "zona acordonada",
     ],
     "bloqueo": [
@@ -49,24 +59,74 @@ EXCLUSION_KEYWORDS: list[str] = [
 ]
 
 
+@dataclass(frozen=True)
+class KeywordMatch:
+    """Every category and exclusion hit found in one text."""
+    categories: tuple[str, ...]   # en el orden de IMPACT_KEYWORDS
+    exclusions: tuple[str, ...]   # palabras de exclusión encontradas (normalizadas)
+
+
+class _KeywordMatcher:
+    """
+    All dictionaries compiled into one regex, built once at import.
+
+    La alternancia (en forma de trie) va dentro de un lookahead, así que
+    re.finditer prueba cada posición del texto una sola vez y reporta la
+    palabra más larga que empieza ahí, aunque se traslape con otra. Las
+    palabras que son prefijo de la encontrada ("cierre" en "cierre de
+    avenida") se agregan desde una tabla precalculada. Misma semántica de
+    subcadena que el `in` anterior, en una pasada y sin importar cuántas
+    palabras haya.
+    """
+
+    def __init__(self, impact: dict[str, list[str]], exclusions: list[str]) -> None:
+        self._category_order = {cat: i for i, cat in enumerate(impact)}
+        self._categories: dict[str, set[str]] = {}
+        for category, words in impact.items():
+            for word in words:
+                self._categories.setdefault(normalize(word), set()).add(category)
+        self._exclusions = {normalize(word) for word in exclusions}
+
+        vocabulary = set(self._categories) | self._exclusions
+        self._implied = {
+            word: [word[:i] for i in range(1, len(word)) if word[:i] in vocabulary]
+            for word in vocabulary
+        }
+        self._regex = re.compile(f"(?=({trie_regex(sorted(vocabulary))}))")
+
+    def match(self, text: str) -> KeywordMatch:
+        found: set[str] = set()
+        for m in self._regex.finditer(normalize(text)):
+            word = m.group(1)
+            if word not in found:
+                found.add(word)
+                found.update(self._implied[word])
+
+        categories = {cat for word in found for cat in self._categories.get(word, ())}
+        return KeywordMatch(
+            categories=tuple(sorted(categories, key=self._category_order.__getitem__)),
+            exclusions=tuple(sorted(found & self._exclusions)),
+        )
+
+
+_matcher = _KeywordMatcher(IMPACT_KEYWORDS, EXCLUSION_KEYWORDS)
+
+
+def match_keywords(text: str) -> KeywordMatch:
+    """All impact categories and exclusion hits in text, in a single scan."""
+    return _matcher.match(text)
+
+
 def check_high_impact(text: str) -> tuple[bool, str | None]:
     """
     Check if text contains high-impact keywords.
 
     Returns:
         (has_impact, category_name) — category is None if no match.
+        Cualquier exclusión gana; si no, la primera categoría de
+        IMPACT_KEYWORDS que aparezca.
     """
-    text_lower = text.lower()
-
-    # Exclusions first
-    for word in EXCLUSION_KEYWORDS:
-        if word in text_lower:
-            return False, None
-
-    # Check impact keywords
-    for category, words in IMPACT_KEYWORDS.items():
-        for word in words:
-            if word in text_lower:
-                return True, category
-
-    return False, None
+    result = match_keywords(text)
+    if result.exclusions or not result.categories:
+        return False, None
+    return True, result.categories[0]
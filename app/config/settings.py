@@ -30,6 +30,9 @@ class Settings(BaseSettings):
 
     # ── Database ──
     database_url: Optional[str] = None
+    # Caché en memoria delante de is_duplicate/find_duplicates (solo positivos)
+    db_dedup_cache_size: int = 5000
+    db_dedup_cache_ttl_secs: int = 6 * 3600
 
     # ── Fuentes ──
     # GNews (lib) descarga con feedparser/urllib: falla SSL en local y no permite
@@ -41,8 +44,89 @@ class Settings(BaseSettings):
     # ── Monitoring ──
     radius_km: float = 5.0
     max_age_hours: int = 1
-    triage_chunk_size: int = 25
+    triage_chunk_size: int = 25       # tope de noticias por chunk
+    # Presupuesto de tokens estimados por chunk (prompt / respuesta): las notas
+    # largas llenan el chunk antes de 25. La salida queda bajo max_tokens=4096.
+    triage_input_token_budget: int = 8000
+    triage_output_token_budget: int = 3000
+    # Extracto por noticia en el prompt del triage, cortado por tokens
+    # (medir con: python measure_triage_tokens.py)
+    triage_snippet_tokens: int = 120
+    # Chunks del triage en vuelo a la vez (los 429 se reintentan con un
+    # enfriamiento compartido, ver app/infrastructure/ai/backoff.py)
+    triage_parallelism: int = 4
+    ai_rate_limit_retries: int = 3
     processed_news_file: str = "processed_news.txt"
+    # Backend del dedup local: "file" (processed_news_file, tope por cantidad)
+    # o "sqlite" (processed_news.db junto a ese archivo, expiración por edad).
+    dedup_backend: str = "file"
+    processed_max_age_days: float = 7.0
+    # Agrupado de casi-duplicados antes del triage (MinHash sobre título +
+    # snippet): copias con Jaccard >= umbral comparten un solo representativo.
+    near_dup_enabled: bool = True
+    near_dup_threshold: float = 0.8
+    # Memoria entre ciclos de historias que el triage descartó
+    # (near_dup_state.json en el directorio de datos): TTL corto — una
+    # publicación idéntica días después puede ser un incidente nuevo.
+    near_dup_memory_hours: float = 6.0
+    near_dup_memory_size: int = 2000
+    # Recolección concurrente: plazo global del paso 1 (las fuentes que no
+    # respondan a tiempo se omiten ese ciclo) e hilos por fuente para sus
+    # requests (queries de Google, cuentas de Nitter, feeds directos).
+    collect_timeout_secs: float = 60.0
+    source_max_workers: int = 8
+
+    # Análisis profundo en paralelo (paso 6): candidatas simultáneas y topes
+    # por etapa. Nominatim se limita aparte a 1 req/s (su política de uso).
+    deep_workers: int = 4
+    # Ciclos que se reintenta una candidata cuyo envío (o análisis) falló por
+    # algo pasajero; agotados, se marca procesada y se descarta.
+    alert_retry_attempts: int = 3
+    deep_reader_concurrency: int = 4
+    deep_ai_concurrency: int = 2
+    nominatim_min_interval_secs: float = 1.0
+    # Lector de artículos: las estrategias baratas compiten en paralelo; el
+    # navegador (Crawl4AI) solo entra si todas fallan o traen < thin_chars.
+    deep_reader_thin_chars: int = 500
+    deep_reader_race_timeout_secs: float = 20.0
+    # Pool de Crawl4AI: navegadores calientes reusados entre notas; cada uno
+    # se recicla tras max_pages páginas o ante un error/timeout.
+    browser_pool_size: int = 2
+    browser_pool_max_pages: int = 50
+    browser_timeout_secs: float = 30.0
+
+    # ── HTTP (sesión compartida, ver app/infrastructure/http.py) ──
+    http_timeout_secs: float = 15.0   # default cuando el llamador no pasa timeout
+    http_retries: int = 1             # reintentos ante errores de conexión/5xx/429
+    http_backoff_factor: float = 0.5
+    http_pool_maxsize: int = 16       # conexiones keep-alive por host
+
+    # ── Historial de incidentes (índice espacial en memoria) ──
+    # Una alerta se enriquece con los incidentes previos a <= este radio en
+    # la ventana de días; el índice se siembra desde PostgreSQL al arrancar.
+    incident_history_radius_km: float = 1.0
+    incident_history_days: int = 7
+
+    # ── Gazetteer offline (primer nivel de geocodificación, ver app/config/gazetteer.py) ──
+    gazetteer_enabled: bool = True
+    gazetteer_path: Optional[str] = None   # TSV adicional (p.ej. extracto de OSM)
+    gazetteer_max_extent_km: float = 1.5   # lugares más grandes → primero Nominatim
+
+    # ── Caché de geocodificación (cache.db en el directorio de datos) ──
+    geocode_cache_enabled: bool = True
+    geocode_cache_size: int = 5000
+    geocode_cache_ttl_days: float = 30.0          # ubicaciones resueltas
+    geocode_cache_negative_ttl_hours: float = 24.0  # ubicaciones sin resultado
+
+    # ── Caché de extracción de artículos (mismo cache.db, por URL canónica) ──
+    extract_cache_enabled: bool = True
+    extract_cache_size: int = 2000
+    extract_cache_ttl_hours: float = 72.0
+
+    # ── Caché de veredictos del triage (mismo cache.db, por título+fuente) ──
+    triage_cache_enabled: bool = True
+    triage_cache_size: int = 5000
+    triage_cache_ttl_hours: float = 48.0
 
     # ── Scheduler ──
     min_poll_interval_minutes: int = 5
@@ -14,6 +14,8 @@ from typing import Optional
 import pytz
 from pydantic import BaseModel, Field
 
+from app.domain.text import truncate_tokens
+
 # Misma convención que scheduler.py: hora del centro para todas las fechas
 # que terminan en la BD (en Railway el reloj del contenedor es UTC).
 _CENTRAL_TZ = pytz.timezone("America/Chicago")
@@ -79,6 +81,28 @@ class NewsItem(BaseModel):
             d["keyword_hint"] = self.keyword_hint
         return d
 
+    def to_triage_dict(self, snippet_tokens: int = 120) -> dict:
+        """
+        Compact dict for the batch triage prompt.
+
+        Sin url ni fecha_pub (el modelo no las necesita para clasificar: la
+        antigüedad ya la filtró el pipeline), título sin el " - Medio" que
+        Google agrega, fuente recortada ("Twitter @pc_nl — Protección Civil"
+        → "@pc_nl") y extracto cortado por tokens, no por caracteres.
+        """
+        fuente = self.fuente.split(" — ")[0].removeprefix("Twitter ").strip()[:30]
+        titulo = self.titulo.strip()
+        for suffix in (f" - {self.fuente}", f" | {self.fuente}"):
+            if self.fuente and titulo.endswith(suffix) and len(titulo) > len(suffix):
+                titulo = titulo[: -len(suffix)].rstrip()
+        d = {"titulo": titulo, "fuente": fuente}
+        snippet = truncate_tokens(self.contenido, snippet_tokens)
+        if snippet and snippet != titulo:
+            d["contenido"] = snippet
+        if self.keyword_hint:
+            d["keyword_hint"] = self.keyword_hint
+        return d
+
 
 class TriageResult(BaseModel):
     """Result of batch triage for a single news item."""
@@ -88,6 +112,9 @@ class TriageResult(BaseModel):
     estimated_severity: int = Field(default=5, ge=1, le=10)
     location_hint: str = "no_especifica"
     reason: str = ""
+    # True cuando la respuesta del chunk no se pudo interpretar (JSON truncado
+    # o malformado): TriageService parte el chunk y reintenta las mitades.
+    fallback: bool = False
 
     @property
     def is_candidate(self) -> bool:
@@ -154,12 +181,22 @@ class ProximityResult(BaseModel):
 # Alert / Incident Domain
 # ============================================================
 
+class IncidentHistory(BaseModel):
+    """Previous incidents recorded near an alert's location."""
+    count: int = 0
+    radius_km: float = 0.0
+    days: int = 0
+    categories: list[str] = Field(default_factory=list)  # más cercano primero
+
+
 class Alert(BaseModel):
     """A fully resolved alert ready for notification and storage."""
     news: NewsItem
     analysis: AnalysisResult
     proximity: ProximityResult
     timestamp: datetime = Field(default_factory=datetime.now)
+    # Enriquecimiento opcional: incidentes previos en la misma zona
+    history: Optional[IncidentHistory] = None
 
     @property
     def fecha_evento(self) -> datetime:
@@ -9,7 +9,7 @@ out infrastructure (e.g., OpenAI → Anthropic) without touching business logic.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 
 from app.domain.models import (
     AnalysisResult,
@@ -23,8 +23,14 @@ class NewsSource(ABC):
     """Contract for a news collection source."""
 
     @abstractmethod
-    def collect(self) -> list[NewsItem]:
-        """Collect news items from this source."""
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
+        """
+        Collect news items from this source.
+
+        deadline is a time.monotonic() instant: a source that fans out
+        requests should return what it has by then instead of waiting for
+        its slowest request. None means no limit.
+        """
         ...
 
     @abstractmethod
@@ -42,6 +48,10 @@ class DeepReader(ABC):
         ...
 
 
+class AIUnavailableError(Exception):
+    """The AI provider call itself failed (network, API error, outage) — worth retrying later."""
+
+
 class AIProvider(ABC):
     """Contract for AI inference (triage + deep analysis)."""
 
@@ -52,7 +62,12 @@ class AIProvider(ABC):
 
     @abstractmethod
     def deep_analyze(self, title: str, content: str) -> Optional[AnalysisResult]:
-        """Deep analysis of a single article. Returns structured result."""
+        """
+        Deep analysis of a single article. Returns structured result.
+
+        None si la respuesta llegó pero no se pudo interpretar; si la llamada
+        al provider falló, lanza AIUnavailableError (fallo pasajero).
+        """
         ...
 
     @abstractmethod
@@ -93,6 +108,28 @@ class NewsRepository(ABC):
         """Check if this article was already processed."""
         ...
 
+    def find_duplicates(self, items: list[NewsItem], max_hours: int = 24) -> set[int]:
+        """
+        Bulk version of is_duplicate. Returns the positions (in `items`) of the
+        articles already processed.
+
+        Default: one is_duplicate per item. Backends should override it with a
+        single round trip.
+        """
+        return {
+            i
+            for i, item in enumerate(items)
+            if self.is_duplicate(item.titulo, item.url or "", item.fuente, max_hours)
+        }
+
+    def recent_incident_points(self, days: int = 7) -> list[dict]:
+        """
+        Located incidents of the last `days` days, to seed the in-memory
+        spatial index at startup: dicts with id, lat, lon, timestamp (epoch)
+        and categoria. Default: none (backends without coordinates).
+        """
+        return []
+
     @abstractmethod
     def get_incidents(
         self,
@@ -111,7 +148,7 @@ class NewsRepository(ABC):
 
 
 class DuplicateChecker(ABC):
-    """Contract for local (file-based) duplicate detection."""
+    """Contract for local (file/SQLite-based) duplicate detection."""
 
     @abstractmethod
     def is_processed(self, url: str) -> bool:
@@ -121,6 +158,24 @@ class DuplicateChecker(ABC):
     def mark_processed(self, url: str) -> None:
         ...
 
+    def mark_processed_many(self, urls: list[str]) -> None:
+        """Mark several URLs at once. Backends override it with a single write."""
+        for url in urls:
+            self.mark_processed(url)
+
+
+class KeyValueCache(ABC):
+    """Contract for a persistent key → JSON-serializable value cache with TTL."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Stored value, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_secs: float) -> None:
+        ...
+
 
 class GeocodingService(ABC):
     """Contract for geocoding text locations to coordinates."""
@@ -0,0 +1,75 @@
+"""
+Text normalization helpers shared by matching/dedup code.
+
+Pure functions, no I/O: the same normalization must be applied when building
+an index and when querying it, so it lives in one place.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+
+# Caracteres por token en español con los tokenizadores BPE de OpenAI y
+# Anthropic (medido sobre títulos/snippets de los feeds: ~3.5–4). Se usa el
+# extremo bajo para que la estimación sobreestime y los presupuestos no se
+# pasen.
+CHARS_PER_TOKEN = 3.5
+
+
+def normalize(text: str) -> str:
+    """Lowercase and strip accents ("Ráfagas" → "rafagas"). Keeps ñ→n, ü→u."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped.lower()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text for budgeting prompts (no tokenizer dependency)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens (estimate_tokens), at a word boundary, with "…" if cut."""
+    text = " ".join(text.split())
+    limit = int(max_tokens * CHARS_PER_TOKEN)
+    if len(text) <= limit:
+        return text
+    cut = text[: max(0, limit - 1)]
+    space = cut.rfind(" ")
+    if space > limit // 2:
+        cut = cut[:space]
+    return cut.rstrip(" ,;:.") + "…"
+
+
+def trie_regex(words: list[str]) -> str:
+    """
+    Regex alternation for `words` compiled as a prefix trie.
+
+    Una alternancia plana ("choque|chocó|...") hace que el motor pruebe cada
+    palabra en cada posición; el trie comparte prefijos ("cho(?:que|có)"),
+    así que el costo por posición depende del largo de la palabra y no de
+    cuántas haya. En cada nodo se prefiere la continuación más larga.
+    """
+    trie: dict = {}
+    for word in words:
+        if not word:
+            continue
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return _trie_pattern(trie) if trie else r"(?!)"
+
+
+def _trie_pattern(node: dict) -> str:
+    terminal = "" in node
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        # Cuantificador codicioso: primero intenta la palabra más larga
+        return f"(?:{body})?"
+    return body
@@ -17,13 +17,16 @@ from app.domain.models import (
     TriageDecision,
     TriageResult,
 )
-from app.domain.ports import AIProvider
+from app.domain.ports import AIProvider, AIUnavailableError
+from app.infrastructure.ai.backoff import RateLimitBackoff
 from app.infrastructure.ai.prompts import (
     DEEP_ANALYSIS_SYSTEM_PROMPT,
     DEEP_ANALYSIS_USER_PROMPT_TEMPLATE,
     TRIAGE_SYSTEM_PROMPT,
     TRIAGE_USER_PROMPT_TEMPLATE,
+    serialize_triage_articles,
 )
+from app.infrastructure.ai.usage import CallUsage, PromptCacheStats, usage_int
 
 try:
     import anthropic
@@ -35,21 +38,28 @@ except ImportError:
 class AnthropicProvider(AIProvider):
     """Anthropic-based AI provider for triage and deep analysis."""
 
-    def __init__(self, model: str = "claude-haiku-4-5-20251001", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "claude-haiku-4-5-20251001",
+        api_key: Optional[str] = None,
+        backoff: Optional[RateLimitBackoff] = None,
+    ) -> None:
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("pip install anthropic")
-        self._client = anthropic.Anthropic(api_key=api_key) if api_key else anthropic.Anthropic()
+        # Los 429/529 los reintenta RateLimitBackoff con un enfriamiento compartido;
+        # los reintentos propios del SDK (2 por default) lo saltarían.
+        client_kwargs = {"api_key": api_key} if api_key else {}
+        self._client = anthropic.Anthropic(max_retries=0, **client_kwargs)
         self._model = model
+        # Reintento ante 429 con enfriamiento compartido por los chunks en paralelo
+        self._backoff = backoff or RateLimitBackoff()
+        self.prompt_cache = PromptCacheStats()
 
     def provider_name(self) -> str:
         return f"anthropic / {self._model}"
 
     def batch_triage(self, articles: list[dict]) -> list[TriageResult]:
-        articles_text = json.dumps(
-            [{"index": i, **a} for i, a in enumerate(articles)],
-            ensure_ascii=False,
-            indent=2,
-        )
+        articles_text = serialize_triage_articles(articles)
         user_prompt = TRIAGE_USER_PROMPT_TEMPLATE.format(
             count=len(articles),
             articles_json=articles_text,
@@ -64,27 +74,51 @@ class AnthropicProvider(AIProvider):
             content=content[:3000],
         )
 
-        raw = self._call(DEEP_ANALYSIS_SYSTEM_PROMPT, user_prompt)
+        try:
+            raw = self._request(DEEP_ANALYSIS_SYSTEM_PROMPT, user_prompt, kind="analysis")
+        except Exception as e:
+            print(f"  ⚠️ Anthropic error: {e}")
+            raise AIUnavailableError(str(e)) from e
         return self._parse_analysis(raw)
 
     # ── Private ──────────────────────────────────────────────
 
-    def _call(self, system: str, user: str) -> Optional[str]:
+    def _call(self, system: str, user: str, kind: str = "triage") -> Optional[str]:
+        """_request, with provider errors logged and turned into None."""
         try:
-            response = self._client.messages.create(
+            return self._request(system, user, kind)
+        except Exception as e:
+            print(f"  ⚠️ Anthropic error: {e}")
+            return None
+
+    def _request(self, system: str, user: str, kind: str = "triage") -> Optional[str]:
+        """One completion (behind the rate-limit backoff); provider errors propagate."""
+        def create():
+            return self._client.messages.create(
                 model=self._model,
                 # 2000 truncaba el JSON del triage de 25 noticias (~2200 tokens) →
                 # json.loads fallaba → fallback "todas candidatas" → análisis profundo
                 # masivo y caro. 4096 cubre el chunk completo con margen.
                 max_tokens=4096,
                 temperature=0,  # clasificación determinista
-                system=system,
+                # System estático primero y marcado para la caché de prompts:
+                # las llamadas siguientes leen ese prefijo desde caché
+                system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
                 messages=[{"role": "user", "content": user}],
             )
-            return response.content[0].text
-        except Exception as e:
-            print(f"  ⚠️ Anthropic error: {e}")
-            return None
+        response = self._backoff.call(create)
+        self._record_usage(kind, getattr(response, "usage", None))
+        return response.content[0].text
+
+    def _record_usage(self, kind: str, usage) -> None:
+        if usage is None:
+            return
+        self.prompt_cache.record(CallUsage(
+            kind=kind,
+            input_tokens=usage_int(usage, "input_tokens"),
+            cache_read_tokens=usage_int(usage, "cache_read_input_tokens"),
+            cache_write_tokens=usage_int(usage, "cache_creation_input_tokens"),
+        ))
 
     def _parse_triage(self, raw: Optional[str], count: int) -> list[TriageResult]:
         if not raw:
@@ -111,7 +145,10 @@ class AnthropicProvider(AIProvider):
                 ))
             return results
         except (json.JSONDecodeError, KeyError, AttributeError, TypeError):
-            return [TriageResult(index=i, decision=TriageDecision.UNKNOWN) for i in range(count)]
+            return [
+                TriageResult(index=i, decision=TriageDecision.UNKNOWN, fallback=True)
+                for i in range(count)
+            ]
 
     def _parse_analysis(self, raw: Optional[str]) -> Optional[AnalysisResult]:
         if not raw:
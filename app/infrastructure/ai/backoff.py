@@ -0,0 +1,85 @@
+"""
+Rate-limit backoff shared by the AI providers.
+
+Con los chunks del triage en paralelo, un 429 (o el 529 "overloaded" de
+Anthropic) rara vez llega solo: las demás llamadas en vuelo van a recibir
+lo mismo. Por eso el enfriamiento es compartido — tras un 429 todas las
+llamadas que pasen por el mismo RateLimitBackoff esperan hasta que venza,
+en vez de reintentar cada una por su cuenta y alargar el límite.
+
+La espera respeta Retry-After cuando el servidor lo manda; si no, crece
+exponencialmente (base · 2^intento, con tope).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_RATE_LIMIT_STATUSES = (429, 529)
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """True for SDK errors carrying a 429/529 status (openai/anthropic APIStatusError)."""
+    return getattr(error, "status_code", None) in _RATE_LIMIT_STATUSES
+
+
+def retry_after_secs(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of the error's response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("retry-after")
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None  # formato fecha HTTP: se usa el backoff exponencial
+
+
+class RateLimitBackoff:
+    """Retries rate-limited calls behind a cooldown shared by every thread."""
+
+    def __init__(
+        self,
+        retries: int = 3,
+        base_delay_secs: float = 2.0,
+        max_delay_secs: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._retries = max(0, retries)
+        self._base = base_delay_secs
+        self._max = max_delay_secs
+        self._clock = clock
+        self._sleep = sleep
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self.rate_limited = 0  # 429/529 recibidos (para métricas/tests)
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run fn; on a rate-limit error wait and retry. Other errors propagate."""
+        attempt = 0
+        while True:
+            self._wait_cooldown()
+            try:
+                return fn()
+            except Exception as e:
+                if not is_rate_limited(e) or attempt >= self._retries:
+                    raise
+                delay = retry_after_secs(e)
+                if delay is None:
+                    delay = self._base * (2 ** attempt)
+                delay = min(delay, self._max)
+                with self._lock:
+                    self.rate_limited += 1
+                    self._cooldown_until = max(self._cooldown_until, self._clock() + delay)
+                print(f"  ⏳ Límite de la API, reintento en {delay:g}s")
+                attempt += 1
+
+    def _wait_cooldown(self) -> None:
+        with self._lock:
+            delay = self._cooldown_until - self._clock()
+        if delay > 0:
+            self._sleep(delay)
@@ -17,13 +17,16 @@ from app.domain.models import (
     TriageDecision,
     TriageResult,
 )
-from app.domain.ports import AIProvider
+from app.domain.ports import AIProvider, AIUnavailableError
+from app.infrastructure.ai.backoff import RateLimitBackoff
 from app.infrastructure.ai.prompts import (
     DEEP_ANALYSIS_SYSTEM_PROMPT,
     DEEP_ANALYSIS_USER_PROMPT_TEMPLATE,
     TRIAGE_SYSTEM_PROMPT,
     TRIAGE_USER_PROMPT_TEMPLATE,
+    serialize_triage_articles,
 )
+from app.infrastructure.ai.usage import CallUsage, PromptCacheStats, usage_int
 
 try:
     from openai import OpenAI
@@ -35,21 +38,28 @@ except ImportError:
 class OpenAIProvider(AIProvider):
     """OpenAI-based AI provider for triage and deep analysis."""
 
-    def __init__(self, model: str = "gpt-5-mini", api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        model: str = "gpt-5-mini",
+        api_key: Optional[str] = None,
+        backoff: Optional[RateLimitBackoff] = None,
+    ) -> None:
         if not OPENAI_AVAILABLE:
             raise ImportError("pip install openai")
-        self._client = OpenAI(api_key=api_key) if api_key else OpenAI()
+        # Los 429 los reintenta RateLimitBackoff con un enfriamiento compartido;
+        # los reintentos propios del SDK (2 por default) lo saltarían.
+        client_kwargs = {"api_key": api_key} if api_key else {}
+        self._client = OpenAI(max_retries=0, **client_kwargs)
         self._model = model
+        # Reintento ante 429 con enfriamiento compartido por los chunks en paralelo
+        self._backoff = backoff or RateLimitBackoff()
+        self.prompt_cache = PromptCacheStats()
 
     def provider_name(self) -> str:
         return f"openai / {self._model}"
 
     def batch_triage(self, articles: list[dict]) -> list[TriageResult]:
-        articles_text = json.dumps(
-            [{"index": i, **a} for i, a in enumerate(articles)],
-            ensure_ascii=False,
-            indent=2,
-        )
+        articles_text = serialize_triage_articles(articles)
         user_prompt = TRIAGE_USER_PROMPT_TEMPLATE.format(
             count=len(articles),
             articles_json=articles_text,
@@ -64,25 +74,50 @@ class OpenAIProvider(AIProvider):
             content=content[:3000],
         )
 
-        raw = self._call(DEEP_ANALYSIS_SYSTEM_PROMPT, user_prompt)
+        try:
+            raw = self._request(DEEP_ANALYSIS_SYSTEM_PROMPT, user_prompt, kind="analysis")
+        except Exception as e:
+            print(f"  ⚠️ OpenAI error: {e}")
+            raise AIUnavailableError(str(e)) from e
         return self._parse_analysis_response(raw)
 
     # ── Private ──────────────────────────────────────────────
 
-    def _call(self, system: str, user: str) -> Optional[str]:
+    def _call(self, system: str, user: str, kind: str = "triage") -> Optional[str]:
+        """_request, with provider errors logged and turned into None."""
         try:
-            response = self._client.chat.completions.create(
+            return self._request(system, user, kind)
+        except Exception as e:
+            print(f"  ⚠️ OpenAI error: {e}")
+            return None
+
+    def _request(self, system: str, user: str, kind: str = "triage") -> Optional[str]:
+        """One completion (behind the rate-limit backoff); provider errors propagate."""
+        def create():
+            return self._client.chat.completions.create(
                 model=self._model,
+                # La caché de prompts de OpenAI es automática por prefijo: el
+                # system estático va primero y lo variable al final
                 messages=[
                     {"role": "system", "content": system},
                     {"role": "user", "content": user},
                 ],
                 response_format={"type": "json_object"},
             )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"  ⚠️ OpenAI error: {e}")
-            return None
+        response = self._backoff.call(create)
+        self._record_usage(kind, getattr(response, "usage", None))
+        return response.choices[0].message.content
+
+    def _record_usage(self, kind: str, usage) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.prompt_cache.record(CallUsage(
+            kind=kind,
+            input_tokens=usage_int(usage, "prompt_tokens"),
+            cache_read_tokens=usage_int(details, "cached_tokens"),
+            cache_write_tokens=0,
+        ))
 
     def _parse_triage_response(self, raw: Optional[str], count: int) -> list[TriageResult]:
         if not raw:
@@ -123,7 +158,7 @@ class OpenAIProvider(AIProvider):
             print(f"  ⚠️ JSON parse error: {e}")
             print(f"  ⚠️ Triage falló — fallback: todas como candidatas")
             return [
-                TriageResult(index=i, decision=TriageDecision.UNKNOWN)
+                TriageResult(index=i, decision=TriageDecision.UNKNOWN, fallback=True)
                 for i in range(count)
             ]
 
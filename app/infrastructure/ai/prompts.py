@@ -2,8 +2,22 @@
 Centralized AI prompts — single source of truth for all system/user prompts.
 
 Extracted from ai_analyzer.py to eliminate 200+ lines of inline strings.
+
+Todo lo estático (criterios, tiendas, formato de respuesta) vive en los
+system prompts y los user prompts solo llevan lo que cambia por llamada: así
+el prefijo idéntico entre llamadas es lo más largo posible y el provider lo
+puede servir desde su caché de prompts.
+
+Ojo: la caché solo entra cuando el prefijo estático pasa el mínimo del
+provider — 1024 tokens en OpenAI y en Anthropic Sonnet/Opus, 2048 en Haiku.
+Hoy TRIAGE_SYSTEM_PROMPT ronda ~480 tokens y DEEP_ANALYSIS_SYSTEM_PROMPT
+~330, así que todas las llamadas salen como miss hasta que el prefijo crezca
+(más tiendas, más criterios). El scheduler registra cada ciclo el resumen de
+PromptCacheStats: ahí se ve si ya está pegando.
 """
 
+import json
+
 TRIAGE_SYSTEM_PROMPT = """Eres un analista de seguridad para Costco en Monterrey, Nuevo León, México.
 
 Tu trabajo: clasificar un batch de noticias y determinar cuáles podrían afectar
@@ -32,25 +46,25 @@ título contiene palabras clave de alto impacto (p.ej. "balacera" → seguridad)
 Úsala como pista a favor de marcar la noticia como candidata, NO como veredicto:
 los criterios de exclusión siguen aplicando.
 
-Responde SOLO con JSON válido. Sin texto adicional, sin markdown."""
-
-TRIAGE_USER_PROMPT_TEMPLATE = """Clasifica estas {count} noticias. Para cada una responde:
-
-{articles_json}
-
-Formato de respuesta (JSON exacto):
-{{
+FORMATO DE RESPUESTA (JSON exacto):
+{
   "results": [
-    {{
+    {
       "index": 0,
       "decision": "candidata" | "descartada",
       "category": "accidente_vial" | "incendio" | "seguridad" | "bloqueo" | "desastre_natural" | "otro",
       "severity": 1-10,
       "location_hint": "ubicación mencionada o 'no_especifica'",
       "reason": "razón breve"
-    }}
+    }
   ]
-}}"""
+}
+
+Responde SOLO con JSON válido. Sin texto adicional, sin markdown."""
+
+TRIAGE_USER_PROMPT_TEMPLATE = """Clasifica estas {count} noticias (index, titulo, fuente, contenido = extracto, keyword_hint opcional). Responde una entrada por noticia:
+
+{articles_json}"""
 
 DEEP_ANALYSIS_SYSTEM_PROMPT = """Eres un analista experto de seguridad operacional para Costco en Monterrey, NL.
 
@@ -65,30 +79,44 @@ IMPORTANTE sobre ubicación:
 - "Monterrey" solo NO es suficiente — necesitas colonia, calle, o referencia
 - Si el evento es en otra ciudad (Ramos Arizpe, Saltillo, etc.) → NO es relevante
 
-Responde SOLO con JSON válido."""
-
-DEEP_ANALYSIS_USER_PROMPT_TEMPLATE = """Analiza este artículo:
-
-TÍTULO: {title}
-
-CONTENIDO:
-{content}
-
-Responde con este JSON exacto:
-{{
+FORMATO DE RESPUESTA (JSON exacto):
+{
   "is_relevant": true/false,
   "category": "accidente_vial" | "incendio" | "seguridad" | "bloqueo" | "desastre_natural" | "otro",
   "severity": 1-10,
   "summary": "resumen de 1-2 oraciones",
   "exclusion_reason": "razón si no es relevante, vacío si sí es",
-  "location": {{
+  "location": {
     "extracted": "ubicación tal como aparece en el texto",
     "normalized": "dirección normalizada para geocodificación",
     "is_specific": true/false
-  }},
-  "details": {{
+  },
+  "details": {
     "victims": 0,
     "traffic_impact": "none" | "low" | "medium" | "high",
     "emergency_services": true/false
-  }}
-}}"""
+  }
+}
+
+Responde SOLO con JSON válido."""
+
+DEEP_ANALYSIS_USER_PROMPT_TEMPLATE = """Analiza este artículo:
+
+TÍTULO: {title}
+
+CONTENIDO:
+{content}"""
+
+
+def serialize_triage_articles(articles: list[dict]) -> str:
+    """
+    Wire format of the triage batch: compact JSON, one object per article.
+
+    Sin sangría ni espacios (indent=2 costaba ~20% de los tokens del prompt);
+    el "index" es el id corto con el que el modelo responde.
+    """
+    return json.dumps(
+        [{"index": i, **a} for i, a in enumerate(articles)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
@@ -0,0 +1,75 @@
+"""
+Prompt-cache usage per AI call — cached vs uncached input tokens.
+
+Anthropic reporta cache_read_input_tokens / cache_creation_input_tokens y
+OpenAI prompt_tokens_details.cached_tokens. Cada provider normaliza su
+respuesta a un CallUsage y lo registra aquí: las últimas llamadas quedan en
+un historial acotado y los totales sirven para ver si la caché de prompts
+del provider realmente está pegando (el prefijo tiene un mínimo de tokens
+para cachearse: por debajo, todas las llamadas salen como miss).
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CallUsage:
+    """Input-token breakdown of one call."""
+
+    kind: str                # "triage" | "analysis"
+    input_tokens: int        # sin caché (Anthropic) / total del prompt (OpenAI)
+    cache_read_tokens: int   # servidos desde la caché del provider
+    cache_write_tokens: int  # escritos a la caché en esta llamada (solo Anthropic)
+
+    @property
+    def hit(self) -> bool:
+        return self.cache_read_tokens > 0
+
+
+def usage_int(obj: Any, name: str) -> int:
+    """Integer usage field from an SDK object; missing/None/non-int → 0."""
+    value = getattr(obj, name, 0)
+    return value if isinstance(value, int) else 0
+
+
+class PromptCacheStats:
+    """Thread-safe per-call record of prompt-cache hits and misses."""
+
+    def __init__(self, history: int = 200) -> None:
+        self._calls: deque[CallUsage] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hits = 0
+        self.input_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+
+    def record(self, usage: CallUsage) -> None:
+        with self._lock:
+            self._calls.append(usage)
+            self.calls += 1
+            self.hits += usage.hit
+            self.input_tokens += usage.input_tokens
+            self.cache_read_tokens += usage.cache_read_tokens
+            self.cache_write_tokens += usage.cache_write_tokens
+
+    def recent(self) -> list[CallUsage]:
+        """Last recorded calls, oldest first."""
+        with self._lock:
+            return list(self._calls)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hits": self.hits,
+                "misses": self.calls - self.hits,
+                "input_tokens": self.input_tokens,
+                "cache_read_tokens": self.cache_read_tokens,
+                "cache_write_tokens": self.cache_write_tokens,
+            }
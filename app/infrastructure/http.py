@@ -0,0 +1,92 @@
+"""
+Shared HTTP transport — one pooled requests.Session for the whole process.
+
+Antes cada fetch (Google News, Nitter, RSS directos, lector de artículos,
+SESNSP, Telegram) usaba requests.get/post a nivel módulo: una conexión
+TCP+TLS nueva por request. La sesión compartida mantiene pools keep-alive
+por host (news.google.com, instancias de Nitter, api.telegram.org) y aplica
+la misma política de reintentos/backoff y timeout por default a todos.
+
+Las clases reciben la sesión por constructor (`session=None` → la compartida),
+así que los tests pueden inyectar un doble sin tocar la red.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.config.settings import settings
+
+# Códigos transitorios que vale la pena reintentar (429 respeta Retry-After)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_lock = threading.Lock()
+_shared: Optional[requests.Session] = None
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter con timeout por default (requests no tiene uno propio)."""
+
+    def __init__(self, timeout: float, **kwargs) -> None:
+        self._timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+def build_session(
+    retries: int = 1,
+    backoff_factor: float = 0.5,
+    pool_maxsize: int = 16,
+    timeout: float = 15.0,
+) -> requests.Session:
+    """
+    Crea una sesión con pools keep-alive por host y reintentos con backoff.
+
+    Solo GET/HEAD se reintentan ante status transitorios; los errores de
+    conexión (antes de enviar nada) se reintentan para cualquier método.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = _TimeoutAdapter(
+        timeout=timeout,
+        max_retries=retry,
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def shared_session() -> requests.Session:
+    """Sesión única del proceso, configurada desde settings (lazy, thread-safe)."""
+    global _shared
+    if _shared is None:
+        with _lock:
+            if _shared is None:
+                _shared = build_session(
+                    retries=settings.http_retries,
+                    backoff_factor=settings.http_backoff_factor,
+                    pool_maxsize=settings.http_pool_maxsize,
+                    timeout=settings.http_timeout_secs,
+                )
+    return _shared
@@ -12,12 +12,16 @@ import requests
 
 from app.domain.models import Alert
 from app.domain.ports import Notifier
+from app.infrastructure.http import shared_session
 
 
 class TelegramNotifier(Notifier):
     """Sends alerts and summaries to a Telegram chat."""
 
-    def __init__(self, bot_token: str, chat_id: str) -> None:
+    def __init__(
+        self, bot_token: str, chat_id: str, session: requests.Session | None = None
+    ) -> None:
+        self._session = session or shared_session()
         self._token = bot_token
         self._chat_id = chat_id
         self._api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
@@ -88,6 +92,14 @@ class TelegramNotifier(Notifier):
         lines.append(f"\n📏 A *{p.distancia_km} km* de {p.costco_nombre}")
         lines.append(f"🗺️ {esc(a.location.extracted)}")
 
+        h = alert.history
+        if h and h.count:
+            plural = "s" if h.count != 1 else ""
+            lines.append(
+                f"🔁 Zona recurrente: {h.count} incidente{plural} a ≤ {h.radius_km:g} km "
+                f"en los últimos {h.days} días"
+            )
+
         if a.summary:
             lines.append(f"\n📝 {esc(a.summary)}")
 
@@ -130,7 +142,7 @@ class TelegramNotifier(Notifier):
             "disable_web_page_preview": disable_preview,
         }
         try:
-            response = requests.post(self._api_url, json=payload, timeout=10)
+            response = self._session.post(self._api_url, json=payload, timeout=10)
 
             if response.status_code == 200:
                 print("  ✓ Telegram: mensaje enviado")
@@ -139,7 +151,7 @@ class TelegramNotifier(Notifier):
             # Markdown inválido → reenviar en texto plano antes que perder la alerta
             if response.status_code == 400:
                 payload.pop("parse_mode")
-                response = requests.post(self._api_url, json=payload, timeout=10)
+                response = self._session.post(self._api_url, json=payload, timeout=10)
                 if response.status_code == 200:
                     print("  ✓ Telegram: enviado sin formato (Markdown inválido)")
                     return True
@@ -25,14 +25,25 @@ class FileStorage(DuplicateChecker):
         return url in self._processed
 
     def mark_processed(self, url: str) -> None:
-        if url and url not in self._processed:
-            self._processed.add(url)
-            self._order.append(url)
-            try:
-                with open(self._filepath, "a", encoding="utf-8") as f:
-                    f.write(f"{url}\n")
-            except Exception as e:
-                print(f"  ⚠️ File storage write error: {e}")
+        self.mark_processed_many([url])
+
+    def mark_processed_many(self, urls: list[str]) -> None:
+        """Append every new URL in one open/write/fsync (the pipeline flushes once per cycle)."""
+        fresh: list[str] = []
+        for url in urls:
+            if url and url not in self._processed:
+                self._processed.add(url)
+                self._order.append(url)
+                fresh.append(url)
+        if not fresh:
+            return
+        try:
+            with open(self._filepath, "a", encoding="utf-8") as f:
+                f.write("".join(f"{url}\n" for url in fresh))
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f"  ⚠️ File storage write error: {e}")
 
     def cleanup(self, max_entries: int = 1000) -> int:
         """Keep only the most recent entries. Returns how many were removed.
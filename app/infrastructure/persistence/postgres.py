@@ -14,8 +14,9 @@ from typing import Optional
 
 import pytz
 
-from app.domain.models import Alert
+from app.domain.models import Alert, NewsItem
 from app.domain.ports import NewsRepository
+from app.infrastructure.ttl_cache import TTLCache
 
 CENTRAL_TZ = pytz.timezone("America/Chicago")
 
@@ -32,7 +33,12 @@ except ImportError:
 class PostgresRepository(NewsRepository):
     """PostgreSQL-backed incident repository."""
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        dup_cache_size: int = 5000,
+        dup_cache_ttl_secs: float = 6 * 3600,
+    ) -> None:
         if not PSYCOPG2_AVAILABLE:
             raise ImportError("pip install psycopg2-binary")
         self._db_url = database_url
@@ -42,6 +48,12 @@ class PostgresRepository(NewsRepository):
         # conecta; el primer error de conexión ocurre en la primera operación.
         self._pool: Optional[ThreadedConnectionPool] = None
         self._pool_lock = threading.Lock()
+        # Caché de dedup: las mismas notas siguen en los feeds por horas y el
+        # dedup preguntaba lo mismo a Postgres cada 5-15 min. Claves
+        # ("h", hash) y ("u", url, fuente) → fecha_deteccion del registro. Solo
+        # positivos (un negativo cambia en cuanto se guarda la incidencia);
+        # save_incident la mantiene al día.
+        self._dup_cache = TTLCache(maxsize=dup_cache_size, ttl_secs=dup_cache_ttl_secs)
 
     def _get_pool(self) -> ThreadedConnectionPool:
         if self._pool is None:
@@ -156,6 +168,12 @@ class PostgresRepository(NewsRepository):
             row = cursor.fetchone()
             if row:
                 print(f"  💾 Guardada en DB (ID: {row[0]})")
+                self._remember(
+                    news_hash,
+                    alert.news.url or f"sin-url:{news_hash}",
+                    alert.news.fuente,
+                    datetime.now(CENTRAL_TZ),
+                )
                 return row[0]
             print("  ⚠️ Duplicado en DB, omitida")
             return None
@@ -166,12 +184,15 @@ class PostgresRepository(NewsRepository):
         news_hash = self._hash_title(titulo)
         cutoff = datetime.now(CENTRAL_TZ) - timedelta(hours=max_hours)
 
+        if self._cached_duplicate(news_hash, url, fuente, cutoff):
+            return True
+
         with self._connection() as conn:
             cursor = conn.cursor()
             if url:
                 cursor.execute(
                     """
-                    SELECT id FROM noticias
+                    SELECT noticia_hash, url, fuente, fecha_deteccion FROM noticias
                     WHERE (noticia_hash = %s OR (url = %s AND fuente = %s))
                       AND fecha_deteccion >= %s
                     LIMIT 1
@@ -181,13 +202,101 @@ class PostgresRepository(NewsRepository):
             else:
                 cursor.execute(
                     """
-                    SELECT id FROM noticias
+                    SELECT noticia_hash, url, fuente, fecha_deteccion FROM noticias
                     WHERE noticia_hash = %s AND fecha_deteccion >= %s
                     LIMIT 1
                     """,
                     (news_hash, cutoff),
                 )
-            return cursor.fetchone() is not None
+            row = cursor.fetchone()
+
+        if row is None:
+            return False
+        self._remember(*row)
+        return True
+
+    def find_duplicates(self, items: list[NewsItem], max_hours: int = 24) -> set[int]:
+        """
+        Resuelve el dedup de un lote completo en UNA consulta (antes: una
+        consulta + checkout del pool por noticia). Misma semántica que
+        is_duplicate: coincide el hash del título, o el par (url, fuente)
+        cuando la noticia trae URL. Lo que ya está en la caché no viaja a la BD.
+        """
+        if not items:
+            return set()
+
+        hashes = [self._hash_title(item.titulo) for item in items]
+        cutoff = datetime.now(CENTRAL_TZ) - timedelta(hours=max_hours)
+
+        duplicates = {
+            i
+            for i, item in enumerate(items)
+            if self._cached_duplicate(hashes[i], item.url or "", item.fuente, cutoff)
+        }
+        pending = [i for i in range(len(items)) if i not in duplicates]
+        if not pending:
+            return duplicates
+
+        pairs = [(items[i].url, items[i].fuente) for i in pending if items[i].url]
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT noticia_hash, url, fuente, fecha_deteccion FROM noticias
+                WHERE fecha_deteccion >= %s
+                  AND (
+                    noticia_hash = ANY(%s)
+                    OR (url, fuente) IN (
+                        SELECT * FROM unnest(%s::text[], %s::text[])
+                    )
+                  )
+                """,
+                (
+                    cutoff,
+                    list({hashes[i] for i in pending}),
+                    [url for url, _ in pairs],
+                    [fuente for _, fuente in pairs],
+                ),
+            )
+            rows = cursor.fetchall()
+
+        for row in rows:
+            self._remember(*row)
+        dup_hashes = {row[0] for row in rows}
+        dup_pairs = {(row[1], row[2]) for row in rows}
+        duplicates.update(
+            i
+            for i in pending
+            if hashes[i] in dup_hashes
+            or (items[i].url and (items[i].url, items[i].fuente) in dup_pairs)
+        )
+        return duplicates
+
+    def recent_incident_points(self, days: int = 7) -> list[dict]:
+        cutoff = datetime.now(CENTRAL_TZ) - timedelta(days=days)
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id, latitud, longitud, fecha_deteccion, categoria
+                FROM noticias
+                WHERE fecha_deteccion >= %s
+                  AND latitud IS NOT NULL AND longitud IS NOT NULL
+                  AND NOT (latitud = 0 AND longitud = 0)
+                """,
+                (cutoff,),
+            )
+            return [
+                {
+                    "id": row[0],
+                    "lat": float(row[1]),
+                    "lon": float(row[2]),
+                    "timestamp": row[3].timestamp(),
+                    "categoria": row[4],
+                }
+                for row in cursor.fetchall()
+            ]
 
     def get_incidents(
         self,
@@ -299,6 +408,31 @@ class PostgresRepository(NewsRepository):
 
     # ── Private ──────────────────────────────────────────────
 
+    def _cached_duplicate(
+        self, news_hash: str, url: str, fuente: str, cutoff: datetime
+    ) -> bool:
+        """¿La caché ya sabe que es duplicada dentro de la ventana (cutoff)?"""
+        keys = [("h", news_hash)]
+        if url:
+            keys.append(("u", url, fuente))
+        for key in keys:
+            detected_at = self._dup_cache.get(key)
+            if detected_at is not None and detected_at >= cutoff:
+                return True
+        return False
+
+    def _remember(
+        self, news_hash: str, url: Optional[str], fuente: str, detected_at: Optional[datetime]
+    ) -> None:
+        """Guarda en la caché las claves de un registro existente en noticias."""
+        if detected_at is None:
+            return
+        if detected_at.tzinfo is None:
+            detected_at = CENTRAL_TZ.localize(detected_at)
+        self._dup_cache.set(("h", news_hash), detected_at)
+        if url:
+            self._dup_cache.set(("u", url, fuente), detected_at)
+
     @staticmethod
     def _hash_title(titulo: str) -> str:
         normalized = " ".join(titulo.lower().strip().split())
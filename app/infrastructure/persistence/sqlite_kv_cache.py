@@ -0,0 +1,123 @@
+"""
+SQLite key-value cache — persistent TTL + LRU cache behind the KeyValueCache port.
+
+Un archivo (WAL) puede alojar varias cachés: cada instancia trabaja en su
+propio namespace con su propio tope de entradas. Los valores se guardan como
+JSON. Las lecturas refrescan la posición LRU; las escrituras purgan lo
+vencido y recortan el namespace a max_entries (las menos usadas primero).
+
+Los errores de SQLite se registran y se tratan como miss: una caché rota
+nunca debe tumbar el ciclo.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from app.domain.ports import KeyValueCache
+
+
+class SQLiteKVCache(KeyValueCache):
+    """Namespaced, size-capped, expiring key-value store in an SQLite file."""
+
+    def __init__(
+        self,
+        filepath: str,
+        namespace: str,
+        max_entries: int = 5000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._namespace = namespace
+        self._max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # isolation_level=None → autocommit; las transacciones se abren a mano
+        self._conn = sqlite3.connect(filepath, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_kv_accessed ON kv(namespace, accessed_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        now = self._clock()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM kv WHERE namespace = ? AND key = ? AND expires_at > ?",
+                    (self._namespace, key, now),
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE kv SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self._namespace, key),
+                )
+                self.hits += 1
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            print(f"  ⚠️ Caché {self._namespace}: error de lectura: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl_secs: float) -> None:
+        now = self._clock()
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO kv (namespace, key, value, expires_at, accessed_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        (self._namespace, key, payload, now + ttl_secs, now),
+                    )
+                    self._evict(now)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"  ⚠️ Caché {self._namespace}: error de escritura: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM kv WHERE namespace = ?", (self._namespace,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then the least recently used beyond max_entries."""
+        self._conn.execute(
+            "DELETE FROM kv WHERE namespace = ? AND expires_at <= ?", (self._namespace, now)
+        )
+        excess = self._conn.execute(
+            "SELECT COUNT(*) FROM kv WHERE namespace = ?", (self._namespace,)
+        ).fetchone()[0] - self._max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM kv WHERE namespace = ? AND key IN ("
+                " SELECT key FROM kv WHERE namespace = ? ORDER BY accessed_at LIMIT ?)",
+                (self._namespace, self._namespace, excess),
+            )
@@ -0,0 +1,131 @@
+"""
+SQLite duplicate checker — URL dedup in an embedded database (WAL mode).
+
+Alternative to FileStorage for long-running deployments: startup does not
+load the processed set into memory (lookups go to an indexed table), batches
+of URLs are written in a single transaction, and entries expire by age
+instead of by a count cap.
+
+Select it with DEDUP_BACKEND=sqlite (see main.build_pipeline).
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+from app.domain.ports import DuplicateChecker
+
+
+class SQLiteStorage(DuplicateChecker):
+    """SQLite-backed processed-URL tracker with time-based expiry."""
+
+    def __init__(
+        self,
+        filepath: str,
+        max_age_days: float = 7.0,
+        import_from: Optional[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_age_secs = max_age_days * 86400
+        self._clock = clock
+        self._lock = threading.Lock()
+        # isolation_level=None → autocommit; las transacciones se abren a mano
+        self._conn = sqlite3.connect(filepath, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed ("
+            " url TEXT PRIMARY KEY,"
+            " processed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_processed_at ON processed(processed_at)"
+        )
+        if import_from:
+            self._import_legacy(import_from)
+
+    def is_processed(self, url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE url = ? AND processed_at >= ?",
+                (url, self._cutoff()),
+            ).fetchone()
+        return row is not None
+
+    def mark_processed(self, url: str) -> None:
+        self.mark_processed_many([url])
+
+    def mark_processed_many(self, urls: list[str]) -> None:
+        """
+        All URLs in one transaction (one fsync). Re-marking refreshes processed_at.
+
+        Sin el refresco, una URL vencida pero aún no borrada por cleanup()
+        seguiría dando is_processed False y se reprocesaría cada ciclo.
+        """
+        now = self._clock()
+        rows = [(url, now) for url in dict.fromkeys(urls) if url]
+        if not rows:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(
+                        "INSERT INTO processed (url, processed_at) VALUES (?, ?)"
+                        " ON CONFLICT(url) DO UPDATE SET processed_at = excluded.processed_at",
+                        rows,
+                    )
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            print(f"  ⚠️ SQLite storage write error: {e}")
+
+    def cleanup(self, max_entries: Optional[int] = None) -> int:
+        """
+        Delete entries older than max_age_days. Returns how many were removed.
+
+        max_entries es un tope adicional opcional; el scheduler no lo pasa
+        (el criterio de este backend es la antigüedad, no el número de filas).
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM processed WHERE processed_at < ?", (self._cutoff(),)
+            ).rowcount
+            if max_entries is not None:
+                removed += self._conn.execute(
+                    "DELETE FROM processed WHERE url NOT IN ("
+                    " SELECT url FROM processed ORDER BY processed_at DESC LIMIT ?)",
+                    (max_entries,),
+                ).rowcount
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _cutoff(self) -> float:
+        return self._clock() - self._max_age_secs
+
+    def _import_legacy(self, path: str) -> None:
+        """One-time import of a FileStorage file, only while the table is empty."""
+        if not os.path.exists(path):
+            return
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM processed LIMIT 1").fetchone():
+                return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                urls = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            print(f"  ⚠️ No se pudo importar {path}: {e}")
+            return
+        self.mark_processed_many(urls)
+        print(f"  ✓ SQLite storage: {len(urls)} URLs importadas de {path}")
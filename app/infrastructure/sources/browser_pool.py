@@ -0,0 +1,160 @@
+"""
+Long-lived Crawl4AI browser pool for the deep reader.
+
+Antes cada URL que caía al navegador hacía `asyncio.run` nuevo y abría un
+`AsyncWebCrawler` nuevo: un arranque en frío de Chromium por nota (el paso
+más caro del worker en CPU y memoria). El pool mantiene:
+
+- Un solo event loop en un hilo daemon, vivo toda la vida del proceso.
+- Hasta `size` crawlers calientes; cada uno se reusa entre URLs.
+- Reciclaje: un crawler se cierra y se reemplaza tras `max_pages` páginas
+  (Chromium acumula memoria) o tras un error/timeout (pudo quedar colgado).
+
+Los hilos del pipeline llaman fetch(url) de forma síncrona; la corrutina
+corre en el loop del pool. `crawler_factory` permite inyectar un doble en
+tests sin Chromium.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Callable, Optional
+
+try:
+    from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
+    CRAWL4AI_AVAILABLE = True
+except ImportError:
+    CRAWL4AI_AVAILABLE = False
+
+
+class BrowserPool:
+    """Bounded set of warm headless crawlers driven from one background event loop."""
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_pages: int = 50,
+        timeout_secs: float = 30.0,
+        crawler_factory: Optional[Callable[[], Any]] = None,
+        run_config: Any = None,
+    ) -> None:
+        self._size = max(1, size)
+        self._max_pages = max(1, max_pages)
+        self._timeout = timeout_secs
+        if crawler_factory is None:
+            if not CRAWL4AI_AVAILABLE:
+                raise ImportError("crawl4ai no está instalado")
+            crawler_factory = AsyncWebCrawler
+        self._factory = crawler_factory
+        self._run_config = run_config
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        # Solo se tocan desde el hilo del loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: list[list] = []  # [crawler, páginas servidas]
+
+        self.launches = 0  # arranques de navegador (para métricas/tests)
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Markdown of url rendered in a warm browser, or None on failure/timeout."""
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._fetch(url), loop)
+        try:
+            return future.result(timeout=self._timeout)
+        except Exception as e:
+            future.cancel()
+            print(f"  ⚠️ Crawl4AI error: {e or type(e).__name__}")
+            return None
+
+    def close(self) -> None:
+        """Close every warm crawler and stop the loop thread (idempotent)."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout=self._timeout)
+        except Exception as e:
+            print(f"  ⚠️ No se pudo cerrar el pool de navegadores: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+    # ── Loop thread ──────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    self._slots = asyncio.Semaphore(self._size)
+                    ready.set()
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=run, name="browser-pool", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+                atexit.register(self.close)
+            return self._loop
+
+    async def _fetch(self, url: str) -> Optional[str]:
+        entry = await self._acquire()
+        healthy = False
+        try:
+            result = await entry[0].arun(url=url, config=self._config())
+            healthy = True
+            if result.success and result.markdown:
+                return str(result.markdown)
+            return None
+        finally:
+            await self._release(entry, healthy)
+
+    async def _acquire(self) -> list:
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            crawler = self._factory()
+            await crawler.start()
+        except BaseException:
+            self._slots.release()
+            raise
+        self.launches += 1
+        return [crawler, 0]
+
+    async def _release(self, entry: list, healthy: bool) -> None:
+        entry[1] += 1
+        try:
+            if healthy and entry[1] < self._max_pages:
+                self._idle.append(entry)
+            else:
+                await self._close_crawler(entry[0])
+        finally:
+            self._slots.release()
+
+    async def _close_all(self) -> None:
+        idle, self._idle = self._idle, []
+        for crawler, _ in idle:
+            await self._close_crawler(crawler)
+
+    @staticmethod
+    async def _close_crawler(crawler: Any) -> None:
+        try:
+            await crawler.close()
+        except Exception as e:
+            print(f"  ⚠️ Crawl4AI: error al cerrar navegador: {e}")
+
+    def _config(self) -> Any:
+        if self._run_config is None and CRAWL4AI_AVAILABLE:
+            self._run_config = CrawlerRunConfig()
+        return self._run_config
@@ -1,74 +1,318 @@
 """
 Deep content reader — extracts full article text from URLs.
 
-Tries multiple strategies in order:
-1. Crawl4AI (headless browser, best quality)
-2. newspaper3k (fast, no browser needed)
-3. GNews full article helper
-4. Basic requests + BeautifulSoup fallback
+Strategies:
+- Cheap (one HTTP round trip each): newspaper3k, GNews full-article helper,
+  requests + BeautifulSoup. They race in parallel; the first one with
+  enough content wins and the rest are abandoned.
+- Browser: Crawl4AI (headless), served by a BrowserPool of warm crawlers.
+  Only used when every cheap strategy failed or returned thin content — a
+  browser timeout (up to 30 s) no longer delays the common case.
+
+Extraction cache (optional KeyValueCache): text + winning strategy per
+canonical URL, consulted before any network fetch, so a candidate seen again
+(failed send, restart, same link under other tracking params) is not re-read.
+Aggregator links are stored under both the link itself and the canonical
+publisher URL, so a different Google News link to the same article is a hit
+after resolving.
+
+Per-domain memory: the strategy that last worked for each news domain is
+tried first on its own next time (or straight to the browser for domains
+that need it), so most reads cost a single request. Aggregator links
+(news.google.com redirects) are first resolved to the publisher's URL; the
+memory is keyed on the publisher's domain, and an aggregator link that could
+not be resolved never records a winner — otherwise every Google News item
+would share one entry no matter which outlet it points to.
 
 Single responsibility: URL → full article text.
 """
 
 from __future__ import annotations
 
-import asyncio
-from typing import Optional
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import requests
 
-from app.domain.ports import DeepReader
+from app.domain.ports import DeepReader, KeyValueCache
+from app.infrastructure.http import shared_session
+from app.infrastructure.sources.browser_pool import CRAWL4AI_AVAILABLE, BrowserPool
 
 MAX_CONTENT_LENGTH = 3000
+MIN_CONTENT_LENGTH = 100   # menos que esto no cuenta como artículo
+THIN_CONTENT_LENGTH = 500  # por debajo, vale la pena intentar el navegador
 
+Strategy = tuple[str, Callable[[str], Optional[str]]]
 
-class MultiStrategyReader(DeepReader):
-    """Extracts article content using multiple fallback strategies."""
+# Hosts que solo redirigen al medio: su dominio no dice nada de cómo leer la nota
+AGGREGATOR_HOSTS = frozenset({"news.google.com"})
 
-    def extract(self, url: str) -> Optional[str]:
-        """Try all strategies in order. Return the best content or None."""
+_USER_AGENT = "Mozilla/5.0 (compatible; CostcoMonitor/1.0)"
+# Dónde trae la página intermedia de Google News el enlace al medio
+_PUBLISHER_LINK_PATTERNS = (
+    re.compile(r'data-n-au="([^"]+)"'),
+    re.compile(r'<link[^>]+rel="canonical"[^>]+href="([^"]+)"'),
+    re.compile(r'<meta[^>]+property="og:url"[^>]+content="([^"]+)"'),
+)
+
+# Parámetros de rastreo que no cambian el artículo
+_TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "cmpid", "mc_cid", "mc_eid", "ref", "amp"}
 
-        strategies = [
-            ("Crawl4AI", self._try_crawl4ai),
+
+def canonical_url(url: str) -> str:
+    """
+    Clave estable de un artículo: esquema/host en minúsculas, sin "www.",
+    sin fragmento, sin utm_* ni otros parámetros de rastreo, query ordenada
+    y sin "/" final.
+    """
+    parts = urlparse(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host, path, "", urlencode(query), ""))
+
+
+class MultiStrategyReader(DeepReader):
+    """Extracts article content racing cheap strategies, browser as fallback."""
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        cheap_strategies: list[Strategy] | None = None,
+        browser_strategy: Strategy | None = None,
+        browser_pool: BrowserPool | None = None,
+        thin_chars: int = THIN_CONTENT_LENGTH,
+        race_timeout_secs: float = 20.0,
+        max_workers: int = 16,
+        cache: KeyValueCache | None = None,
+        cache_ttl_secs: float = 3 * 86400,
+        resolver: Callable[[str], Optional[str]] | None = None,
+    ) -> None:
+        self._session = session or shared_session()
+        # URL de agregador → URL del medio (None si no se pudo resolver)
+        self._resolver = resolver or self._resolve_redirect
+        self._cheap: list[Strategy] = cheap_strategies if cheap_strategies is not None else [
             ("newspaper3k", self._try_newspaper),
             ("gnews", self._try_gnews_article),
             ("requests+bs4", self._try_requests),
         ]
+        # Navegadores calientes compartidos (None → sin estrategia de navegador)
+        self._browser_pool = browser_pool
+        if browser_pool is None and browser_strategy is None and CRAWL4AI_AVAILABLE:
+            self._browser_pool = BrowserPool()
+        self._browser: Optional[Strategy] = browser_strategy or (
+            ("Crawl4AI", self._try_crawl4ai) if self._browser_pool else None
+        )
+        self._thin_chars = thin_chars
+        self._race_timeout = race_timeout_secs
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reader")
+        self._cache = cache
+        self._cache_ttl = cache_ttl_secs
 
-        for name, strategy in strategies:
-            try:
-                content = strategy(url)
-                if content and len(content.strip()) > 100:
-                    return content.strip()[:MAX_CONTENT_LENGTH]
-            except Exception as e:
-                print(f"  ⚠️ {name} error: {e}")
+        # dominio → estrategia que funcionó la última vez
+        self._winners: dict[str, str] = {}
+        self._lock = threading.Lock()
 
-        return None
+    def extract(self, url: str) -> Optional[str]:
+        """Best content for url (trimmed to MAX_CONTENT_LENGTH) or None."""
+        # Primero la URL tal cual llegó (sin red); luego la del medio, que
+        # comparten los enlaces de Google News distintos a la misma nota.
+        keys = [canonical_url(url)]
+        cached = self._cached(keys[0])
+        if cached:
+            return cached["text"]
 
-    # ── Strategy implementations ─────────────────────────────
+        target = self._publisher_url(url)
+        if target != url:
+            keys.append(canonical_url(target))
+            cached = self._cached(keys[1])
+            if cached:
+                self._store(keys[:1], cached["text"], cached.get("strategy", ""))
+                return cached["text"]
+
+        domain = self._domain(target)
+        best = self._extract(target, domain)
+        if not best:
+            return None  # no se cachea: puede ser un fallo pasajero
+
+        strategy, content = best[0], best[1][:MAX_CONTENT_LENGTH]
+        if domain:
+            with self._lock:
+                self._winners[domain] = strategy
+        self._store(keys, content, strategy)
+        return content
+
+    def close(self) -> None:
+        """Release the browser pool and the strategy threads."""
+        if self._browser_pool:
+            self._browser_pool.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def domain_strategies(self) -> dict[str, str]:
+        """Snapshot of the per-domain winning strategy."""
+        with self._lock:
+            return dict(self._winners)
+
+    # ── Extraction cache ─────────────────────────────────────
+
+    def _cached(self, key: str) -> Optional[dict]:
+        """Cache entry with non-empty text, or None."""
+        if self._cache is None:
+            return None
+        entry = self._cache.get(key)
+        return entry if entry and entry.get("text") else None
+
+    def _store(self, keys: list[str], content: str, strategy: str) -> None:
+        if self._cache is None:
+            return
+        for key in dict.fromkeys(keys):
+            self._cache.set(key, {"text": content, "strategy": strategy}, self._cache_ttl)
+
+    # ── Orchestration ────────────────────────────────────────
+
+    def _extract(self, url: str, domain: str) -> Optional[tuple[str, str]]:
+        """(estrategia, contenido) ganador, o None si nada trajo texto útil."""
+        with self._lock:
+            remembered = self._strategy(self._winners.get(domain, ""))
+
+        best: Optional[tuple[str, str]] = None
+        tried: set[str] = set()
+
+        # 1) Lo que ganó la última vez en este dominio va primero y solo
+        if remembered:
+            tried.add(remembered[0])
+            best = self._better(best, remembered[0], self._run(remembered, url))
+            if self._enough(best):
+                return best
+
+        # 2) Carrera de las estrategias baratas
+        best = self._race([s for s in self._cheap if s[0] not in tried], url, best)
+        if self._enough(best):
+            return best
+
+        # 3) Navegador solo si lo barato falló o trajo poco
+        if self._browser and self._browser[0] not in tried:
+            best = self._better(best, self._browser[0], self._run(self._browser, url))
+        return best
+
+    def _race(
+        self, strategies: list[Strategy], url: str, best: Optional[tuple[str, str]]
+    ) -> Optional[tuple[str, str]]:
+        """
+        Run strategies in parallel; return as soon as one has non-thin content.
+
+        Las perdedoras se cancelan si no arrancaron; las que ya corren
+        terminan solas (cada request tiene su timeout) y se ignoran.
+        """
+        if not strategies:
+            return best
+        futures: dict[Future, str] = {
+            self._pool.submit(self._run, strategy, url): strategy[0] for strategy in strategies
+        }
+        pending = set(futures)
+        # Un solo plazo para toda la carrera, no uno por cada estrategia que termina
+        deadline = time.monotonic() + self._race_timeout
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                done, pending = (
+                    wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                    if remaining > 0 else (set(), pending)
+                )
+                if not done:
+                    print(f"  ⚠️ Lectura: sin respuesta en {self._race_timeout:g}s")
+                    break
+                for future in done:
+                    best = self._better(best, futures[future], future.result())
+                if self._enough(best):
+                    break
+        finally:
+            for future in pending:
+                future.cancel()
+        return best
 
     @staticmethod
-    def _try_crawl4ai(url: str) -> Optional[str]:
+    def _run(strategy: Strategy, url: str) -> Optional[str]:
+        name, func = strategy
         try:
-            from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
-        except ImportError:
+            content = func(url)
+        except Exception as e:
+            print(f"  ⚠️ {name} error: {e}")
             return None
+        if content and len(content.strip()) > MIN_CONTENT_LENGTH:
+            return content.strip()
+        return None
+
+    @staticmethod
+    def _better(
+        best: Optional[tuple[str, str]], name: str, content: Optional[str]
+    ) -> Optional[tuple[str, str]]:
+        if content and (best is None or len(content) > len(best[1])):
+            return (name, content)
+        return best
+
+    def _enough(self, best: Optional[tuple[str, str]]) -> bool:
+        return best is not None and len(best[1]) >= self._thin_chars
 
-        async def _crawl() -> Optional[str]:
-            config = CrawlerRunConfig()
-            async with AsyncWebCrawler() as crawler:
-                result = await crawler.arun(url=url, config=config)
-                if result.success and result.markdown:
-                    return result.markdown
+    def _strategy(self, name: str) -> Optional[Strategy]:
+        if not name:
             return None
+        candidates = [*self._cheap, *([self._browser] if self._browser else [])]
+        return next((s for s in candidates if s[0] == name), None)
 
+    @staticmethod
+    def _host(url: str) -> str:
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    @classmethod
+    def _domain(cls, url: str) -> str:
+        """Key for the per-domain memory; "" for aggregator hosts (never remembered)."""
+        host = cls._host(url)
+        return "" if host in AGGREGATOR_HOSTS else host
+
+    def _publisher_url(self, url: str) -> str:
+        """Publisher URL behind an aggregator link; any other URL as is."""
+        if self._host(url) not in AGGREGATOR_HOSTS:
+            return url
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    return pool.submit(lambda: asyncio.run(_crawl())).result(timeout=30)
-            return asyncio.run(_crawl())
-        except Exception:
-            return None
+            resolved = self._resolver(url)
+        except Exception as e:
+            print(f"  ⚠️ No se pudo resolver {url}: {e}")
+            return url
+        if resolved and self._host(resolved) and self._host(resolved) not in AGGREGATOR_HOSTS:
+            return resolved
+        return url
+
+    def _resolve_redirect(self, url: str) -> Optional[str]:
+        """Follow the redirect; if it stops on the aggregator, look for the link in the page."""
+        response = self._session.get(url, timeout=10, headers={"User-Agent": _USER_AGENT})
+        if self._host(response.url) not in AGGREGATOR_HOSTS:
+            return response.url
+        for pattern in _PUBLISHER_LINK_PATTERNS:
+            for match in pattern.finditer(response.text or ""):
+                link = match.group(1)
+                if self._host(link) and self._host(link) not in AGGREGATOR_HOSTS:
+                    return link
+        return None
+
+    # ── Strategy implementations ─────────────────────────────
+
+    def _try_crawl4ai(self, url: str) -> Optional[str]:
+        return self._browser_pool.fetch(url) if self._browser_pool else None
 
     @staticmethod
     def _try_newspaper(url: str) -> Optional[str]:
@@ -94,17 +338,13 @@ class MultiStrategyReader(DeepReader):
             pass
         return None
 
-    @staticmethod
-    def _try_requests(url: str) -> Optional[str]:
-        import requests
+    def _try_requests(self, url: str) -> Optional[str]:
         try:
             from bs4 import BeautifulSoup
         except ImportError:
             return None
 
-        response = requests.get(url, timeout=15, headers={
-            "User-Agent": "Mozilla/5.0 (compatible; CostcoMonitor/1.0)"
-        })
+        response = self._session.get(url, timeout=15, headers={"User-Agent": _USER_AGENT})
         response.raise_for_status()
 
         soup = BeautifulSoup(response.text, "html.parser")
@@ -0,0 +1,85 @@
+"""
+Conditional GET cache for RSS feeds — ETag / Last-Modified per feed URL.
+
+Shared by GoogleRSSSource, RSSDirectSource and NitterSource. Stores the
+validators each server sent plus the entries already parsed from that
+response; the next fetch sends If-None-Match / If-Modified-Since and, on a
+304, returns the stored entries without downloading or re-parsing the feed.
+
+Single responsibility: URL → feedparser entries, skipping unchanged feeds.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import feedparser
+import requests
+
+from app.infrastructure.http import shared_session
+
+
+@dataclass
+class _CachedFeed:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    entries: list
+
+
+class FeedCache:
+    """In-memory HTTP validator cache shared by all RSS fetchers (thread-safe)."""
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        self._session = session or shared_session()
+        self._feeds: dict[str, _CachedFeed] = {}
+        self._lock = threading.Lock()
+        self.hits = 0    # respuestas 304 servidas desde caché
+        self.misses = 0  # descargas completas (200)
+
+    def fetch_entries(
+        self, url: str, headers: Optional[dict] = None, timeout: Optional[float] = None
+    ) -> list:
+        """
+        GET condicional de un feed. Devuelve sus entries (como feedparser).
+
+        Lanza requests.HTTPError igual que raise_for_status() para que cada
+        fuente conserve su manejo de errores. timeout=None → el de la sesión.
+        """
+        with self._lock:
+            cached = self._feeds.get(url)
+
+        request_headers = dict(headers or {})
+        if cached:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        response = self._session.get(url, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and cached:
+            with self._lock:
+                self.hits += 1
+            return list(cached.entries)
+
+        response.raise_for_status()
+        # Bytes (no .text): feedparser respeta el encoding declarado en el XML
+        feed = feedparser.parse(response.content)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if etag or last_modified:
+                self._feeds[url] = _CachedFeed(etag, last_modified, list(feed.entries))
+            else:
+                # Sin validadores (p.ej. Google News) no hay 304 posible
+                self._feeds.pop(url, None)
+
+        return list(feed.entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._feeds.clear()
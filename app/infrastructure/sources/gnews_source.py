@@ -17,6 +17,7 @@ exporta GNEWS_ENABLED=true (y resuelve el problema SSL de urllib primero).
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -65,7 +66,7 @@ class GNewsSource(NewsSource):
     def source_name(self) -> str:
         return "GNews"
 
-    def collect(self) -> list[NewsItem]:
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
         if not self._enabled:
             print("  ⚠️ GNews desactivada (redundante con Google RSS; ver gnews_source.py)")
             return []
@@ -76,6 +77,10 @@ class GNewsSource(NewsSource):
         seen: set[str] = set()
 
         for query in GNEWS_QUERIES:
+            # Secuencial: pasado el deadline no se lanzan más queries
+            if deadline is not None and time.monotonic() >= deadline:
+                print("  ⏱️ GNews: deadline alcanzado — se devuelven las queries ya hechas")
+                break
             try:
                 results = self._client.get_news(query)
                 if not results:
@@ -10,12 +10,12 @@ import re
 from datetime import datetime, timezone
 from typing import Optional
 
-import feedparser
 import pytz
-import requests
 
 from app.domain.models import NewsItem
 from app.domain.ports import NewsSource
+from app.infrastructure.sources.feed_cache import FeedCache
+from app.infrastructure.sources.parallel import map_until
 
 CENTRAL_TZ = pytz.timezone("America/Chicago")
 
@@ -41,28 +41,52 @@ GOOGLE_NEWS_QUERIES = [
 class GoogleRSSSource(NewsSource):
     """Collects news from Google News RSS feeds."""
 
+    def __init__(
+        self,
+        max_workers: int = len(GOOGLE_NEWS_QUERIES),
+        feed_cache: FeedCache | None = None,
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._feed_cache = feed_cache or FeedCache()
+
     def source_name(self) -> str:
         return "Google News RSS"
 
-    def collect(self) -> list[NewsItem]:
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
         items: list[NewsItem] = []
         seen_titles: set[str] = set()
 
-        for query in GOOGLE_NEWS_QUERIES:
-            try:
-                fetched = self._fetch_query(query)
-                for item in fetched:
-                    key = item.titulo.lower().strip()[:80]
-                    if key not in seen_titles:
-                        seen_titles.add(key)
-                        items.append(item)
-            except Exception as e:
-                print(f"  ⚠️ Error en Google RSS query: {e}")
+        # Las queries se descargan en paralelo; el dedup se hace después en el
+        # orden original de GOOGLE_NEWS_QUERIES para que el resultado no
+        # dependa de qué respuesta llegó primero. Las que no llegan antes del
+        # deadline se omiten y se devuelve lo demás.
+        per_query = map_until(
+            self._safe_fetch_query, GOOGLE_NEWS_QUERIES, self._max_workers, deadline
+        )
+        late = per_query.count(None)
+        if late:
+            print(f"  ⏱️ Google RSS: {late}/{len(per_query)} queries sin respuesta a tiempo — omitidas")
+
+        for fetched in per_query:
+            if fetched is None:
+                continue
+            for item in fetched:
+                key = item.titulo.lower().strip()[:80]
+                if key not in seen_titles:
+                    seen_titles.add(key)
+                    items.append(item)
 
         return items
 
     # ── Private ──────────────────────────────────────────────
 
+    def _safe_fetch_query(self, query: str) -> list[NewsItem]:
+        try:
+            return self._fetch_query(query)
+        except Exception as e:
+            print(f"  ⚠️ Error en Google RSS query: {e}")
+            return []
+
     def _fetch_query(self, query: str) -> list[NewsItem]:
         encoded = query.replace(" ", "+")
         url = (
@@ -70,13 +94,12 @@ class GoogleRSSSource(NewsSource):
             f"q={encoded}&hl=es-419&gl=MX&ceid=MX:es-419"
         )
 
-        response = requests.get(url, headers={"User-Agent": _BROWSER_UA}, timeout=15)
-        response.raise_for_status()
-
-        feed = feedparser.parse(response.content)
+        entries = self._feed_cache.fetch_entries(
+            url, headers={"User-Agent": _BROWSER_UA}
+        )
         items: list[NewsItem] = []
 
-        for entry in feed.entries:
+        for entry in entries:
             titulo = self._clean_html(entry.get("title", ""))
             if not titulo:
                 continue
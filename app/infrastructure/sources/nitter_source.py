@@ -9,6 +9,10 @@ Estrategia de resiliencia: lista de instancias con fallback. Si la primera no
 responde para una cuenta, prueba la siguiente. La primera instancia que funcione
 se recuerda y se prueba primero para el resto de las cuentas del ciclo.
 
+Las cuentas se consultan en paralelo (el fallback de instancias sigue siendo
+secuencial DENTRO de cada cuenta), así que un ciclo tarda lo que la cuenta más
+lenta y no la suma de las 11.
+
 Las instancias de Nitter son frágiles (pueden caer). Actualiza NITTER_INSTANCES
 cuando alguna deje de funcionar — ver https://status.d420.de/ para instancias vivas.
 """
@@ -18,12 +22,12 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
 
-import feedparser
 import pytz
-import requests
 
 from app.domain.models import NewsItem
 from app.domain.ports import NewsSource
+from app.infrastructure.sources.feed_cache import FeedCache
+from app.infrastructure.sources.parallel import map_until
 
 CENTRAL_TZ = pytz.timezone("America/Chicago")
 
@@ -70,28 +74,43 @@ _BROWSER_UA = (
 class NitterSource(NewsSource):
     """Recolecta tweets de cuentas clave vía RSS de Nitter, con fallback de instancias."""
 
-    def __init__(self, instances: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        instances: list[str] | None = None,
+        max_workers: int = 8,
+        feed_cache: FeedCache | None = None,
+    ) -> None:
         self._instances = instances or NITTER_INSTANCES
+        self._max_workers = max(1, max_workers)
+        self._feed_cache = feed_cache or FeedCache()
         self._preferred: Optional[str] = None  # instancia que funcionó en este proceso
 
     def source_name(self) -> str:
         return "Nitter (Twitter/X)"
 
-    def collect(self) -> list[NewsItem]:
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
         items: list[NewsItem] = []
         cuentas_ok = 0
 
-        for account in TWITTER_ACCOUNTS:
-            handle = account["handle"]
-            nombre = account["nombre"]
-            fetched = self._fetch_account(handle, nombre)
+        # Una cuenta que agota el fallback de instancias no frena al resto:
+        # al deadline se devuelven los tweets de las que ya respondieron.
+        per_account = map_until(
+            lambda account: self._fetch_account(account["handle"], account["nombre"]),
+            TWITTER_ACCOUNTS,
+            self._max_workers,
+            deadline,
+        )
+
+        for fetched in per_account:
             if fetched:
                 cuentas_ok += 1
                 items.extend(fetched)
 
+        late = per_account.count(None)
         print(
             f"  ✓ Nitter: {len(items)} tweets de {cuentas_ok}/{len(TWITTER_ACCOUNTS)} cuentas"
             + (f" (instancia: {self._preferred})" if self._preferred else " (ninguna instancia respondió)")
+            + (f" — {late} sin respuesta a tiempo" if late else "")
         )
         return items
 
@@ -119,10 +138,10 @@ class NitterSource(NewsSource):
 
     def _fetch_rss(self, instance: str, handle: str) -> list:
         url = f"{instance}/{handle}/rss"
-        response = requests.get(url, headers={"User-Agent": _BROWSER_UA}, timeout=15)
-        response.raise_for_status()
-        feed = feedparser.parse(response.content)
-        return feed.entries[:TWEETS_PER_ACCOUNT]
+        entries = self._feed_cache.fetch_entries(
+            url, headers={"User-Agent": _BROWSER_UA}
+        )
+        return entries[:TWEETS_PER_ACCOUNT]
 
     def _to_items(self, entries: list, handle: str, nombre: str) -> list[NewsItem]:
         items: list[NewsItem] = []
@@ -0,0 +1,46 @@
+"""
+Fan-out con plazo para las fuentes — reparte requests en hilos y devuelve
+lo que terminó antes del deadline del ciclo.
+
+Compartido por GoogleRSSSource, RSSDirectSource y NitterSource. El deadline
+es un instante de time.monotonic() (lo fija MonitoringPipeline._collect); lo
+que no terminó a tiempo se cancela si no arrancó y, si ya arrancó, su hilo
+termina solo (cada request tiene su propio timeout) y su resultado se descarta.
+
+Single responsibility: args → resultados en orden, acotado por un deadline.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_until(
+    fn: Callable[[T], R],
+    args: Iterable[T],
+    max_workers: int,
+    deadline: Optional[float] = None,
+) -> list[Optional[R]]:
+    """
+    Apply fn to every arg in parallel, waiting at most until deadline.
+
+    Returns one result per arg, in the order of args (not of arrival), with
+    None for the calls still running at the deadline. Without deadline it
+    waits for all of them, like pool.map.
+    """
+    args = list(args)
+    if not args:
+        return []
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(args))))
+    futures = [pool.submit(fn, arg) for arg in args]
+    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+    _, pending = wait(futures, timeout=timeout)
+    pool.shutdown(wait=not pending, cancel_futures=True)
+
+    return [None if future in pending else future.result() for future in futures]
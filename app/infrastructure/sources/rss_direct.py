@@ -10,12 +10,12 @@ import re
 from datetime import datetime, timezone
 from typing import Optional
 
-import feedparser
 import pytz
-import requests
 
 from app.domain.models import NewsItem
 from app.domain.ports import NewsSource
+from app.infrastructure.sources.feed_cache import FeedCache
+from app.infrastructure.sources.parallel import map_until
 
 CENTRAL_TZ = pytz.timezone("America/Chicago")
 
@@ -49,39 +49,55 @@ DEFAULT_FEEDS = [
 class RSSDirectSource(NewsSource):
     """Collects news from direct RSS feed URLs."""
 
-    def __init__(self, feeds: list[RSSFeed] | None = None) -> None:
+    def __init__(
+        self,
+        feeds: list[RSSFeed] | None = None,
+        max_workers: int = 8,
+        feed_cache: FeedCache | None = None,
+    ) -> None:
         self._feeds = feeds or DEFAULT_FEEDS
+        self._max_workers = max(1, max_workers)
+        self._feed_cache = feed_cache or FeedCache()
 
     def source_name(self) -> str:
         return "RSS directo"
 
-    def collect(self) -> list[NewsItem]:
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
         items: list[NewsItem] = []
         seen: set[str] = set()
 
-        for feed_config in self._feeds:
-            try:
-                fetched = self._fetch_feed(feed_config)
-                for item in fetched:
-                    key = item.titulo.lower().strip()[:80]
-                    if key not in seen:
-                        seen.add(key)
-                        items.append(item)
-            except Exception as e:
-                print(f"  ⚠️ Error en RSS {feed_config.nombre}: {e}")
+        # Feeds en paralelo; dedup en el orden de configuración (determinista).
+        # Los feeds que no llegan antes del deadline se omiten este ciclo.
+        per_feed = map_until(self._safe_fetch_feed, self._feeds, self._max_workers, deadline)
+        for feed_config, fetched in zip(self._feeds, per_feed):
+            if fetched is None:
+                print(f"  ⏱️ RSS {feed_config.nombre}: sin respuesta a tiempo — omitido")
+
+        for fetched in per_feed:
+            if fetched is None:
+                continue
+            for item in fetched:
+                key = item.titulo.lower().strip()[:80]
+                if key not in seen:
+                    seen.add(key)
+                    items.append(item)
 
         return items
 
     # ── Private ──────────────────────────────────────────────
 
-    def _fetch_feed(self, feed_config: RSSFeed) -> list[NewsItem]:
-        response = requests.get(feed_config.url, timeout=15)
-        response.raise_for_status()
+    def _safe_fetch_feed(self, feed_config: RSSFeed) -> list[NewsItem]:
+        try:
+            return self._fetch_feed(feed_config)
+        except Exception as e:
+            print(f"  ⚠️ Error en RSS {feed_config.nombre}: {e}")
+            return []
 
-        feed = feedparser.parse(response.text)
+    def _fetch_feed(self, feed_config: RSSFeed) -> list[NewsItem]:
+        entries = self._feed_cache.fetch_entries(feed_config.url)
         items: list[NewsItem] = []
 
-        for entry in feed.entries:
+        for entry in entries:
             titulo = self._clean_html(entry.get("title", "")).strip()
             if not titulo:
                 continue
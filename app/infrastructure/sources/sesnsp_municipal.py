@@ -19,6 +19,8 @@ from typing import Optional
 
 import requests
 
+from app.infrastructure.http import shared_session
+
 DATASET_PAGE = "https://www.datos.gob.mx/dataset/incidencia_delictiva"
 
 # Abreviaturas de mes que usa el SESNSP en el nombre del archivo
@@ -37,6 +39,9 @@ _BROWSER_UA = (
 class SESNSPMunicipalData:
     """Descarga y filtra el CSV municipal del SESNSP por claves de municipio."""
 
+    def __init__(self, session: requests.Session | None = None) -> None:
+        self._session = session or shared_session()
+
     def discover_url(self) -> Optional[str]:
         """Encuentra la URL vigente del CSV municipal (IDM_NM_*.csv) en datos.gob.mx."""
         try:
@@ -84,7 +89,7 @@ class SESNSPMunicipalData:
             try:
                 # El CSV vive en repodatos.atdt.gob.mx, cuyo SSL sí valida
                 # completo (el fallback sin verify es solo del descubrimiento).
-                response = requests.head(
+                response = self._session.head(
                     candidato,
                     headers={"User-Agent": _BROWSER_UA},
                     timeout=15,
@@ -136,7 +141,7 @@ class SESNSPMunicipalData:
             return []
 
         print(f"  📥 SESNSP: descargando en streaming {url.rsplit('/', 1)[-1]}...")
-        with requests.get(
+        with self._session.get(
             url, headers={"User-Agent": _BROWSER_UA}, stream=True, timeout=300
         ) as response:
             response.raise_for_status()
@@ -159,8 +164,7 @@ class SESNSPMunicipalData:
 
     # ── Private ──────────────────────────────────────────────
 
-    @staticmethod
-    def _get_dataset_page() -> requests.Response:
+    def _get_dataset_page(self) -> requests.Response:
         """
         GET a datos.gob.mx con fallback sin verificación SSL.
 
@@ -170,7 +174,7 @@ class SESNSPMunicipalData:
         descarga del CSV en sí va contra repodatos.atdt.gob.mx con SSL completo.
         """
         try:
-            response = requests.get(
+            response = self._session.get(
                 DATASET_PAGE, headers={"User-Agent": _BROWSER_UA}, timeout=30
             )
             response.raise_for_status()
@@ -179,7 +183,7 @@ class SESNSPMunicipalData:
             print("  ⚠️ SESNSP: cadena SSL incompleta en datos.gob.mx — reintentando sin verificación (solo descubrimiento)")
             import urllib3
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            response = requests.get(
+            response = self._session.get(
                 DATASET_PAGE, headers={"User-Agent": _BROWSER_UA}, timeout=30, verify=False
             )
             response.raise_for_status()
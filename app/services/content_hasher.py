@@ -1,23 +1,55 @@
 """
-Content hasher — detects when news sources haven't changed between runs.
+Content hasher — detects what changed in the news sources between runs.
 
-If the hash is identical, the pipeline can skip entirely (0 tokens consumed).
+Two granularities:
+- has_changed(): whole-batch hash. Identical batch → skip (0 tokens consumed).
+- changed_items(): per-item fingerprints remembered across cycles. Only the
+  delta (new or changed items) goes downstream, so time filtering, dedup and
+  keyword hints scale with what is new, not with the size of the feeds.
+
+Both keep `consecutive_no_change`, which the scheduler uses to stretch the
+polling interval.
+
+With a state_path the tracker snapshots itself to JSON on every commit() and
+restores at construction, so a container restart does not replay the whole
+feed through dedup/triage nor reset the polling interval.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 
 from app.domain.models import NewsItem
 
+# Ciclos que una huella sobrevive sin volver a verse en los feeds. 288 ciclos
+# ≈ 1 día al intervalo mínimo (5 min); las notas salen de los feeds en horas.
+DEFAULT_MAX_IDLE_CYCLES = 288
+
 
 class ContentHasher:
     """Tracks content changes across monitoring cycles."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_idle_cycles: int = DEFAULT_MAX_IDLE_CYCLES,
+        state_path: str | None = None,
+    ) -> None:
         self._last_hash: str | None = None
         self.consecutive_no_change: int = 0
 
+        # Huellas por noticia → último ciclo en que se vio en los feeds
+        self._seen: dict[str, int] = {}
+        # Huellas del delta del ciclo en curso; se confirman con commit()
+        self._pending: set[str] = set()
+        self._cycle: int = 0
+        self._max_idle_cycles = max_idle_cycles
+
+        self._state_path = state_path
+        if state_path:
+            self._load()
+
     def has_changed(self, news: list[NewsItem]) -> bool:
         """
         Check if the news batch differs from the last run.
@@ -40,6 +72,96 @@ class ContentHasher:
         self.consecutive_no_change = 0
         return True
 
+    def changed_items(self, news: list[NewsItem]) -> list[NewsItem]:
+        """
+        Return only the items not seen in previous cycles (new or changed).
+
+        Las huellas del delta quedan pendientes hasta commit(): si el ciclo
+        revienta a la mitad, esas noticias vuelven a salir en el siguiente.
+        Para reintentar una noticia concreta (p.ej. envío fallido a Telegram)
+        se usa forget() antes de commit().
+        """
+        self._cycle += 1
+        self._last_hash = self._compute(news)
+
+        delta: list[NewsItem] = []
+        delta_fps: set[str] = set()
+        for item in news:
+            fp = self.fingerprint(item)
+            if fp in self._seen:
+                self._seen[fp] = self._cycle
+            elif fp not in delta_fps:
+                delta_fps.add(fp)
+                delta.append(item)
+
+        self._pending = delta_fps
+        self.consecutive_no_change = 0 if delta else self.consecutive_no_change + 1
+        return delta
+
+    def forget(self, item: NewsItem) -> None:
+        """Drop an item from the current delta so it is reported again next cycle."""
+        fp = self.fingerprint(item)
+        self._pending.discard(fp)
+        self._seen.pop(fp, None)
+
+    def commit(self) -> None:
+        """Confirm the current delta as seen and expire fingerprints gone from the feeds."""
+        for fp in self._pending:
+            self._seen[fp] = self._cycle
+        self._pending = set()
+
+        oldest = self._cycle - self._max_idle_cycles
+        if oldest > 0:
+            self._seen = {fp: c for fp, c in self._seen.items() if c > oldest}
+
+        if self._state_path:
+            self.save()
+
+    def save(self) -> None:
+        """Snapshot the tracker to state_path (atomic replace; errors are logged, not raised)."""
+        if not self._state_path:
+            return
+        state = {
+            "last_hash": self._last_hash,
+            "consecutive_no_change": self.consecutive_no_change,
+            "cycle": self._cycle,
+            "seen": self._seen,
+        }
+        tmp_path = f"{self._state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            print(f"  ⚠️ No se pudo guardar el estado del hasher: {e}")
+
+    @staticmethod
+    def fingerprint(item: NewsItem) -> str:
+        """Per-item identity: same URL + same title. A retitled note counts as changed."""
+        content = f"{item.url or ''}\x1f{item.titulo}"
+        return hashlib.md5(content.encode()).hexdigest()
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _load(self) -> None:
+        """Restore a snapshot written by save(). Missing/corrupt file → fresh state."""
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            seen = {str(fp): int(c) for fp, c in state.get("seen", {}).items()}
+            cycle = int(state.get("cycle", 0))
+            no_change = int(state.get("consecutive_no_change", 0))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"  ⚠️ Estado del hasher ilegible, se empieza de cero: {e}")
+            return
+
+        self._seen = seen
+        self._cycle = cycle
+        self.consecutive_no_change = no_change
+        self._last_hash = state.get("last_hash")
+
     @staticmethod
     def _compute(news: list[NewsItem]) -> str:
         titles = sorted(item.titulo for item in news)
@@ -3,10 +3,15 @@ Deep analysis service — full analysis of candidate articles.
 
 Takes a triage candidate, reads the full content, runs deep AI analysis,
 checks geo proximity, and produces a resolved Alert (or discards the article).
+
+Thread-safe: the pipeline runs several candidates at once. Each stage has
+its own concurrency cap (reader and AI semaphores); the geocoder applies
+its own rate limit.
 """
 
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
 from app.domain.models import Alert, AnalysisResult, NewsItem, TriageResult
@@ -22,10 +27,15 @@ class DeepAnalysisService:
         ai: AIProvider,
         reader: DeepReader,
         geo: GeoService,
+        reader_concurrency: int = 4,
+        ai_concurrency: int = 2,
     ) -> None:
         self._ai = ai
         self._reader = reader
         self._geo = geo
+        # Topes por etapa: lecturas (HTTP/navegador) y llamadas al LLM
+        self._reader_slots = threading.BoundedSemaphore(max(1, reader_concurrency))
+        self._ai_slots = threading.BoundedSemaphore(max(1, ai_concurrency))
 
     def analyze(self, news: NewsItem, triage: TriageResult) -> Optional[Alert]:
         """
@@ -39,6 +49,10 @@ class DeepAnalysisService:
 
         Returns:
             Alert if the article is relevant and within radius, None otherwise.
+
+        Raises:
+            AIUnavailableError: the provider call failed; the pipeline retries
+            the candidate next cycle instead of treating it as discarded.
         """
         print(f"\n  📰 Procesando: {news.titulo[:70]}...")
         print(f"     Triage: {triage.estimated_category} | Sev ~{triage.estimated_severity} | {triage.location_hint}")
@@ -48,10 +62,11 @@ class DeepAnalysisService:
 
         # Step 2: AI Deep Analysis
         print("     🤖 Análisis profundo...")
-        analysis = self._ai.deep_analyze(news.titulo, content)
+        with self._ai_slots:
+            analysis = self._ai.deep_analyze(news.titulo, content)
 
         if not analysis:
-            print("     ⚠️ Error en análisis IA")
+            print("     ⚠️ Respuesta del análisis IA ilegible — descartada")
             return None
 
         if not analysis.is_relevant:
@@ -87,7 +102,8 @@ class DeepAnalysisService:
 
         if news.url:
             print("     📖 Extrayendo artículo completo...")
-            full = self._reader.extract(news.url)
+            with self._reader_slots:
+                full = self._reader.extract(news.url)
             if full and len(full) > len(content):
                 content = full
                 print(f"     ✓ Artículo completo: {len(content)} chars")
@@ -10,13 +10,29 @@ Single responsibility: determine if a news event is near a Costco.
 
 from __future__ import annotations
 
-from typing import Optional
+import re
+import threading
+import time
+from typing import Callable, Iterable, Optional
 
-from geopy.distance import geodesic
 from geopy.geocoders import Nominatim
 
-from app.domain.models import Coordinates, CostcoLocation, ProximityResult
-from app.domain.ports import GeocodingService
+from app.config.gazetteer import GAZETTEER, OTHER_REGIONS, Place
+from app.domain.models import Alert, Coordinates, CostcoLocation, IncidentHistory, ProximityResult
+from app.domain.ports import GeocodingService, KeyValueCache
+from app.domain.text import trie_regex
+from app.services.proximity import ProximityEngine
+from app.services.rate_limit import RateLimiter
+from app.services.road_index import RoadIndex, canonical
+from app.services.spatial_index import SpatialIndex
+
+# Mención de una calle concreta en texto canónico (abreviaturas ya expandidas)
+_STREET = re.compile(
+    r"\b(?:avenida|calle|bulevar|calzada|prolongacion|privada|esquina con|cruce de)\s+[a-z0-9]"
+)
+
+# Una ciudad precedida de esto es el destino de una vía ("carretera a saltillo")
+_NOT_A_ROAD = r"(?<!carretera a )(?<!autopista a )(?<!autopista )(?<!libramiento a )(?<!monterrey )"
 
 
 # Coordenadas aproximadas por zona, SOLO como fallback cuando Nominatim falla.
@@ -42,8 +58,17 @@ ZONE_COORDS: dict[str, tuple[float, float]] = {
 class NominatimGeocoder(GeocodingService):
     """Geocodes location text using OpenStreetMap's Nominatim."""
 
-    def __init__(self) -> None:
+    def __init__(self, min_interval_secs: float = 1.0) -> None:
         self._geocoder = Nominatim(user_agent="costco_news_monitor_v2")
+        self._state = threading.local()
+        # Política de uso de Nominatim: <= 1 req/s, también con candidatas en paralelo
+        self._rate_limiter = RateLimiter(min_interval_secs)
+
+    @property
+    def last_lookup_errored(self) -> bool:
+        """True si la última consulta de este hilo tuvo un error de red/servicio
+        (su resultado no es definitivo y no debe cachearse)."""
+        return getattr(self._state, "errored", False)
 
     def geocode(self, location_text: str) -> Optional[tuple[float, float]]:
         """
@@ -52,10 +77,12 @@ class NominatimGeocoder(GeocodingService):
         2. Fallback to generic zone coordinates
         """
         text_lower = location_text.lower().strip()
+        self._state.errored = False
 
         # Try precise geocoding first
         for suffix in [", Monterrey, Nuevo León, México", ""]:
             try:
+                self._rate_limiter.acquire()
                 result = self._geocoder.geocode(
                     location_text + suffix, timeout=10
                 )
@@ -63,6 +90,7 @@ class NominatimGeocoder(GeocodingService):
                     print(f"  ✓ Geocodificación precisa: ({result.latitude:.6f}, {result.longitude:.6f})")
                     return (result.latitude, result.longitude)
             except Exception:
+                self._state.errored = True
                 continue
 
         # Fallback por zona — la coincidencia MÁS específica (clave más larga) primero,
@@ -75,6 +103,147 @@ class NominatimGeocoder(GeocodingService):
         return None
 
 
+class GazetteerGeocoder(GeocodingService):
+    """
+    First-tier offline geocoder over a local gazetteer, with a remote fallback.
+
+    Todos los nombres se compilan en un solo regex (trie, límites de palabra)
+    sobre texto canónico. Entre los lugares mencionados gana el más preciso
+    (menor extensión; a igualdad, el que aparece primero). Si es lo bastante
+    preciso se responde sin red; si no hay coincidencia o solo hay gruesas
+    (p.ej. avenidas largas de un extracto OSM) decide el fallback.
+
+    Excepción: si el mejor lugar es una colonia y el texto además nombra una
+    calle, se consulta primero el fallback (resultado a nivel de calle) y el
+    centroide de la colonia solo se usa si el fallback no encuentra nada.
+    Si el texto nombra otra ciudad o estado ("Colonia del Valle, CDMX"), el
+    gazetteer no aplica y decide el fallback.
+    """
+
+    def __init__(
+        self,
+        places: Iterable[Place] = GAZETTEER,
+        fallback: Optional[GeocodingService] = None,
+        max_extent_km: float = 1.5,
+        other_regions: Iterable[str] = OTHER_REGIONS,
+    ) -> None:
+        self._fallback = fallback
+        self._max_extent_km = max_extent_km
+        self._places: dict[str, Place] = {}
+        for place in places:
+            key = canonical(place.name)
+            if key:
+                self._places[key] = place
+        self._regex = re.compile(rf"\b({trie_regex(sorted(self._places))})\b")
+        # "Carretera a Saltillo", "Autopista Monterrey-Saltillo" son vías de NL,
+        # no una mención de otra ciudad
+        elsewhere = sorted({canonical(name) for name in other_regions} - {""})
+        self._elsewhere = (
+            re.compile(rf"{_NOT_A_ROAD}\b(?:{trie_regex(elsewhere)})\b") if elsewhere else None
+        )
+
+    @classmethod
+    def load_tsv(cls, path: str, **kwargs) -> "GazetteerGeocoder":
+        """
+        Built-in gazetteer extended with a TSV extract (nombre, lat, lon, tipo, extensión_km).
+
+        Líneas vacías o que empiezan con '#' se ignoran; una fila mal formada
+        se omite sin abortar la carga. Las filas del TSV pisan las integradas.
+        """
+        places = list(GAZETTEER)
+        skipped = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip() or line.startswith("#"):
+                    continue
+                try:
+                    name, lat, lon, kind, extent = line.rstrip("\n").split("\t")[:5]
+                    places.append(Place(name, float(lat), float(lon), kind, float(extent)))
+                except ValueError:
+                    skipped += 1
+        if skipped:
+            print(f"  ⚠️ Gazetteer: {skipped} filas inválidas omitidas en {path}")
+        return cls(places, **kwargs)
+
+    def lookup(self, location_text: str) -> Optional[Place]:
+        """Most precise gazetteer place mentioned in the text, if any."""
+        match = self._best(canonical(location_text))
+        return match[0] if match else None
+
+    def geocode(self, location_text: str) -> Optional[tuple[float, float]]:
+        text = canonical(location_text)
+        match = self._best(text)
+        if match and match[0].extent_km <= self._max_extent_km:
+            place, start, end = match
+            if place.kind == "colonia" and self._fallback and _STREET.search(text[:start] + " " + text[end:]):
+                coords = self._fallback.geocode(location_text)
+                if coords:
+                    return coords
+            print(f"  ✓ Gazetteer: '{place.name}' ({place.lat:.4f}, {place.lon:.4f})")
+            return (place.lat, place.lon)
+
+        if self._fallback:
+            return self._fallback.geocode(location_text)
+        return None
+
+    def _best(self, text: str) -> Optional[tuple[Place, int, int]]:
+        """(place, start, end) of the most precise place; None if the text names another region."""
+        if self._elsewhere and self._elsewhere.search(text):
+            return None
+        best: Optional[tuple[float, int, Place, int]] = None
+        for m in self._regex.finditer(text):
+            place = self._places[m.group(1)]
+            if best is None or (place.extent_km, m.start()) < best[:2]:
+                best = (place.extent_km, m.start(), place, m.end())
+        return (best[2], best[1], best[3]) if best else None
+
+
+class CachedGeocoder(GeocodingService):
+    """
+    Persistent cache in front of another geocoder (normally Nominatim).
+
+    La clave es el texto canónico de la ubicación (sin acentos, abreviaturas
+    expandidas), así "Av. Lázaro Cárdenas" y "avenida lazaro cardenas"
+    comparten entrada. Se cachean también los negativos (sin resultado), con
+    un TTL más corto; un resultado obtenido tras un error de red NO se cachea.
+    """
+
+    def __init__(
+        self,
+        inner: GeocodingService,
+        cache: KeyValueCache,
+        ttl_secs: float = 30 * 86400,
+        negative_ttl_secs: float = 86400,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._ttl_secs = ttl_secs
+        self._negative_ttl_secs = negative_ttl_secs
+
+    def geocode(self, location_text: str) -> Optional[tuple[float, float]]:
+        key = canonical(location_text)
+        if not key:
+            return self._inner.geocode(location_text)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            coords = cached.get("coords")
+            if coords:
+                print(f"  ✓ Geocodificación (caché): ({coords[0]:.6f}, {coords[1]:.6f})")
+                return (coords[0], coords[1])
+            return None
+
+        coords = self._inner.geocode(location_text)
+        if getattr(self._inner, "last_lookup_errored", False):
+            return coords
+
+        if coords:
+            self._cache.set(key, {"coords": [coords[0], coords[1]]}, self._ttl_secs)
+        else:
+            self._cache.set(key, {"coords": None}, self._negative_ttl_secs)
+        return coords
+
+
 class GeoService:
     """
     High-level geolocation service for the monitoring pipeline.
@@ -88,10 +257,28 @@ class GeoService:
         geocoder: GeocodingService,
         locations: list[CostcoLocation],
         radius_km: float = 5.0,
+        incident_radius_km: float = 1.0,
+        incident_window_days: int = 7,
+        clock: Callable[[], float] = time.time,
     ) -> None:
         self._geocoder = geocoder
         self._locations = locations
         self._radius_km = radius_km
+        # Índices construidos una sola vez por servicio
+        self._roads = RoadIndex(locations)
+        self._proximity = ProximityEngine(locations)
+
+        # Incidentes recientes con coordenadas, para detectar zonas recurrentes
+        self._incident_radius_km = incident_radius_km
+        self._incident_window_secs = incident_window_days * 86400
+        self._incident_window_days = incident_window_days
+        self._clock = clock
+        self._incidents = SpatialIndex(cell_km=max(incident_radius_km, 0.25))
+        self._incidents_lock = threading.Lock()
+        self._last_prune = clock()
+        # Un match solo por vialidad sin geocodificar lleva las coordenadas de
+        # la tienda: no es la ubicación del evento y no entra al historial.
+        self._store_points = {loc.coords.as_tuple() for loc in locations}
 
     def check_proximity(
         self, location_text: str, full_text: str
@@ -133,42 +320,105 @@ class GeoService:
         """Check only road keywords, no geocoding. Used when AI extracts no location."""
         return self._check_roads(full_text, coords=None)
 
+    def stores_near(self, lat: float, lon: float, radius_km: float) -> list[tuple[CostcoLocation, float]]:
+        """Every store within radius_km of the point, as (store, km), in store order."""
+        hits = self._proximity.within_radius((lat, lon), radius_km)
+        return [(self._locations[idx], dist) for idx, dist in hits]
+
+    # ── Historial de incidentes ──────────────────────────────
+
+    def load_incidents(self, rows: Iterable[dict]) -> int:
+        """Seed the incident index (e.g. from NewsRepository.recent_incident_points)."""
+        loaded = 0
+        with self._incidents_lock:
+            for row in rows:
+                if not self._is_event_point(row["lat"], row["lon"]):
+                    continue
+                self._incidents.insert(
+                    row["id"], row["lat"], row["lon"], row["timestamp"],
+                    {"categoria": row.get("categoria", "")},
+                )
+                loaded += 1
+        return loaded
+
+    def record_incident(self, alert: Alert) -> None:
+        """Add a sent alert to the incident index (no-op without coordinates)."""
+        coords = alert.proximity.event_coords
+        if not coords or not self._is_event_point(coords.lat, coords.lon):
+            return
+        key = alert.news.url or alert.news.titulo
+        now = self._clock()
+        with self._incidents_lock:
+            self._incidents.insert(
+                key, coords.lat, coords.lon, now, {"categoria": alert.analysis.category.value}
+            )
+            # Expirar lo viejo de vez en cuando (no en cada inserción)
+            if now - self._last_prune > 3600:
+                self._incidents.prune(now - self._incident_window_secs)
+                self._last_prune = now
+
+    def nearby_incidents(
+        self,
+        lat: float,
+        lon: float,
+        radius_km: Optional[float] = None,
+        days: Optional[float] = None,
+    ) -> list[tuple[float, dict]]:
+        """(km, data) of recorded incidents within radius in the last `days`, closest first."""
+        radius = self._incident_radius_km if radius_km is None else radius_km
+        window = self._incident_window_secs if days is None else days * 86400
+        with self._incidents_lock:
+            hits = self._incidents.query_radius(lat, lon, radius, since=self._clock() - window)
+        return [(dist, point.data) for dist, point in hits]
+
+    def incident_history(self, alert: Alert) -> Optional[IncidentHistory]:
+        """Previous incidents near the alert's coordinates, or None if there are none."""
+        coords = alert.proximity.event_coords
+        if not coords or not self._is_event_point(coords.lat, coords.lon):
+            return None
+        hits = self.nearby_incidents(coords.lat, coords.lon)
+        if not hits:
+            return None
+        return IncidentHistory(
+            count=len(hits),
+            radius_km=self._incident_radius_km,
+            days=self._incident_window_days,
+            categories=[data.get("categoria", "") for _, data in hits],
+        )
+
     # ── Private ──────────────────────────────────────────────
 
+    def _is_event_point(self, lat: float, lon: float) -> bool:
+        """Real event coordinates (not the 0,0 placeholder nor a store's own point)."""
+        return (lat, lon) != (0, 0) and (lat, lon) not in self._store_points
+
     def _check_radius(self, coords: tuple[float, float]) -> ProximityResult:
         """Check if coords are within radius of any Costco."""
-        for loc in self._locations:
-            costco_coords = loc.coords.as_tuple()
-            dist = geodesic(coords, costco_coords).kilometers
-
-            if dist <= self._radius_km:
-                return ProximityResult(
-                    is_within_radius=True,
-                    costco_nombre=loc.nombre,
-                    costco_direccion=loc.direccion,
-                    distancia_km=round(dist, 2),
-                    event_coords=Coordinates(lat=coords[0], lon=coords[1]),
-                )
+        hit = self._proximity.first_within(coords, self._radius_km)
+        if hit:
+            idx, dist = hit
+            loc = self._locations[idx]
+            return ProximityResult(
+                is_within_radius=True,
+                costco_nombre=loc.nombre,
+                costco_direccion=loc.direccion,
+                distancia_km=round(dist, 2),
+                event_coords=Coordinates(lat=coords[0], lon=coords[1]),
+            )
 
         return self._find_nearest(coords)
 
     def _find_nearest(self, coords: tuple[float, float]) -> ProximityResult:
         """Find the nearest Costco (even if outside radius)."""
-        nearest = None
-        min_dist = float("inf")
-
-        for loc in self._locations:
-            dist = geodesic(coords, loc.coords.as_tuple()).kilometers
-            if dist < min_dist:
-                min_dist = dist
-                nearest = loc
-
+        nearest = self._proximity.nearest(coords, k=1)
         if nearest:
+            idx, dist = nearest[0]
+            loc = self._locations[idx]
             return ProximityResult(
                 is_within_radius=False,
-                costco_nombre=nearest.nombre,
-                costco_direccion=nearest.direccion,
-                distancia_km=round(min_dist, 2),
+                costco_nombre=loc.nombre,
+                costco_direccion=loc.direccion,
+                distancia_km=round(dist, 2),
             )
 
         return ProximityResult()
@@ -177,34 +427,31 @@ class GeoService:
         self, text: str, coords: Optional[tuple[float, float]]
     ) -> ProximityResult:
         """Check if text mentions key roads near any Costco."""
-        text_lower = text.lower()
-
-        for loc in self._locations:
-            for road in loc.vialidades_clave:
-                if road in text_lower:
-                    if coords:
-                        # Si ya tenemos coords geocodificadas y están lejos, la
-                        # mención de la vialidad es coincidencia (esas avenidas
-                        # existen en muchas ciudades) → NO es cercanía real.
-                        dist = geodesic(coords, loc.coords.as_tuple()).kilometers
-                        if dist > self._radius_km:
-                            continue
-                    else:
-                        dist = 0.5  # Sin coords: la mención de la vialidad es la única señal
-
-                    print(f"  ✓ Vialidad clave: '{road}' ({loc.nombre})")
-
-                    return ProximityResult(
-                        is_within_radius=True,
-                        costco_nombre=loc.nombre,
-                        costco_direccion=loc.direccion,
-                        distancia_km=round(dist, 2),
-                        event_coords=(
-                            Coordinates(lat=coords[0], lon=coords[1])
-                            if coords
-                            else loc.coords
-                        ),
-                        matched_via="vialidad",
-                    )
+        for loc_idx, road in self._roads.matches(text):
+            loc = self._locations[loc_idx]
+            if coords:
+                # Si ya tenemos coords geocodificadas y están lejos, la
+                # mención de la vialidad es coincidencia (esas avenidas
+                # existen en muchas ciudades) → NO es cercanía real.
+                dist = self._proximity.distance_km(coords, loc_idx)
+                if dist > self._radius_km:
+                    continue
+            else:
+                dist = 0.5  # Sin coords: la mención de la vialidad es la única señal
+
+            print(f"  ✓ Vialidad clave: '{road}' ({loc.nombre})")
+
+            return ProximityResult(
+                is_within_radius=True,
+                costco_nombre=loc.nombre,
+                costco_direccion=loc.direccion,
+                distancia_km=round(dist, 2),
+                event_coords=(
+                    Coordinates(lat=coords[0], lon=coords[1])
+                    if coords
+                    else loc.coords
+                ),
+                matched_via="vialidad",
+            )
 
         return ProximityResult()
@@ -0,0 +1,248 @@
+"""
+Near-duplicate clustering — one representative per story before triage.
+
+Google News reescribe titulares y varios medios cubren el mismo choque, así
+que el dedup exacto (URL, MD5 del título, primeros 80 caracteres) deja pasar
+la misma nota varias veces y cada copia paga triage y análisis profundo.
+
+Cada noticia se reduce al conjunto de palabras de título + inicio del
+snippet (sin acentos, sin palabras vacías, sin el sufijo " - Medio" de
+Google) y recibe una firma MinHash. Dos notas con similitud de Jaccard >=
+threshold son la misma historia.
+
+Para no comparar todos contra todos se usa LSH por bandas: la firma se parte
+en bandas y solo se comparan las notas que coinciden en alguna banda
+completa; el candidato se confirma con el Jaccard exacto de los conjuntos.
+
+Los clusters se forman de forma voraz en el orden del lote: una nota se une
+al primer representativo similar o abre su propio cluster. Comparar solo
+contra representativos evita el encadenamiento (A~B, B~C, pero A≁C).
+
+Memoria entre ciclos: el agrupado por lote no ve la reescritura de una
+historia que llega uno o varios ciclos después. El pipeline recuerda
+(remember) los representativos que el triage descartó en un índice LSH
+acotado — TTL corto (horas, como la ventana del filtro de tiempo) y tope de
+entradas, persistido a JSON si hay state_path — y recent_match() dice si una
+nota nueva es una historia descartada hace poco. Con un TTL largo, una
+publicación con plantilla ("Incendio en pastizal en ...") días después
+quedaría suprimida aunque sea un incidente nuevo.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+import time
+from typing import Callable
+
+from app.domain.models import NewsItem
+from app.domain.text import normalize
+
+_PRIME = (1 << 61) - 1  # primo de Mersenne para las permutaciones universales
+_NUM_PERM = 64
+_ROWS_PER_BAND = 4  # 16 bandas × 4 filas: candidato desde Jaccard ≈ 0.5
+
+# Sufijo de medio que agrega Google News: "Choque en Fundadores - Milenio"
+_SOURCE_SUFFIX = re.compile(r"\s+[-–|]\s+[^-–|]{1,40}$")
+_WORD = re.compile(r"[a-z0-9ñ]+")
+_SNIPPET_WORDS = 30
+
+# Palabras vacías frecuentes en titulares; no distinguen una historia de otra
+_STOPWORDS = frozenset(
+    "a al con de del el en la las lo los para por que se su sus un una y o e "
+    "tras sobre entre ante es son fue".split()
+)
+
+# Permutaciones fijas (semilla constante): la misma nota da la misma firma
+# en todos los procesos.
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(_NUM_PERM)
+]
+
+
+def shingles(item: NewsItem) -> frozenset[str]:
+    """Normalized word set of title (without outlet suffix) + start of the snippet."""
+    titulo = _SOURCE_SUFFIX.sub("", item.titulo)
+    snippet = _WORD.findall(normalize(item.contenido))[:_SNIPPET_WORDS]
+    words = _WORD.findall(normalize(titulo)) + snippet
+    return frozenset(w for w in words if w not in _STOPWORDS)
+
+
+def minhash(features: frozenset[str]) -> tuple[int, ...]:
+    """MinHash signature (_NUM_PERM values). Empty set → all-max signature."""
+    if not features:
+        return (_PRIME,) * _NUM_PERM
+    hashes = [
+        int.from_bytes(hashlib.blake2b(f.encode(), digest_size=8).digest(), "big")
+        for f in features
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def band_keys(signature: tuple[int, ...]) -> list[tuple[int, int]]:
+    """(banda, hash de sus filas): claves LSH compactas, estables entre procesos."""
+    keys = []
+    for band, start in enumerate(range(0, _NUM_PERM, _ROWS_PER_BAND)):
+        rows = signature[start:start + _ROWS_PER_BAND]
+        digest = hashlib.blake2b(
+            b"".join(r.to_bytes(8, "big") for r in rows), digest_size=8
+        ).digest()
+        keys.append((band, int.from_bytes(digest, "big")))
+    return keys
+
+
+class NearDuplicateClusterer:
+    """Groups near-identical news items (rewritten headlines, syndicated copies)."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        state_path: str | None = None,
+        memory_ttl_secs: float = 6 * 3600,
+        memory_size: int = 2000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._threshold = threshold
+        self._state_path = state_path
+        self._memory_ttl = memory_ttl_secs
+        self._memory_size = memory_size
+        self._clock = clock
+        # Representativos descartados por el triage, del más viejo al más nuevo:
+        # {"t": epoch, "titulo": str, "f": [palabras], "b": [hash por banda]}
+        self._memory: list[dict] = []
+        # (banda, hash) → posiciones en _memory
+        self._memory_buckets: dict[tuple[int, int], list[int]] = {}
+        if state_path:
+            self._load()
+
+    def cluster(self, news: list[NewsItem]) -> list[list[NewsItem]]:
+        """
+        Partition the batch into clusters, in batch order.
+
+        Cada cluster es una lista cuyo primer elemento es el representativo
+        (la primera noticia del lote que abrió el cluster).
+        """
+        clusters: list[list[NewsItem]] = []
+        rep_features: list[frozenset[str]] = []
+        # (banda, filas de la firma) → índices de clusters cuyo representativo la tiene
+        buckets: dict[tuple, list[int]] = {}
+
+        for item in news:
+            features = shingles(item)
+            signature = minhash(features)
+            keys = [
+                (band, signature[start:start + _ROWS_PER_BAND])
+                for band, start in enumerate(range(0, _NUM_PERM, _ROWS_PER_BAND))
+            ]
+
+            match = self._first_similar(features, keys, buckets, rep_features)
+            if match is not None:
+                clusters[match].append(item)
+                continue
+
+            idx = len(clusters)
+            clusters.append([item])
+            rep_features.append(features)
+            if features:
+                for key in keys:
+                    buckets.setdefault(key, []).append(idx)
+
+        return clusters
+
+    def recent_match(self, item: NewsItem) -> str | None:
+        """Title of a remembered (non-expired) story the item duplicates, or None."""
+        features = shingles(item)
+        if not features or not self._memory:
+            return None
+        cutoff = self._clock() - self._memory_ttl
+        candidates = sorted({
+            pos for key in band_keys(minhash(features))
+            for pos in self._memory_buckets.get(key, ())
+        })
+        for pos in candidates:
+            entry = self._memory[pos]
+            if entry["t"] >= cutoff and jaccard(features, frozenset(entry["f"])) >= self._threshold:
+                return entry["titulo"]
+        return None
+
+    def remember(self, items: list[NewsItem]) -> None:
+        """Add triage-discarded representatives to the memory; expire, cap and persist it."""
+        now = self._clock()
+        for item in items:
+            features = shingles(item)
+            if features:
+                self._memory.append({
+                    "t": now,
+                    "titulo": item.titulo,
+                    "f": sorted(features),
+                    "b": [h for _, h in band_keys(minhash(features))],
+                })
+        self._prune()
+        if self._state_path:
+            self.save()
+
+    def save(self) -> None:
+        """Snapshot the memory to state_path (atomic replace; errors are logged, not raised)."""
+        if not self._state_path:
+            return
+        tmp_path = f"{self._state_path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"memory": self._memory}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._state_path)
+        except OSError as e:
+            print(f"  ⚠️ No se pudo guardar la memoria de casi-duplicados: {e}")
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _prune(self) -> None:
+        """Drop expired entries and keep the newest memory_size; rebuild the buckets."""
+        cutoff = self._clock() - self._memory_ttl
+        fresh = [entry for entry in self._memory if entry["t"] >= cutoff]
+        self._memory = fresh[-self._memory_size:] if self._memory_size > 0 else []
+        self._memory_buckets = {}
+        for pos, entry in enumerate(self._memory):
+            for band, h in enumerate(entry["b"]):
+                self._memory_buckets.setdefault((band, h), []).append(pos)
+
+    def _load(self) -> None:
+        """Restore a snapshot written by save(). Missing/corrupt file → empty memory."""
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            memory = [
+                {"t": float(e["t"]), "titulo": str(e["titulo"]),
+                 "f": [str(w) for w in e["f"]], "b": [int(h) for h in e["b"]]}
+                for e in state.get("memory", [])
+            ]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            print(f"  ⚠️ Memoria de casi-duplicados ilegible, se empieza de cero: {e}")
+            return
+        self._memory = memory
+        self._prune()
+
+    def _first_similar(
+        self,
+        features: frozenset[str],
+        keys: list[tuple],
+        buckets: dict[tuple, list[int]],
+        rep_features: list[frozenset[str]],
+    ) -> int | None:
+        """Earliest cluster whose representative reaches the threshold, if any."""
+        candidates = sorted({idx for key in keys for idx in buckets.get(key, ())})
+        for idx in candidates:
+            if jaccard(features, rep_features[idx]) >= self._threshold:
+                return idx
+        return None
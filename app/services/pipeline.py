@@ -9,25 +9,37 @@ All dependencies are injected through the constructor.
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
 
 import pytz
 
 from app.config.keywords import check_high_impact
-from app.domain.models import NewsItem
-from app.domain.ports import DeepReader, DuplicateChecker, NewsRepository, NewsSource, Notifier
+from app.domain.models import NewsItem, TriageResult
+from app.domain.ports import (
+    AIUnavailableError,
+    DeepReader,
+    DuplicateChecker,
+    NewsRepository,
+    NewsSource,
+    Notifier,
+)
 from app.services.content_hasher import ContentHasher
 from app.services.deep_analysis import DeepAnalysisService
+from app.services.geo_service import GeoService
+from app.services.near_dedup import NearDuplicateClusterer
 from app.services.triage import TriageService
 
 CENTRAL_TZ = pytz.timezone("America/Chicago")
+_COLLECT_MARGIN_SECS = 1.0
 
 
 class MonitoringPipeline:
     """
     Orchestrates the full monitoring cycle:
 
-    Collect → Hash check → Time filter → Dedup → Triage IA → Deep analysis → Notify
+    Collect → Change delta → Time filter → Dedup → Near-dup clusters → Triage IA → Deep analysis → Notify
     """
 
     def __init__(
@@ -40,6 +52,11 @@ class MonitoringPipeline:
         file_storage: DuplicateChecker,
         hasher: ContentHasher,
         max_age_hours: int = 1,
+        collect_timeout_secs: float = 60.0,
+        near_dedup: NearDuplicateClusterer | None = None,
+        geo: GeoService | None = None,
+        deep_workers: int = 1,
+        max_retry_attempts: int = 3,
     ) -> None:
         self._sources = sources
         self._triage = triage
@@ -49,6 +66,13 @@ class MonitoringPipeline:
         self._storage = file_storage
         self._hasher = hasher
         self._max_age_hours = max_age_hours
+        self._collect_timeout_secs = collect_timeout_secs
+        self._near_dedup = near_dedup
+        self._geo = geo
+        self._deep_workers = deep_workers
+        # Reintentos por URL de candidatas cuyo análisis o envío falló
+        self._max_retry_attempts = max_retry_attempts
+        self._retry_attempts: dict[str, int] = {}
 
     def run_once(self) -> dict:
         """
@@ -71,17 +95,28 @@ class MonitoringPipeline:
             print("  ⚠️ No se obtuvieron noticias")
             return self._stats(0, 0, 0, 0)
 
-        # ── STEP 2: Hash check (0 tokens) ──
-        print(f"\n🔗 PASO 2: Verificando cambios (hash)...")
-        if not self._hasher.has_changed(all_news):
+        # ── STEP 2: Change detection per item (0 tokens) ──
+        print(f"\n🔗 PASO 2: Verificando cambios (huella por noticia)...")
+        changed = self._hasher.changed_items(all_news)
+        if not changed:
             n = self._hasher.consecutive_no_change
             print(f"  ⚡ Sin cambios ({n}x consecutivo) — 0 tokens consumidos")
+            self._hasher.commit()
             return self._stats(len(all_news), 0, 0, 0)
+        print(f"  → {len(changed)} noticias nuevas o modificadas de {len(all_news)}")
 
+        stats = self._process(all_news, changed)
+        # Solo se confirman las huellas si el ciclo terminó: si algo revienta
+        # antes, el delta vuelve a procesarse en el siguiente ciclo.
+        self._hasher.commit()
+        return stats
+
+    def _process(self, all_news: list[NewsItem], changed: list[NewsItem]) -> dict:
+        """Steps 3-6 over the delta reported by the change tracker."""
         # ── STEP 3: Time filter (0 tokens) ──
         print(f"\n⏰ PASO 3: Filtrando por tiempo ({self._max_age_hours}h)...")
-        recent = self._filter_by_time(all_news)
-        print(f"  → {len(recent)} noticias recientes de {len(all_news)} totales")
+        recent = self._filter_by_time(changed)
+        print(f"  → {len(recent)} noticias recientes de {len(changed)} nuevas/modificadas")
 
         if not recent:
             print("  ℹ️ No hay noticias recientes")
@@ -107,67 +142,157 @@ class MonitoringPipeline:
         if keyword_hits > 0:
             print(f"\n🔑 {keyword_hits}/{len(new_news)} noticias con keywords de alto impacto")
 
+        # ── STEP 4.7: Near-duplicate clustering (0 tokens) ──
+        # Solo un representativo por historia va a la IA; sus copias
+        # (titulares reescritos, otros medios) corren su misma suerte.
+        representatives, copies = self._cluster(new_news)
+        # Historias que el triage descartó hace poco (otro medio, horas después)
+        # corren la suerte de la original: se marcan sin volver a la IA. Lo
+        # que fue candidata nunca se recuerda: una publicación con el mismo
+        # texto días después puede ser un incidente nuevo.
+        representatives, known = self._split_known(representatives)
+
         # ── STEP 5: AI Triage (batch) ──
-        print(f"\n🤖 PASO 5: Triage IA (batch de {len(new_news)} noticias)...")
-        candidates = self._triage.triage(new_news)
+        print(f"\n🤖 PASO 5: Triage IA (batch de {len(representatives)} noticias)...")
+        candidates = self._triage.triage(representatives) if representatives else []
         print(f"  → {len(candidates)} candidatas identificadas")
+        # Contadores de reintento solo de las candidatas vigentes: las que
+        # salieron de los feeds (o ya no son candidatas) no vuelven
+        current = {item.url or item.titulo for item, _ in candidates}
+        self._retry_attempts = {k: n for k, n in self._retry_attempts.items() if k in current}
+
+        # Las URLs a marcar se acumulan y se escriben en un solo flush al final
+        # del ciclo (un open + fsync en vez de uno por noticia). El finally
+        # conserva lo ya decidido aunque el paso 6 reviente a la mitad.
+        to_mark: list[str] = [url for item in known for url in self._urls(item, copies)]
+        try:
+            # Noticias que el triage descartó (no candidatas) → también marcar:
+            # sin esto se re-triagean (re-pagan IA) cada ciclo mientras sigan en los feeds.
+            candidate_ids = {id(n) for n, _ in candidates}
+            discarded = [item for item in representatives if id(item) not in candidate_ids]
+            for item in discarded:
+                to_mark.extend(self._urls(item, copies))
+            if self._near_dedup and discarded:
+                self._near_dedup.remember(discarded)
+
+            if not candidates:
+                print("  ℹ️ Sin candidatas relevantes")
+                return self._stats(len(all_news), len(recent), len(new_news), 0)
+
+            alerts_sent = self._analyze_and_notify(candidates, copies, to_mark)
+        finally:
+            if to_mark:
+                self._storage.mark_processed_many(to_mark)
 
-        if not candidates:
-            print("  ℹ️ Sin candidatas relevantes")
-            return self._stats(len(all_news), len(recent), len(new_news), 0)
+        return self._stats(len(all_news), len(recent), len(new_news), alerts_sent)
 
-        # ── STEP 6: Deep analysis + geo + notify ──
+    def _analyze_and_notify(
+        self,
+        candidates: list[tuple[NewsItem, TriageResult]],
+        copies: dict[int, list[NewsItem]],
+        to_mark: list[str],
+    ) -> int:
+        """
+        Step 6: deep analysis + geo + notify. Appends the URLs to mark to to_mark.
+
+        Las candidatas se analizan en un pool acotado (deep_workers); cada
+        alerta se notifica en este hilo apenas termina su análisis, sin
+        esperar a las demás. Una candidata con un fallo pasajero (envío
+        fallido, o AIUnavailableError: la llamada al provider falló) no se
+        marca y se saca del delta: vuelve en el siguiente ciclo, hasta
+        max_retry_attempts veces. Cualquier otro error del análisis no se
+        reintenta.
+        """
         print(f"\n🔬 PASO 6: Análisis profundo ({len(candidates)} candidatas)...")
         alerts_sent = 0
 
-        candidate_ids = {id(n) for n, _ in candidates}
+        workers = max(1, min(self._deep_workers, len(candidates)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="deep") as pool:
+            futures = {
+                pool.submit(self._deep.analyze, news_item, triage): news_item
+                for news_item, triage in candidates
+            }
+            for future in as_completed(futures):
+                news_item = futures[future]
+                try:
+                    alert = future.result()
+                except Exception as e:
+                    print(f"     ⚠️ Error analizando '{news_item.titulo[:60]}': {e}")
+                    if isinstance(e, AIUnavailableError):
+                        to_mark.extend(self._retry_next_cycle(news_item, copies))
+                    else:
+                        print("     ✗ No se reintenta")
+                        to_mark.extend(self._decided(news_item, copies))
+                    continue
 
-        for news_item, triage in candidates:
-            alert = self._deep.analyze(news_item, triage)
+                if alert:
+                    # Enriquecer con incidentes previos en la misma zona
+                    if self._geo:
+                        alert.history = self._geo.incident_history(alert)
 
-            if alert:
-                # Notify — si falla, NO marcar procesada para reintentar el próximo ciclo
-                sent = self._notifier.send_alert(alert)
+                    # Notify — si falla, NO marcar procesada para reintentar el próximo ciclo
+                    sent = self._notifier.send_alert(alert)
 
-                if sent:
-                    print("     📱 Alerta enviada")
+                    if sent:
+                        print("     📱 Alerta enviada")
 
-                    # Persist
-                    if self._repo:
-                        self._repo.save_incident(alert)
+                        # Persist
+                        if self._repo:
+                            self._repo.save_incident(alert)
+                        if self._geo:
+                            self._geo.record_incident(alert)
 
-                    if news_item.url:
-                        self._storage.mark_processed(news_item.url)
-                    alerts_sent += 1
+                        to_mark.extend(self._decided(news_item, copies))
+                        alerts_sent += 1
+                    else:
+                        print("     ⚠️ Falló el envío")
+                        to_mark.extend(self._retry_next_cycle(news_item, copies))
                 else:
-                    print("     ⚠️ Falló el envío — se reintentará en el próximo ciclo")
-            else:
-                # Descartada por análisis profundo/geo → marcar para no re-pagar IA cada ciclo
-                if news_item.url:
-                    self._storage.mark_processed(news_item.url)
-
-        # Noticias que el triage descartó (no candidatas) → también marcar:
-        # sin esto se re-triagean (re-pagan IA) cada ciclo mientras sigan en los feeds.
-        for item in new_news:
-            if id(item) not in candidate_ids and item.url:
-                self._storage.mark_processed(item.url)
+                    # Descartada por análisis profundo/geo → marcar para no re-pagar IA cada ciclo
+                    to_mark.extend(self._decided(news_item, copies))
 
-        return self._stats(len(all_news), len(recent), len(new_news), alerts_sent)
+        return alerts_sent
 
     # ── Private helpers ──────────────────────────────────────
 
     def _collect(self) -> list[NewsItem]:
-        """Collect from all sources."""
+        """
+        Collect from all sources concurrently, bounded by a cycle deadline.
+
+        Cada fuente corre en su propio hilo (y cada una paraleliza sus propios
+        requests), así que el paso 1 dura lo que el request más lento y no la
+        suma de todos. El deadline se pasa a cada fuente, que devuelve lo que
+        sus requests alcanzaron a traer (un margen antes del plazo global);
+        una fuente que aun así no responde antes de collect_timeout_secs se
+        omite en este ciclo. Los errores siguen aislados por fuente.
+        """
         all_items: list[NewsItem] = []
-
-        for source in self._sources:
+        if not self._sources:
+            return all_items
+
+        timeout = self._collect_timeout_secs
+        # Margen para que las fuentes entreguen sus parciales antes del wait
+        source_deadline = time.monotonic() + timeout - min(_COLLECT_MARGIN_SECS, timeout / 10)
+        pool = ThreadPoolExecutor(max_workers=len(self._sources), thread_name_prefix="collect")
+        futures = {pool.submit(source.collect, source_deadline): source for source in self._sources}
+        _, pending = wait(futures, timeout=timeout)
+        # No esperar a las rezagadas: sus hilos terminan solos (cada request
+        # tiene su propio timeout) y sus resultados se descartan.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+        # Se recorre en el orden de las fuentes (no de llegada) para que el
+        # lote sea determinista entre ciclos.
+        for future, source in futures.items():
+            name = source.source_name()
+            if future in pending:
+                print(f"  ⏱️ {name}: sin respuesta en {self._collect_timeout_secs:.0f}s — omitida este ciclo")
+                continue
             try:
-                print(f"  📡 {source.source_name()}...")
-                items = source.collect()
-                print(f"    → {len(items)} noticias")
+                items = future.result()
+                print(f"  📡 {name} → {len(items)} noticias")
                 all_items.extend(items)
             except Exception as e:
-                print(f"    ⚠️ Error: {e}")
+                print(f"  ⚠️ {name} error: {e}")
 
         return all_items
 
@@ -191,21 +316,82 @@ class MonitoringPipeline:
 
     def _filter_duplicates(self, news: list[NewsItem]) -> list[NewsItem]:
         """Remove already-processed and DB-duplicate articles."""
-        new_items: list[NewsItem] = []
+        # Check file-based dedup
+        new_items = [
+            item for item in news
+            if not (item.url and self._storage.is_processed(item.url))
+        ]
 
-        for item in news:
-            # Check file-based dedup
-            if item.url and self._storage.is_processed(item.url):
-                continue
+        # Check DB dedup — un solo round trip para todo el lote
+        if self._repo and new_items:
+            duplicates = self._repo.find_duplicates(new_items)
+            new_items = [item for i, item in enumerate(new_items) if i not in duplicates]
 
-            # Check DB dedup
-            if self._repo:
-                if self._repo.is_duplicate(item.titulo, item.url or "", item.fuente):
-                    continue
+        return new_items
 
-            new_items.append(item)
+    def _cluster(self, news: list[NewsItem]) -> tuple[list[NewsItem], dict[int, list[NewsItem]]]:
+        """Representatives to triage + copies per representative (keyed by id())."""
+        if not self._near_dedup:
+            return news, {}
+
+        representatives: list[NewsItem] = []
+        copies: dict[int, list[NewsItem]] = {}
+        for cluster in self._near_dedup.cluster(news):
+            rep, rest = cluster[0], cluster[1:]
+            representatives.append(rep)
+            if rest:
+                copies[id(rep)] = rest
+                # La pista de keywords de cualquier copia vale para la historia
+                if not rep.keyword_hint:
+                    rep.keyword_hint = next((c.keyword_hint for c in rest if c.keyword_hint), None)
+
+        if copies:
+            merged = len(news) - len(representatives)
+            print(f"\n🧬 {merged} copias casi idénticas agrupadas → {len(representatives)} historias")
+        return representatives, copies
+
+    def _split_known(self, representatives: list[NewsItem]) -> tuple[list[NewsItem], list[NewsItem]]:
+        """(stories to triage, stories triage recently discarded per the near-dup memory)."""
+        if not self._near_dedup:
+            return representatives, []
+        fresh: list[NewsItem] = []
+        known: list[NewsItem] = []
+        for rep in representatives:
+            (known if self._near_dedup.recent_match(rep) else fresh).append(rep)
+        if known:
+            print(f"\n🧬 {len(known)} historias ya descartadas en ciclos recientes — sin triage")
+        return fresh, known
+
+    def _retry_next_cycle(self, item: NewsItem, copies: dict[int, list[NewsItem]]) -> list[str]:
+        """
+        Sacarla (con sus copias) del delta confirmado: si no, el tracker de
+        cambios ya no la reportaría en el siguiente ciclo.
 
-        return new_items
+        Cuenta los intentos por URL; agotados, se da por perdida y devuelve
+        sus URLs para marcar (si no, un envío que nunca pasa se re-analiza y
+        re-paga IA cada ciclo). Devuelve [] si se reintentará.
+        """
+        key = item.url or item.titulo
+        attempts = self._retry_attempts.get(key, 0) + 1
+        if attempts >= self._max_retry_attempts:
+            print(f"     ✗ {attempts} intentos fallidos — se descarta")
+            return self._decided(item, copies)
+
+        self._retry_attempts[key] = attempts
+        print(f"     ↻ Se reintentará en el próximo ciclo (intento {attempts}/{self._max_retry_attempts})")
+        for news_item in [item, *copies.get(id(item), ())]:
+            self._hasher.forget(news_item)
+        return []
+
+    def _decided(self, item: NewsItem, copies: dict[int, list[NewsItem]]) -> list[str]:
+        """URLs to mark for a candidate whose fate is final; drops its retry counter."""
+        self._retry_attempts.pop(item.url or item.titulo, None)
+        return self._urls(item, copies)
+
+    @staticmethod
+    def _urls(item: NewsItem, copies: dict[int, list[NewsItem]]) -> list[str]:
+        """URLs of an item and its near-duplicate copies (they share its fate)."""
+        return [n.url for n in [item, *copies.get(id(item), ())] if n.url]
 
     @staticmethod
     def _stats(collected: int, recent: int, new: int, alerts: int) -> dict:
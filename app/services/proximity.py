@@ -0,0 +1,120 @@
+"""
+Proximity engine — vectorized distance queries against every store.
+
+Antes _check_radius y _find_nearest llamaban geopy.geodesic en un loop de
+Python por tienda: bien para 2 Costcos, caro para todas las de México.
+
+Las coordenadas de las tiendas viven en arreglos de NumPy y la distancia a
+todas se calcula de una vez con haversine (esfera). Haversine difiere de la
+geodésica WGS84 a lo más ~0.5 %, así que en las consultas por radio solo las
+tiendas cuya distancia esférica cae en esa franja alrededor del radio se
+recalculan con geodesic; las que quedan bien adentro se aceptan con su
+distancia haversine (error ≤ 0.5 %: unas decenas de metros en un radio de
+5 km). nearest() sí reporta siempre la geodésica.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import numpy as np
+from geopy.distance import geodesic
+
+from app.domain.models import CostcoLocation
+
+_EARTH_RADIUS_KM = 6371.0088
+# Cota del error relativo haversine vs. geodésica (WGS84) + holgura absoluta
+_REL_TOLERANCE = 0.006
+_ABS_TOLERANCE_KM = 0.01
+
+
+class ProximityEngine:
+    """Within-radius and nearest-k queries over a fixed set of store locations."""
+
+    def __init__(self, locations: list[CostcoLocation]) -> None:
+        self._points = [loc.coords.as_tuple() for loc in locations]
+        coords = np.radians(np.array(self._points, dtype=float).reshape(-1, 2))
+        self._lat = coords[:, 0]
+        self._lon = coords[:, 1]
+        self._cos_lat = np.cos(self._lat)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def haversine_km(self, points: np.ndarray | list[tuple[float, float]]) -> np.ndarray:
+        """Spherical distance matrix (len(points) × stores), in km."""
+        pts = np.radians(np.asarray(points, dtype=float).reshape(-1, 2))
+        lat = pts[:, 0:1]
+        lon = pts[:, 1:2]
+        a = (
+            np.sin((self._lat - lat) / 2) ** 2
+            + np.cos(lat) * self._cos_lat * np.sin((self._lon - lon) / 2) ** 2
+        )
+        return 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    def distance_km(self, point: tuple[float, float], index: int) -> float:
+        """Exact geodesic distance from point to one store."""
+        return geodesic(point, self._points[index]).kilometers
+
+    def within_radius(self, point: tuple[float, float], radius_km: float) -> list[tuple[int, float]]:
+        """(store index, km) of every store within radius, in store order."""
+        return self.within_radius_batch([point], radius_km)[0]
+
+    def within_radius_batch(
+        self, points: list[tuple[float, float]], radius_km: float
+    ) -> list[list[tuple[int, float]]]:
+        if not points:
+            return []
+        if not self._points:
+            return [[] for _ in points]
+
+        approx = self.haversine_km(points)
+        return [list(self._hits(row, point, radius_km)) for row, point in zip(approx, points)]
+
+    def first_within(self, point: tuple[float, float], radius_km: float) -> tuple[int, float] | None:
+        """First store (in configuration order) within radius — same rule as the old loop."""
+        if not self._points:
+            return None
+        return next(self._hits(self.haversine_km([point])[0], point, radius_km), None)
+
+    def _hits(
+        self, row: np.ndarray, point: tuple[float, float], radius_km: float
+    ) -> Iterator[tuple[int, float]]:
+        """Stores within radius in store order; geodesic only for the edge band."""
+        margin = radius_km * _REL_TOLERANCE + _ABS_TOLERANCE_KM
+        for idx in np.flatnonzero(row <= radius_km + margin):
+            approx = float(row[idx])
+            if approx <= radius_km - margin:
+                yield int(idx), approx  # bien adentro: haversine basta
+                continue
+            dist = self.distance_km(point, int(idx))
+            if dist <= radius_km:
+                yield int(idx), dist
+
+    def nearest(self, point: tuple[float, float], k: int = 1) -> list[tuple[int, float]]:
+        """The k nearest stores as (index, geodesic km), closest first."""
+        return self.nearest_batch([point], k)[0]
+
+    def nearest_batch(
+        self, points: list[tuple[float, float]], k: int = 1
+    ) -> list[list[tuple[int, float]]]:
+        if not points:
+            return []
+        n = len(self._points)
+        k = min(k, n)
+        if k <= 0:
+            return [[] for _ in points]
+
+        approx = self.haversine_km(points)
+        results: list[list[tuple[int, float]]] = []
+        for row, point in zip(approx, points):
+            # La k-ésima distancia esférica acota qué tiendas pueden estar entre
+            # las k más cercanas una vez corregidas a geodésica.
+            kth = np.partition(row, k - 1)[k - 1]
+            bound = kth * (1 + 2 * _REL_TOLERANCE) + _ABS_TOLERANCE_KM
+            candidates = np.flatnonzero(row <= bound)
+            exact = sorted(
+                ((self.distance_km(point, int(idx)), int(idx)) for idx in candidates),
+            )
+            results.append([(idx, dist) for dist, idx in exact[:k]])
+        return results
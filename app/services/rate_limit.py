@@ -0,0 +1,37 @@
+"""
+Rate limiter — minimum spacing between calls, shared by all threads.
+
+Nominatim exige como máximo 1 request por segundo por cliente. Con el
+análisis profundo en paralelo varias candidatas geocodifican a la vez, así
+que el límite se aplica en un solo punto: cada llamada espera su turno.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Blocks so that consecutive acquire() calls are at least min_interval_secs apart."""
+
+    def __init__(
+        self,
+        min_interval_secs: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._interval = min_interval_secs
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        # El lock se mantiene durante la espera: los turnos se asignan en orden
+        with self._lock:
+            delay = self._next_slot - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+            self._next_slot = self._clock() + self._interval
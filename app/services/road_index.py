@@ -0,0 +1,94 @@
+"""
+Road index — key-road aliases of every store, compiled into one matcher.
+
+Antes _check_roads recorría cada tienda y cada vialidad haciendo búsqueda de
+subcadena sobre el texto completo: costo tiendas × vialidades × texto por
+candidata. El índice se construye una vez (al crear GeoService) y resuelve
+todas las menciones en una sola pasada de regex.
+
+Texto y alias pasan por la misma canonicalización: sin acentos, puntuación
+→ espacios y abreviaturas expandidas ("Av." → "avenida", "Carr." →
+"carretera", "Prol." → "prolongacion"), así "av. fundadores" y "Avenida
+Fundadores" son el mismo alias. Las coincidencias respetan límites de
+palabra: "leones" ya no se dispara con "Leonesa".
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from app.domain.models import CostcoLocation
+from app.domain.text import normalize, trie_regex
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+# Abreviaturas habituales en notas locales → forma canónica
+_ABBREVIATIONS: dict[str, str] = {
+    "av": "avenida",
+    "ave": "avenida",
+    "avda": "avenida",
+    "carr": "carretera",
+    "ctra": "carretera",
+    "prol": "prolongacion",
+    "blvd": "bulevar",
+    "blvr": "bulevar",
+    "boulevard": "bulevar",
+    "calz": "calzada",
+    "gral": "general",
+    "col": "colonia",
+    "kilometro": "km",
+}
+
+
+def canonical(text: str) -> str:
+    """Accent-free, punctuation-free, abbreviation-expanded form used for matching."""
+    tokens = _NON_WORD.sub(" ", normalize(text)).split()
+    return " ".join(_ABBREVIATIONS.get(tok, tok) for tok in tokens)
+
+
+class RoadIndex:
+    """Maps road aliases to (store, road) with a single multi-pattern scan."""
+
+    def __init__(self, locations: list[CostcoLocation], cache_size: int = 128) -> None:
+        # alias canónico → [(índice de tienda, índice de vialidad, vialidad original)]
+        self._entries: dict[str, list[tuple[int, int, str]]] = {}
+        for loc_idx, loc in enumerate(locations):
+            for road_idx, road in enumerate(loc.vialidades_clave):
+                alias = canonical(road)
+                if alias:
+                    self._entries.setdefault(alias, []).append((loc_idx, road_idx, road))
+
+        # Alias que son prefijo de otro terminando en límite de palabra
+        # ("sendero" dentro de "sendero divisorio"): el lookahead solo reporta
+        # el más largo en cada posición, los cortos se agregan desde aquí.
+        self._implied = {
+            alias: [alias[:i] for i, ch in enumerate(alias) if ch == " " and alias[:i] in self._entries]
+            for alias in self._entries
+        }
+        self._regex = re.compile(rf"(?=\b({trie_regex(sorted(self._entries))})\b)")
+
+        # check_proximity y check_roads_only pueden escanear el mismo texto
+        self._scan = lru_cache(maxsize=cache_size)(self._scan_uncached)
+
+    def matches(self, text: str) -> list[tuple[int, str]]:
+        """
+        (store index, road as configured) for every key road mentioned in text.
+
+        Ordenadas por tienda y luego por vialidad, en el orden de la
+        configuración — el mismo orden en que las recorría el escaneo lineal.
+        """
+        return list(self._scan(text))
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _scan_uncached(self, text: str) -> tuple[tuple[int, str], ...]:
+        found: set[str] = set()
+        for m in self._regex.finditer(canonical(text)):
+            alias = m.group(1)
+            if alias not in found:
+                found.add(alias)
+                found.update(self._implied[alias])
+
+        hits = sorted(entry for alias in found for entry in self._entries[alias])
+        return tuple((loc_idx, road) for loc_idx, _, road in hits)
@@ -0,0 +1,118 @@
+"""
+Spatial index — uniform lat/lon grid for radius queries over many points.
+
+Los puntos (incidentes recientes) se guardan por celda de ~cell_km de lado.
+Una consulta de radio r solo revisa las celdas que tocan el círculo, así que
+su costo depende de cuántos puntos hay cerca y no del total: miles de
+incidentes se consultan en microsegundos. Inserción y borrado son O(1), lo
+que permite mantener el índice al día conforme se guardan incidentes.
+
+Las filas de la grilla son franjas de latitud; el ancho de celda en longitud
+se ajusta al coseno de la latitud de cada franja para que las celdas midan
+lo mismo en km a cualquier latitud del país.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Hashable, NamedTuple, Optional
+
+_KM_PER_DEG_LAT = 111.32
+_EARTH_RADIUS_KM = 6371.0088
+
+
+class IndexedPoint(NamedTuple):
+    key: Hashable
+    lat: float
+    lon: float
+    timestamp: float
+    data: Any
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+class SpatialIndex:
+    """Grid index of timestamped points with radius queries (not thread-safe)."""
+
+    def __init__(self, cell_km: float = 1.0) -> None:
+        self._cell_deg_lat = cell_km / _KM_PER_DEG_LAT
+        self._cell_km = cell_km
+        self._cells: dict[tuple[int, int], dict[Hashable, IndexedPoint]] = {}
+        self._where: dict[Hashable, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def insert(
+        self, key: Hashable, lat: float, lon: float, timestamp: float, data: Any = None
+    ) -> None:
+        """Add a point (an existing key is moved/replaced)."""
+        self.remove(key)
+        cell = self._cell(lat, lon)
+        self._cells.setdefault(cell, {})[key] = IndexedPoint(key, lat, lon, timestamp, data)
+        self._where[key] = cell
+
+    def remove(self, key: Hashable) -> None:
+        cell = self._where.pop(key, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.pop(key, None)
+        if not bucket:
+            del self._cells[cell]
+
+    def query_radius(
+        self, lat: float, lon: float, radius_km: float, since: Optional[float] = None
+    ) -> list[tuple[float, IndexedPoint]]:
+        """(km, point) within radius (and newer than `since`), closest first."""
+        row_span = math.ceil(radius_km / self._cell_km)
+        row0 = self._row(lat)
+        hits: list[tuple[float, IndexedPoint]] = []
+        for row in range(row0 - row_span, row0 + row_span + 1):
+            width_deg = self._cell_width_deg(row)
+            col0 = math.floor(lon / width_deg)
+            # Las celdas miden cell_km en su latitud central; +1 cubre la
+            # diferencia de ancho entre el borde y el centro de la franja.
+            for col in range(col0 - row_span - 1, col0 + row_span + 2):
+                for point in self._cells.get((row, col), {}).values():
+                    if since is not None and point.timestamp < since:
+                        continue
+                    dist = haversine_km(lat, lon, point.lat, point.lon)
+                    if dist <= radius_km:
+                        hits.append((dist, point))
+        hits.sort(key=lambda h: h[0])
+        return hits
+
+    def prune(self, older_than: float) -> int:
+        """Drop points with timestamp < older_than. Returns how many were removed."""
+        stale = [
+            point.key
+            for bucket in self._cells.values()
+            for point in bucket.values()
+            if point.timestamp < older_than
+        ]
+        for key in stale:
+            self.remove(key)
+        return len(stale)
+
+    # ── Private ──────────────────────────────────────────────
+
+    def _row(self, lat: float) -> int:
+        return math.floor(lat / self._cell_deg_lat)
+
+    def _km_per_deg_lon(self, row: int) -> float:
+        center_lat = (row + 0.5) * self._cell_deg_lat
+        return _KM_PER_DEG_LAT * max(math.cos(math.radians(center_lat)), 1e-6)
+
+    def _cell_width_deg(self, row: int) -> float:
+        return self._cell_km / self._km_per_deg_lon(row)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        row = self._row(lat)
+        return row, math.floor(lon / self._cell_width_deg(row))
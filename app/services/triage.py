@@ -2,21 +2,108 @@
 Triage service — batch classification of news articles.
 
 Orchestrates the AI provider for batch triage, handling chunking and
-re-indexing of large batches.
+re-indexing of large batches. Chunks are dispatched concurrently (up to
+`parallelism` in flight) and merged back in feed order, so a burst of 150
+items costs about one LLM round trip instead of six.
+
+Chunks are packed to a token budget, not just an item count: a chunk closes
+when its estimated prompt or response would exceed the budget (long tweets
+and snippets make fewer items fit). If a response still comes back
+truncated or unparseable, the chunk is split in half and only the half that
+fails again keeps splitting — a bad response no longer turns 25 items into
+UNKNOWN candidates for the expensive deep analysis.
+
+With a verdict cache (KeyValueCache) items the AI already judged — same
+normalized title from the same outlet — reuse the stored verdict instead of
+going back to the LLM: a story re-seen after a restart, after the processed
+list was trimmed, or under a new Google redirect URL costs no tokens.
+UNKNOWN verdicts (parse failures) are never cached.
 """
 
 from __future__ import annotations
 
-from app.domain.models import NewsItem, TriageResult
-from app.domain.ports import AIProvider
+import hashlib
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domain.models import NewsItem, TriageDecision, TriageResult
+from app.domain.ports import AIProvider, KeyValueCache
+from app.domain.text import estimate_tokens, normalize
+
+_NON_WORD = re.compile(r"[^a-z0-9ñ]+")
+
+# Respuesta por noticia: {"index", "decision", "category", "severity",
+# "location_hint", "reason"} ≈ 90 tokens (25 noticias ≈ 2200 tokens medidos).
+OUTPUT_TOKENS_PER_ITEM = 90
+# "index" y separadores que el provider agrega a cada noticia del prompt
+_INPUT_OVERHEAD_PER_ITEM = 5
+
+
+def item_token_cost(item: NewsItem, snippet_tokens: int = 120) -> tuple[int, int]:
+    """(prompt tokens, response tokens) one item adds to a triage chunk."""
+    payload = json.dumps(item.to_triage_dict(snippet_tokens), ensure_ascii=False, separators=(",", ":"))
+    return estimate_tokens(payload) + _INPUT_OVERHEAD_PER_ITEM, OUTPUT_TOKENS_PER_ITEM
+
+
+def plan_chunks(
+    costs: list[tuple[int, int]],
+    max_items: int,
+    input_budget: int,
+    output_budget: int,
+) -> list[list[int]]:
+    """
+    Pack consecutive items into chunks (lists of positions in `costs`).
+
+    Un chunk se cierra al llegar a max_items o cuando la siguiente noticia
+    pasaría el presupuesto de entrada o de salida. Una noticia que sola ya
+    excede el presupuesto va en su propio chunk (no se descarta).
+    """
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    used_in = used_out = 0
+    for pos, (cost_in, cost_out) in enumerate(costs):
+        over = used_in + cost_in > input_budget or used_out + cost_out > output_budget
+        if current and (len(current) >= max_items or over):
+            chunks.append(current)
+            current, used_in, used_out = [], 0, 0
+        current.append(pos)
+        used_in += cost_in
+        used_out += cost_out
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def triage_fingerprint(item: NewsItem) -> str:
+    """Verdict cache key: normalized title + source (accents, case, punctuation ignored)."""
+    titulo = _NON_WORD.sub(" ", normalize(item.titulo)).strip()
+    fuente = _NON_WORD.sub(" ", normalize(item.fuente)).strip()
+    return hashlib.sha1(f"{titulo}\x1f{fuente}".encode()).hexdigest()
 
 
 class TriageService:
     """Runs batch triage on news items using an AI provider."""
 
-    def __init__(self, ai: AIProvider, chunk_size: int = 25) -> None:
+    def __init__(
+        self,
+        ai: AIProvider,
+        chunk_size: int = 25,
+        parallelism: int = 1,
+        input_token_budget: int = 8000,
+        output_token_budget: int = 3000,
+        snippet_tokens: int = 120,
+        cache: KeyValueCache | None = None,
+        cache_ttl_secs: float = 48 * 3600,
+    ) -> None:
         self._ai = ai
         self._chunk_size = chunk_size
+        self._parallelism = max(1, parallelism)
+        self._input_budget = input_token_budget
+        self._output_budget = output_token_budget
+        self._snippet_tokens = snippet_tokens
+        self._cache = cache
+        self._cache_ttl = cache_ttl_secs
 
     def triage(self, news: list[NewsItem]) -> list[tuple[NewsItem, TriageResult]]:
         """
@@ -25,24 +112,91 @@ class TriageService:
         Returns:
             List of (news_item, triage_result) tuples for CANDIDATES only.
         """
-        batch = [item.to_dict() for item in news]
-        all_results: list[TriageResult] = []
+        all_results, pending = self._cached_verdicts(news)
+        if all_results:
+            print(f"  ♻️ Triage: {len(all_results)} veredicto(s) desde caché")
 
-        # Process in chunks to avoid prompt truncation
-        for chunk_start in range(0, len(batch), self._chunk_size):
-            chunk = batch[chunk_start : chunk_start + self._chunk_size]
+        # Solo lo que no tiene veredicto va a la IA, en chunks de índices globales
+        plan = plan_chunks(
+            [item_token_cost(news[i], self._snippet_tokens) for i in pending],
+            self._chunk_size,
+            self._input_budget,
+            self._output_budget,
+        )
+        chunks = [[pending[pos] for pos in chunk] for chunk in plan]
 
-            chunk_results = self._ai.batch_triage(chunk)
+        # Chunks en paralelo (tope: parallelism); map conserva el orden
+        if self._parallelism > 1 and len(chunks) > 1:
+            workers = min(self._parallelism, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="triage") as pool:
+                per_chunk = list(pool.map(lambda idx: self._triage_chunk(news, idx), chunks))
+        else:
+            per_chunk = [self._triage_chunk(news, idx) for idx in chunks]
 
-            # Restore global index
+        for chunk_results in per_chunk:
             for result in chunk_results:
-                result.index = chunk_start + result.index
                 all_results.append(result)
+                self._remember(news[result.index], result)
 
-        # Filter to candidates only
+        # Filter to candidates only, in feed order
         candidates = []
-        for triage in all_results:
+        for triage in sorted(all_results, key=lambda r: r.index):
             if triage.is_candidate and triage.index < len(news):
                 candidates.append((news[triage.index], triage))
 
         return candidates
+
+    def _triage_chunk(self, news: list[NewsItem], indexes: list[int]) -> list[TriageResult]:
+        """
+        One batch_triage call; results come back with their global index.
+
+        Respuesta ilegible (todos fallback) → se parte el chunk en mitades y
+        se reintenta cada una; una noticia sola que sigue fallando queda
+        UNKNOWN (candidata), como antes.
+        """
+        chunk_results = self._ai.batch_triage(
+            [news[i].to_triage_dict(self._snippet_tokens) for i in indexes]
+        )
+
+        if len(indexes) > 1 and chunk_results and all(r.fallback for r in chunk_results):
+            mid = len(indexes) // 2
+            print(f"  ✂️ Triage: respuesta ilegible para {len(indexes)} noticias, se parte el chunk")
+            return self._triage_chunk(news, indexes[:mid]) + self._triage_chunk(news, indexes[mid:])
+
+        # Restore global index
+        results = []
+        for result in chunk_results:
+            if 0 <= result.index < len(indexes):
+                result.index = indexes[result.index]
+                results.append(result)
+        return results
+
+    # ── Verdict cache ────────────────────────────────────────
+
+    def _cached_verdicts(self, news: list[NewsItem]) -> tuple[list[TriageResult], list[int]]:
+        """(cached results with global index, indexes still to triage)."""
+        if self._cache is None:
+            return [], list(range(len(news)))
+
+        cached: list[TriageResult] = []
+        pending: list[int] = []
+        for i, item in enumerate(news):
+            value = self._cache.get(triage_fingerprint(item))
+            try:
+                result = TriageResult(**value, index=i) if value else None
+            except (TypeError, ValueError):
+                result = None  # entrada de otra versión del modelo → re-triage
+            if result is None:
+                pending.append(i)
+            else:
+                cached.append(result)
+        return cached, pending
+
+    def _remember(self, item: NewsItem, result: TriageResult) -> None:
+        if self._cache is None or result.decision == TriageDecision.UNKNOWN:
+            return
+        self._cache.set(
+            triage_fingerprint(item),
+            result.model_dump(mode="json", exclude={"index"}),
+            self._cache_ttl,
+        )
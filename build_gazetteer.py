@@ -0,0 +1,134 @@
+"""
+Build the offline gazetteer TSV from OpenStreetMap (Overpass API).
+
+Descarga (o lee de un export previo) las colonias y puntos de referencia con
+nombre de Nuevo León y escribe el TSV que carga GAZETTEER_PATH
+(GazetteerGeocoder.load_tsv): nombre, lat, lon, tipo, extensión_km.
+
+  - colonias: place=neighbourhood|suburb|quarter → tipo "colonia";
+  - puntos de referencia: hospitales, universidades, estadios, parques,
+    plazas comerciales, aeropuertos → tipo "punto".
+
+La extensión sale del bounding box de OSM (media diagonal); los nodos sin
+área usan un default por tipo. Un nombre que aparece en lugares a más de
+AMBIGUOUS_KM entre sí ("Centro", "Los Pinos" en varios municipios) se
+descarta: su centroide no dice dónde ocurrió nada y mejor decide Nominatim.
+
+Uso:
+    python build_gazetteer.py -o gazetteer_nl.tsv                       # consulta Overpass
+    python build_gazetteer.py --json overpass.json -o gazetteer_nl.tsv  # export ya descargado
+
+Luego: GAZETTEER_PATH=gazetteer_nl.tsv. El export también puede bajarse a
+mano corriendo OVERPASS_QUERY en https://overpass-turbo.eu (Export → raw
+OSM data). Los datos son de OpenStreetMap (licencia ODbL).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Iterable, Optional
+
+from app.config.gazetteer import Place
+from app.services.road_index import canonical
+from app.services.spatial_index import haversine_km
+
+OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+
+OVERPASS_QUERY = """
+[out:json][timeout:300];
+area["ISO3166-2"="MX-NLE"]->.nl;
+(
+  nwr["place"~"^(neighbourhood|suburb|quarter)$"]["name"](area.nl);
+  nwr["amenity"~"^(hospital|university|college)$"]["name"](area.nl);
+  nwr["leisure"~"^(stadium|park)$"]["name"](area.nl);
+  nwr["shop"="mall"]["name"](area.nl);
+  nwr["aeroway"="aerodrome"]["name"](area.nl);
+);
+out bb tags;
+"""
+
+# Extensión (km) de un nodo sin área, por tipo
+DEFAULT_EXTENT_KM = {"colonia": 1.0, "punto": 0.3}
+MIN_EXTENT_KM = 0.1
+AMBIGUOUS_KM = 2.0
+MIN_NAME_CHARS = 4
+
+
+def element_to_place(element: dict) -> Optional[Place]:
+    """Place for one Overpass element, or None if it lacks a name or position."""
+    tags = element.get("tags") or {}
+    name = (tags.get("name") or "").strip()
+    if len(canonical(name)) < MIN_NAME_CHARS:
+        return None
+    kind = "colonia" if "place" in tags else "punto"
+
+    bounds = element.get("bounds")
+    if bounds:
+        lat = (bounds["minlat"] + bounds["maxlat"]) / 2
+        lon = (bounds["minlon"] + bounds["maxlon"]) / 2
+        extent = haversine_km(bounds["minlat"], bounds["minlon"], bounds["maxlat"], bounds["maxlon"]) / 2
+        extent = max(extent, MIN_EXTENT_KM)
+    elif "lat" in element and "lon" in element:
+        lat, lon = element["lat"], element["lon"]
+        extent = DEFAULT_EXTENT_KM[kind]
+    else:
+        return None
+    return Place(name, round(lat, 5), round(lon, 5), kind, round(extent, 2))
+
+
+def unambiguous(places: Iterable[Place]) -> list[Place]:
+    """One place per canonical name; names spread over AMBIGUOUS_KM are dropped."""
+    by_name: dict[str, list[Place]] = {}
+    for place in places:
+        by_name.setdefault(canonical(place.name), []).append(place)
+
+    kept: list[Place] = []
+    for same in by_name.values():
+        first = same[0]
+        if all(haversine_km(first.lat, first.lon, p.lat, p.lon) <= AMBIGUOUS_KM for p in same[1:]):
+            # Varias geometrías del mismo lugar (nodo + área): la más precisa
+            kept.append(min(same, key=lambda p: p.extent_km))
+    return sorted(kept, key=lambda p: canonical(p.name))
+
+
+def to_tsv(places: Iterable[Place]) -> str:
+    lines = ["# nombre\tlat\tlon\ttipo\textension_km (OpenStreetMap, ODbL)"]
+    lines += [f"{p.name}\t{p.lat}\t{p.lon}\t{p.kind}\t{p.extent_km}" for p in places]
+    return "\n".join(lines) + "\n"
+
+
+def fetch_overpass() -> dict:
+    from app.infrastructure.http import shared_session
+
+    response = shared_session().post(OVERPASS_URL, data={"data": OVERPASS_QUERY}, timeout=360)
+    response.raise_for_status()
+    return response.json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--json", help="export de Overpass ya descargado (si no, se consulta en vivo)")
+    parser.add_argument("-o", "--output", help="archivo TSV de salida (default: stdout)")
+    args = parser.parse_args()
+
+    if args.json:
+        with open(args.json, encoding="utf-8") as f:
+            data = json.load(f)
+    else:
+        data = fetch_overpass()
+
+    elements = data.get("elements", [])
+    places = unambiguous(filter(None, map(element_to_place, elements)))
+    tsv = to_tsv(places)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(tsv)
+    else:
+        sys.stdout.write(tsv)
+    print(f"{len(places)} lugares de {len(elements)} elementos OSM", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
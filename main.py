@@ -5,18 +5,30 @@ This is the ONLY place where concrete implementations are instantiated.
 Everything else depends on abstractions (ports).
 """
 
+import os
+
 from app.config.locations import get_active_locations
 from app.config.settings import settings
+from app.infrastructure.ai.backoff import RateLimitBackoff
+from app.infrastructure.http import shared_session
 from app.infrastructure.notifications.telegram import ConsoleNotifier, TelegramNotifier
 from app.infrastructure.persistence.file_storage import FileStorage
+from app.infrastructure.sources.browser_pool import CRAWL4AI_AVAILABLE, BrowserPool
 from app.infrastructure.sources.deep_reader import MultiStrategyReader
+from app.infrastructure.sources.feed_cache import FeedCache
 from app.infrastructure.sources.gnews_source import GNewsSource
 from app.infrastructure.sources.google_rss import GoogleRSSSource
 from app.infrastructure.sources.nitter_source import NitterSource
 from app.infrastructure.sources.rss_direct import RSSDirectSource
 from app.services.content_hasher import ContentHasher
 from app.services.deep_analysis import DeepAnalysisService
-from app.services.geo_service import GeoService, NominatimGeocoder
+from app.services.geo_service import (
+    CachedGeocoder,
+    GazetteerGeocoder,
+    GeoService,
+    NominatimGeocoder,
+)
+from app.services.near_dedup import NearDuplicateClusterer
 from app.services.pipeline import MonitoringPipeline
 from app.services.triage import TriageService
 
@@ -30,12 +42,14 @@ def build_pipeline() -> MonitoringPipeline:
         ai = AnthropicProvider(
             model=settings.default_ai_model,
             api_key=settings.anthropic_api_key,
+            backoff=RateLimitBackoff(retries=settings.ai_rate_limit_retries),
         )
     else:
         from app.infrastructure.ai.openai_provider import OpenAIProvider
         ai = OpenAIProvider(
             model=settings.default_ai_model,
             api_key=settings.openai_api_key,
+            backoff=RateLimitBackoff(retries=settings.ai_rate_limit_retries),
         )
 
     print(f"🤖 AI: {ai.provider_name()}")
@@ -43,11 +57,18 @@ def build_pipeline() -> MonitoringPipeline:
     # ── News Sources ──
     # Twitter/X vía Nitter (RSS) — sin cookies ni API; Railway le pega a una
     # instancia pública de Nitter, así que la IP de datacenter deja de importar.
+    # FeedCache compartida: ETag/Last-Modified por URL → un feed sin cambios
+    # responde 304 y se reutilizan las entries ya parseadas.
+    # Una sola sesión HTTP (keep-alive por host + reintentos) para fuentes,
+    # lector de artículos y Telegram: evita un handshake TLS por request.
+    session = shared_session()
+    workers = settings.source_max_workers
+    feed_cache = FeedCache(session=session)
     sources = [
-        GoogleRSSSource(),
+        GoogleRSSSource(max_workers=workers, feed_cache=feed_cache),
         GNewsSource(),
-        RSSDirectSource(),
-        NitterSource(),
+        RSSDirectSource(max_workers=workers, feed_cache=feed_cache),
+        NitterSource(max_workers=workers, feed_cache=feed_cache),
     ]
     print("🐦 Twitter/X vía Nitter: ✓")
 
@@ -56,6 +77,7 @@ def build_pipeline() -> MonitoringPipeline:
         notifier = TelegramNotifier(
             bot_token=settings.telegram_bot_token,
             chat_id=settings.telegram_chat_id,
+            session=session,
         )
         print("📱 Telegram: ✓")
     else:
@@ -66,26 +88,131 @@ def build_pipeline() -> MonitoringPipeline:
     repo = None
     if settings.database_enabled:
         from app.infrastructure.persistence.postgres import PostgresRepository
-        repo = PostgresRepository(settings.database_url)
+        repo = PostgresRepository(
+            settings.database_url,
+            dup_cache_size=settings.db_dedup_cache_size,
+            dup_cache_ttl_secs=settings.db_dedup_cache_ttl_secs,
+        )
         print("💾 DB: ✓")
     else:
         print("💾 DB: ✗")
 
     # ── Geo Service ──
+    # Directorio de datos persistentes: el de processed_news_file (mismo
+    # volumen que los marcadores del scheduler).
+    data_dir = os.path.dirname(settings.processed_news_file) or "."
+    geocoder = NominatimGeocoder(min_interval_secs=settings.nominatim_min_interval_secs)
+    if settings.geocode_cache_enabled:
+        # Las avenidas se repiten ciclo tras ciclo: resolverlas desde disco
+        # ahorra hasta dos consultas a Nominatim (1 req/s) por candidata.
+        from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+        geocoder = CachedGeocoder(
+            geocoder,
+            SQLiteKVCache(
+                os.path.join(data_dir, "cache.db"),
+                namespace="geocode",
+                max_entries=settings.geocode_cache_size,
+            ),
+            ttl_secs=settings.geocode_cache_ttl_days * 86400,
+            negative_ttl_secs=settings.geocode_cache_negative_ttl_hours * 3600,
+        )
+    if settings.gazetteer_enabled:
+        # Primer nivel sin red: puntos de referencia y colonias conocidas se
+        # resuelven localmente; Nominatim (con su caché) queda de respaldo.
+        gazetteer_args = dict(fallback=geocoder, max_extent_km=settings.gazetteer_max_extent_km)
+        if settings.gazetteer_path:
+            geocoder = GazetteerGeocoder.load_tsv(settings.gazetteer_path, **gazetteer_args)
+        else:
+            geocoder = GazetteerGeocoder(**gazetteer_args)
     active_locations = get_active_locations()
     geo = GeoService(
-        geocoder=NominatimGeocoder(),
+        geocoder=geocoder,
         locations=active_locations,
         radius_km=settings.radius_km,
+        incident_radius_km=settings.incident_history_radius_km,
+        incident_window_days=settings.incident_history_days,
     )
+    if repo:
+        try:
+            seeded = geo.load_incidents(repo.recent_incident_points(settings.incident_history_days))
+            print(f"🗂️ Historial de incidentes: {seeded} con coordenadas")
+        except Exception as e:
+            print(f"⚠️ No se pudo cargar el historial de incidentes: {e}")
     print(f"📍 Costcos activos: {', '.join(l.nombre for l in active_locations)}")
 
     # ── Services ──
-    reader = MultiStrategyReader()
-    triage = TriageService(ai=ai, chunk_size=settings.triage_chunk_size)
-    deep = DeepAnalysisService(ai=ai, reader=reader, geo=geo)
-    file_storage = FileStorage(settings.processed_news_file)
-    hasher = ContentHasher()
+    browser_pool = None
+    if CRAWL4AI_AVAILABLE:
+        browser_pool = BrowserPool(
+            size=settings.browser_pool_size,
+            max_pages=settings.browser_pool_max_pages,
+            timeout_secs=settings.browser_timeout_secs,
+        )
+    extract_cache = None
+    if settings.extract_cache_enabled:
+        # Una candidata que vuelve (envío fallido, reinicio) no se re-descarga
+        from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+        extract_cache = SQLiteKVCache(
+            os.path.join(data_dir, "cache.db"),
+            namespace="extract",
+            max_entries=settings.extract_cache_size,
+        )
+    reader = MultiStrategyReader(
+        session=session,
+        browser_pool=browser_pool,
+        thin_chars=settings.deep_reader_thin_chars,
+        race_timeout_secs=settings.deep_reader_race_timeout_secs,
+        cache=extract_cache,
+        cache_ttl_secs=settings.extract_cache_ttl_hours * 3600,
+    )
+    triage_cache = None
+    if settings.triage_cache_enabled:
+        # Lo que la IA ya juzgó (reinicio, URL de redirect nueva) no se re-paga
+        from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+        triage_cache = SQLiteKVCache(
+            os.path.join(data_dir, "cache.db"),
+            namespace="triage",
+            max_entries=settings.triage_cache_size,
+        )
+    triage = TriageService(
+        ai=ai,
+        chunk_size=settings.triage_chunk_size,
+        parallelism=settings.triage_parallelism,
+        input_token_budget=settings.triage_input_token_budget,
+        output_token_budget=settings.triage_output_token_budget,
+        snippet_tokens=settings.triage_snippet_tokens,
+        cache=triage_cache,
+        cache_ttl_secs=settings.triage_cache_ttl_hours * 3600,
+    )
+    deep = DeepAnalysisService(
+        ai=ai,
+        reader=reader,
+        geo=geo,
+        reader_concurrency=settings.deep_reader_concurrency,
+        ai_concurrency=settings.deep_ai_concurrency,
+    )
+    if settings.dedup_backend == "sqlite":
+        from app.infrastructure.persistence.sqlite_storage import SQLiteStorage
+        file_storage = SQLiteStorage(
+            os.path.join(data_dir, "processed_news.db"),
+            max_age_days=settings.processed_max_age_days,
+            import_from=settings.processed_news_file,
+        )
+    else:
+        file_storage = FileStorage(settings.processed_news_file)
+    # Estado del tracker de cambios en el mismo directorio de datos:
+    # sobrevive reinicios.
+    hasher = ContentHasher(state_path=os.path.join(data_dir, "content_hasher_state.json"))
+
+    near_dedup = (
+        NearDuplicateClusterer(
+            threshold=settings.near_dup_threshold,
+            state_path=os.path.join(data_dir, "near_dup_state.json"),
+            memory_ttl_secs=settings.near_dup_memory_hours * 3600,
+            memory_size=settings.near_dup_memory_size,
+        )
+        if settings.near_dup_enabled else None
+    )
 
     return MonitoringPipeline(
         sources=sources,
@@ -96,6 +223,11 @@ def build_pipeline() -> MonitoringPipeline:
         file_storage=file_storage,
         hasher=hasher,
         max_age_hours=settings.max_age_hours,
+        collect_timeout_secs=settings.collect_timeout_secs,
+        near_dedup=near_dedup,
+        geo=geo,
+        deep_workers=settings.deep_workers,
+        max_retry_attempts=settings.alert_retry_attempts,
     )
 
 
@@ -0,0 +1,111 @@
+"""
+Measure triage prompt size — tokens per item, legacy vs compact wire format.
+
+Compara el formato anterior del batch_triage (to_dict + json indent=2, con
+url y fecha_pub) contra el actual (to_triage_dict + JSON compacto) sobre las
+mismas noticias, y reporta tokens por noticia y por chunk.
+
+Uso:
+    python measure_triage_tokens.py                 # recolecta de las fuentes en vivo
+    python measure_triage_tokens.py --json news.json  # lista de NewsItem en JSON (offline)
+
+Con `tiktoken` instalado cuenta con el tokenizador o200k_base; si no, usa la
+estimación de app/domain/text.py (la misma que el planificador de chunks).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Callable
+
+from app.config.settings import settings
+from app.domain.models import NewsItem
+from app.domain.text import estimate_tokens
+from app.infrastructure.ai.prompts import TRIAGE_USER_PROMPT_TEMPLATE, serialize_triage_articles
+
+
+def token_counter() -> tuple[str, Callable[[str], int]]:
+    """(nombre del método, función de conteo)."""
+    try:
+        import tiktoken
+    except ImportError:
+        return "estimación chars/3.5", estimate_tokens
+    encoding = tiktoken.get_encoding("o200k_base")
+    return "tiktoken o200k_base", lambda text: len(encoding.encode(text))
+
+
+def legacy_prompt(news: list[NewsItem]) -> str:
+    """User prompt as batch_triage built it before the compact format."""
+    articles = json.dumps(
+        [{"index": i, **item.to_dict()} for i, item in enumerate(news)],
+        ensure_ascii=False,
+        indent=2,
+    )
+    return TRIAGE_USER_PROMPT_TEMPLATE.format(count=len(news), articles_json=articles)
+
+
+def compact_prompt(news: list[NewsItem], snippet_tokens: int) -> str:
+    """User prompt as batch_triage builds it now."""
+    articles = serialize_triage_articles([item.to_triage_dict(snippet_tokens) for item in news])
+    return TRIAGE_USER_PROMPT_TEMPLATE.format(count=len(news), articles_json=articles)
+
+
+def measure(news: list[NewsItem], count: Callable[[str], int], snippet_tokens: int) -> dict:
+    """Token totals and per-item averages for both formats (template overhead excluded)."""
+    empty = count(TRIAGE_USER_PROMPT_TEMPLATE.format(count=0, articles_json="[]"))
+    before = count(legacy_prompt(news)) - empty
+    after = count(compact_prompt(news, snippet_tokens)) - empty
+    n = max(1, len(news))
+    return {
+        "items": len(news),
+        "before_total": before,
+        "after_total": after,
+        "before_per_item": before / n,
+        "after_per_item": after / n,
+        "reduction_pct": 100.0 * (before - after) / before if before else 0.0,
+    }
+
+
+def _load_json(path: str) -> list[NewsItem]:
+    with open(path, encoding="utf-8") as f:
+        return [NewsItem(**row) for row in json.load(f)]
+
+
+def _collect_live() -> list[NewsItem]:
+    from app.infrastructure.sources.google_rss import GoogleRSSSource
+    from app.infrastructure.sources.nitter_source import NitterSource
+    from app.infrastructure.sources.rss_direct import RSSDirectSource
+
+    news: list[NewsItem] = []
+    for source in (GoogleRSSSource(), RSSDirectSource(), NitterSource()):
+        try:
+            news.extend(source.collect())
+        except Exception as e:
+            print(f"⚠️ {source.source_name()}: {e}")
+    return news
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tokens por noticia del prompt de triage")
+    parser.add_argument("--json", help="archivo JSON con una lista de NewsItem")
+    parser.add_argument("--snippet-tokens", type=int, default=settings.triage_snippet_tokens)
+    args = parser.parse_args()
+
+    news = _load_json(args.json) if args.json else _collect_live()
+    if not news:
+        print("Sin noticias para medir.")
+        return
+
+    method, count = token_counter()
+    r = measure(news, count, args.snippet_tokens)
+    chunk = settings.triage_chunk_size
+    print(f"Noticias: {r['items']}  (conteo: {method})")
+    print(f"  antes:   {r['before_per_item']:.1f} tokens/noticia  ({r['before_total']} total)")
+    print(f"  después: {r['after_per_item']:.1f} tokens/noticia  ({r['after_total']} total)")
+    print(f"  reducción: {r['reduction_pct']:.1f}%  "
+          f"(≈ {(r['before_per_item'] - r['after_per_item']) * chunk:.0f} tokens por chunk de {chunk})")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,12 @@ Smart scheduler — runs the monitoring pipeline with dynamic intervals.
 - A2: ninguna excepción de ciclo mata el loop; cada ciclo registra un
   latido en app.infrastructure.heartbeat para que /health detecte un
   worker muerto y Railway reinicie.
-- M8: una vez al día limpia el archivo de URLs procesadas (FileStorage).
+- M8: una vez al día limpia las URLs procesadas: FileStorage recorta a
+  PROCESSED_FILE_MAX_ENTRIES; SQLiteStorage solo expira por antigüedad.
 - M1: heartbeat diario — UN reporte de estado al día (daily_heartbeat_hour)
   con lo acumulado, en vez de un resumen por ciclo; marcador YYYY-MM-DD.
+- Cada ciclo registra el resumen acumulado de la caché de prompts del
+  provider de IA (hits/misses y tokens), para ver si realmente pega.
 - Digest mensual SESNSP: a partir del día crime_digest_day (9:00 hora del
   centro) genera y envía el contexto delictivo; marcador persistente
   YYYY-MM para no reenviar tras un reinicio del contenedor.
@@ -24,6 +27,7 @@ import pytz
 
 from app.config.settings import settings
 from app.infrastructure import heartbeat
+from app.infrastructure.persistence.file_storage import FileStorage
 from crime_report import generar_digest
 from main import build_pipeline
 
@@ -41,17 +45,43 @@ def is_night_time() -> bool:
 
 
 def _daily_cleanup(pipeline) -> None:
-    """M8: limpia el archivo de URLs procesadas (FileStorage.cleanup)."""
+    """
+    M8: limpia las URLs procesadas.
+
+    El tope de entradas es solo para el archivo (FileStorage), que no sabe
+    cuándo se marcó cada URL. SQLiteStorage expira por antigüedad
+    (processed_max_age_days): recortarlo a 5000 filas borraría URLs
+    frescas y las volvería a mandar a triage.
+    """
     storage = getattr(pipeline, "_storage", None)
     if storage is None or not hasattr(storage, "cleanup"):
         return
-    removed = storage.cleanup(max_entries=PROCESSED_FILE_MAX_ENTRIES)
+    if isinstance(storage, FileStorage):
+        removed = storage.cleanup(max_entries=PROCESSED_FILE_MAX_ENTRIES)
+    else:
+        removed = storage.cleanup()
     if removed:
-        print(f"🧹 Limpieza diaria: {removed} URLs antiguas eliminadas de {settings.processed_news_file}")
+        print(f"🧹 Limpieza diaria: {removed} URLs antiguas eliminadas")
     else:
         print("🧹 Limpieza diaria: nada que limpiar")
 
 
+def _log_prompt_cache(pipeline) -> None:
+    """Resumen acumulado de PromptCacheStats del provider de IA (si lo tiene)."""
+    triage = getattr(pipeline, "_triage", None)
+    stats = getattr(getattr(triage, "_ai", None), "prompt_cache", None)
+    if stats is None:
+        return
+    s = stats.summary()
+    if not s["calls"]:
+        return
+    print(
+        f"💾 Caché de prompts: {s['hits']}/{s['calls']} llamadas con hit — "
+        f"{s['cache_read_tokens']} tokens desde caché, {s['input_tokens']} sin caché, "
+        f"{s['cache_write_tokens']} escritos"
+    )
+
+
 # ── Heartbeat diario (M1) ────────────────────────────────────
 
 
@@ -240,13 +270,16 @@ def main():
                     print(f"{'='*70}")
 
                     stats = pipeline.run_once() or {}
+                    _log_prompt_cache(pipeline)
                     hb_acc["cycles"] += 1
                     hb_acc["new"] += stats.get("new", 0)
                     hb_acc["alerts"] += stats.get("alerts", 0)
 
-                    # Adjust interval
-                    if pipeline._hasher.consecutive_no_change > 0:
-                        current_interval = min(current_interval + step_increase, max_secs)
+                    # Adjust interval — derivado del contador (persistido por
+                    # ContentHasher), así un reinicio no lo regresa al mínimo.
+                    no_change = pipeline._hasher.consecutive_no_change
+                    if no_change > 0:
+                        current_interval = min(min_secs + no_change * step_increase, max_secs)
                         print(f"\n⏱️  Sin cambios → próximo: {current_interval // 60}min")
                     else:
                         current_interval = min_secs
@@ -6,6 +6,8 @@ Configuración compartida de pytest para costco-news-monitor.
 2. Bloquea conexiones de red reales en TODOS los tests (regla del proyecto:
    prohibido tocar red/BD/APIs de pago — todo va con mocks y datos sintéticos).
    Los mocks de unittest.mock no abren sockets, así que no se ven afectados.
+3. Fixture `reloj`: reloj falso compartido (callable para los `clock=` y
+   con `sleep` que avanza el tiempo sin dormir y registra las esperas).
 """
 
 from __future__ import annotations
@@ -32,3 +34,23 @@ def _sin_red(monkeypatch):
 
     monkeypatch.setattr(socket.socket, "connect", _conexion_prohibida)
     monkeypatch.setattr(socket, "create_connection", _conexion_prohibida)
+
+
+class RelojFalso:
+    """Reloj inyectable: se avanza a mano (reloj.t += ...) o con sleep()."""
+
+    def __init__(self, t: float = 1_700_000_000.0) -> None:
+        self.t = t
+        self.esperas: list[float] = []
+
+    def __call__(self) -> float:
+        return self.t
+
+    def sleep(self, secs: float) -> None:
+        self.esperas.append(secs)
+        self.t += secs
+
+
+@pytest.fixture
+def reloj() -> RelojFalso:
+    return RelojFalso()
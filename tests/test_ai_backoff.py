@@ -0,0 +1,107 @@
+"""
+Tests de RateLimitBackoff (app/infrastructure/ai/backoff.py).
+
+Un 429/529 se reintenta respetando Retry-After (o con backoff exponencial)
+y el enfriamiento lo comparten todas las llamadas; cualquier otro error se
+propaga sin reintento. Reloj y sleep falsos: nada espera de verdad.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.models import TriageDecision
+from app.infrastructure.ai.anthropic_provider import AnthropicProvider
+from app.infrastructure.ai.backoff import RateLimitBackoff, retry_after_secs
+from app.infrastructure.ai.openai_provider import OpenAIProvider
+
+
+class _ErrorAPI(Exception):
+    def __init__(self, status: int, retry_after: str | None = None):
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+        headers = {"retry-after": retry_after} if retry_after is not None else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+def _backoff(reloj, **kw) -> RateLimitBackoff:
+    return RateLimitBackoff(clock=reloj, sleep=reloj.sleep, **kw)
+
+
+def _falla_luego_ok(*errores):
+    fn = MagicMock(side_effect=[*errores, "ok"])
+    return fn
+
+
+def test_429_reintenta_con_backoff_exponencial(reloj):
+    fn = _falla_luego_ok(_ErrorAPI(429), _ErrorAPI(429))
+
+    assert _backoff(reloj, base_delay_secs=2.0).call(fn) == "ok"
+    assert fn.call_count == 3
+    assert reloj.esperas == [2.0, 4.0]
+
+
+def test_respeta_retry_after_con_tope(reloj):
+    fn = _falla_luego_ok(_ErrorAPI(429, "7"), _ErrorAPI(529, "600"))
+
+    _backoff(reloj, max_delay_secs=30.0).call(fn)
+
+    assert reloj.esperas == [7.0, 30.0]
+
+
+def test_agotados_los_reintentos_se_propaga(reloj):
+    fn = MagicMock(side_effect=_ErrorAPI(429))
+
+    with pytest.raises(_ErrorAPI):
+        _backoff(reloj, retries=2).call(fn)
+    assert fn.call_count == 3
+
+
+def test_otros_errores_no_se_reintentan(reloj):
+    fn = MagicMock(side_effect=_ErrorAPI(500))
+
+    with pytest.raises(_ErrorAPI):
+        _backoff(reloj).call(fn)
+    assert fn.call_count == 1
+    assert reloj.esperas == []
+
+
+def test_enfriamiento_compartido_entre_llamadas(reloj):
+    backoff = _backoff(reloj, base_delay_secs=5.0)
+    backoff.call(_falla_luego_ok(_ErrorAPI(429)))
+    reloj.t -= 3.0  # otra llamada llega mientras el enfriamiento sigue vigente
+
+    backoff.call(MagicMock(return_value="ok"))
+
+    assert reloj.esperas == [5.0, 3.0]
+
+
+def test_retry_after_en_formato_fecha_se_ignora():
+    assert retry_after_secs(_ErrorAPI(429, "Wed, 21 Oct 2026 07:28:00 GMT")) is None
+    assert retry_after_secs(RuntimeError("sin response")) is None
+
+
+def test_provider_reintenta_el_429_y_parsea(reloj):
+    provider = AnthropicProvider(model="claude-sintetico", api_key="sk-test", backoff=_backoff(reloj))
+    respuesta = MagicMock()
+    respuesta.content = [MagicMock(text=json.dumps({"results": [
+        {"index": 0, "decision": "candidata"}
+    ]}))]
+    provider._client = MagicMock()
+    provider._client.messages.create.side_effect = [_ErrorAPI(429, "1"), respuesta]
+
+    results = provider.batch_triage([{"titulo": "Choque en Gonzalitos"}])
+
+    assert results[0].decision == TriageDecision.CANDIDATE
+    assert provider._client.messages.create.call_count == 2
+    assert reloj.esperas == [1.0]
+
+
+def test_los_clientes_del_sdk_no_reintentan_por_su_cuenta():
+    # Un reintento interno del SDK esquivaría el enfriamiento compartido
+    assert AnthropicProvider(api_key="sk-test")._client.max_retries == 0
+    assert OpenAIProvider(api_key="sk-test")._client.max_retries == 0
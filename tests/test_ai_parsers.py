@@ -13,8 +13,8 @@ AttributeError cuando la respuesta del modelo no era exactamente
     noticia enviada (TriageResult.is_candidate trata UNKNOWN como candidata,
     para no perder alertas por un error de parseo).
 
-Ningún test toca red: los providers se instancian con __new__ (sin construir
-el cliente del SDK) o con el cliente reemplazado por un MagicMock.
+Ningún test toca red: los providers se construyen normalmente y su cliente
+del SDK se reemplaza por un MagicMock.
 """
 
 from __future__ import annotations
@@ -25,6 +25,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from app.domain.models import IncidentCategory, TrafficImpact, TriageDecision, TriageResult
+from app.domain.ports import AIUnavailableError
 from app.infrastructure.ai.anthropic_provider import AnthropicProvider
 from app.infrastructure.ai.openai_provider import OpenAIProvider
 
@@ -41,19 +42,22 @@ PROVIDERS_XFAIL_OPENAI_ANALYSIS = PROVIDERS
 
 
 # ============================================================
-# Helpers — instancian los providers SIN cliente SDK real
+# Helpers — providers con el cliente SDK reemplazado por un MagicMock
 # ============================================================
 
-def _provider_sin_cliente(nombre: str):
-    """Crea el provider sin pasar por __init__ (que instancia el SDK real)."""
+def _provider(nombre: str):
+    """Construye el provider (api key ficticia) y cambia su cliente por un MagicMock."""
     if nombre == "anthropic":
-        return AnthropicProvider.__new__(AnthropicProvider)
-    return OpenAIProvider.__new__(OpenAIProvider)
+        provider = AnthropicProvider(model="claude-sintetico", api_key="sk-test")
+    else:
+        provider = OpenAIProvider(model="gpt-sintetico", api_key="sk-test")
+    provider._client = MagicMock()
+    return provider
 
 
 def _parse_triage(nombre: str, raw, count: int) -> list[TriageResult]:
     """Despacha al método de parseo de triage de cada provider."""
-    provider = _provider_sin_cliente(nombre)
+    provider = _provider(nombre)
     if nombre == "anthropic":
         return provider._parse_triage(raw, count)
     return provider._parse_triage_response(raw, count)
@@ -61,7 +65,7 @@ def _parse_triage(nombre: str, raw, count: int) -> list[TriageResult]:
 
 def _parse_analysis(nombre: str, raw):
     """Despacha al método de parseo de análisis profundo de cada provider."""
-    provider = _provider_sin_cliente(nombre)
+    provider = _provider(nombre)
     if nombre == "anthropic":
         return provider._parse_analysis(raw)
     return provider._parse_analysis_response(raw)
@@ -160,6 +164,20 @@ def test_triage_json_truncado_no_lanza_y_devuelve_fallback_todas_candidatas(nomb
     _assert_fallback_todas_candidatas(results, 3, f"{nombre} con JSON truncado")
 
 
+@pytest.mark.parametrize("nombre", PROVIDERS)
+def test_triage_ilegible_marca_fallback_pero_error_de_api_no(nombre):
+    """
+    fallback=True solo cuando hubo respuesta y no se pudo interpretar: es la
+    señal para que TriageService parta el chunk. Un error de API (None) no
+    se reintenta partiendo — con la API caída solo multiplicaría llamadas.
+    """
+    truncado = _parse_triage(nombre, '{"results": [{"index": 0, "decision": "candi', 3)
+    sin_respuesta = _parse_triage(nombre, None, 3)
+
+    assert all(r.fallback for r in truncado)
+    assert not any(r.fallback for r in sin_respuesta)
+
+
 @pytest.mark.parametrize("nombre", PROVIDERS)
 def test_triage_respuesta_none_devuelve_fallback_todas_candidatas(nombre):
     """Si la llamada al API falló (_call devuelve None), fallback completo."""
@@ -342,11 +360,9 @@ def test_batch_triage_anthropic_con_cliente_mockeado_parsea_y_pide_tokens_sufici
     parsea la respuesta y — parte del fix de truncamiento — pide más de 2000
     max_tokens (2000 truncaba el JSON de 25 noticias y disparaba el fallback caro).
     """
-    provider = AnthropicProvider.__new__(AnthropicProvider)
-    provider._model = "claude-sintetico"
+    provider = _provider("anthropic")
     respuesta = MagicMock()
     respuesta.content = [MagicMock(text=json.dumps({"results": [_item_triage(0)]}))]
-    provider._client = MagicMock()
     provider._client.messages.create.return_value = respuesta
 
     results = provider.batch_triage([{"titulo": "Balacera en Valle Oriente", "contenido": "..."}])
@@ -365,9 +381,7 @@ def test_batch_triage_anthropic_con_cliente_mockeado_parsea_y_pide_tokens_sufici
 
 def test_batch_triage_anthropic_error_de_api_devuelve_fallback():
     """Si el SDK lanza (timeout, 500...), batch_triage devuelve el fallback, no propaga."""
-    provider = AnthropicProvider.__new__(AnthropicProvider)
-    provider._model = "claude-sintetico"
-    provider._client = MagicMock()
+    provider = _provider("anthropic")
     provider._client.messages.create.side_effect = RuntimeError("API caída (sintético)")
 
     results = provider.batch_triage([{"titulo": "a"}, {"titulo": "b"}, {"titulo": "c"}])
@@ -377,13 +391,11 @@ def test_batch_triage_anthropic_error_de_api_devuelve_fallback():
 
 def test_batch_triage_openai_con_cliente_mockeado_parsea():
     """batch_triage completo con el SDK de OpenAI simulado."""
-    provider = OpenAIProvider.__new__(OpenAIProvider)
-    provider._model = "gpt-sintetico"
+    provider = _provider("openai")
     respuesta = MagicMock()
     respuesta.choices = [MagicMock(message=MagicMock(content=json.dumps(
         {"results": [_item_triage(0, "descartada")]}
     )))]
-    provider._client = MagicMock()
     provider._client.chat.completions.create.return_value = respuesta
 
     results = provider.batch_triage([{"titulo": "Nota de espectáculos", "contenido": "..."}])
@@ -400,9 +412,7 @@ def test_batch_triage_openai_con_cliente_mockeado_parsea():
 
 def test_batch_triage_openai_error_de_api_devuelve_fallback():
     """Si el SDK de OpenAI lanza, batch_triage devuelve el fallback, no propaga."""
-    provider = OpenAIProvider.__new__(OpenAIProvider)
-    provider._model = "gpt-sintetico"
-    provider._client = MagicMock()
+    provider = _provider("openai")
     provider._client.chat.completions.create.side_effect = RuntimeError("API caída (sintético)")
 
     results = provider.batch_triage([{"titulo": "a"}, {"titulo": "b"}])
@@ -410,6 +420,19 @@ def test_batch_triage_openai_error_de_api_devuelve_fallback():
     _assert_fallback_todas_candidatas(results, 2, "openai con error de API")
 
 
+def test_deep_analyze_error_de_api_lanza_ai_unavailable_y_respuesta_ilegible_da_none():
+    """Un 500/timeout del SDK es pasajero (se reintenta); texto ilegible es un descarte."""
+    provider = _provider("anthropic")
+    provider._client.messages.create.side_effect = [
+        RuntimeError("API caída (sintético)"),
+        MagicMock(content=[MagicMock(text="no es json")]),
+    ]
+
+    with pytest.raises(AIUnavailableError):
+        provider.deep_analyze("Choque", "texto")
+    assert provider.deep_analyze("Choque", "texto") is None
+
+
 # ============================================================
 # Parser de análisis profundo
 # ============================================================
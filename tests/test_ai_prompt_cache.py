@@ -0,0 +1,132 @@
+"""
+Tests de la caché de prompts del provider (Anthropic / OpenAI).
+
+El system prompt estático va primero (y en Anthropic marcado con
+cache_control); los user prompts solo llevan lo variable. Cada llamada
+registra tokens leídos/escritos en caché vs sin caché en PromptCacheStats.
+
+Los providers se construyen con una api key ficticia y el cliente del SDK
+simulado — nada toca la red.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import scheduler
+from app.infrastructure.ai.anthropic_provider import AnthropicProvider
+from app.infrastructure.ai.openai_provider import OpenAIProvider
+from app.infrastructure.ai.prompts import (
+    DEEP_ANALYSIS_SYSTEM_PROMPT,
+    DEEP_ANALYSIS_USER_PROMPT_TEMPLATE,
+    TRIAGE_SYSTEM_PROMPT,
+    TRIAGE_USER_PROMPT_TEMPLATE,
+)
+from app.infrastructure.ai.usage import CallUsage, PromptCacheStats
+
+_TRIAGE_OK = json.dumps({"results": [{"index": 0, "decision": "candidata"}]})
+
+
+def _anthropic(usages: list) -> AnthropicProvider:
+    provider = AnthropicProvider(model="claude-sintetico", api_key="sk-test")
+    provider._client = MagicMock()
+    provider._client.messages.create.side_effect = [
+        SimpleNamespace(content=[SimpleNamespace(text=_TRIAGE_OK)], usage=u) for u in usages
+    ]
+    return provider
+
+
+def _openai(usages: list) -> OpenAIProvider:
+    provider = OpenAIProvider(model="gpt-sintetico", api_key="sk-test")
+    provider._client = MagicMock()
+    provider._client.chat.completions.create.side_effect = [
+        SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=_TRIAGE_OK))], usage=u
+        )
+        for u in usages
+    ]
+    return provider
+
+
+def test_lo_estatico_vive_en_el_system_y_el_user_solo_trae_lo_variable():
+    for system in (TRIAGE_SYSTEM_PROMPT, DEEP_ANALYSIS_SYSTEM_PROMPT):
+        assert "FORMATO DE RESPUESTA" in system
+    assert TRIAGE_USER_PROMPT_TEMPLATE.rstrip().endswith("{articles_json}")
+    assert DEEP_ANALYSIS_USER_PROMPT_TEMPLATE.rstrip().endswith("{content}")
+
+
+def test_anthropic_marca_el_system_para_cache_y_registra_hit_y_miss():
+    provider = _anthropic([
+        SimpleNamespace(input_tokens=300, cache_read_input_tokens=0, cache_creation_input_tokens=1200),
+        SimpleNamespace(input_tokens=280, cache_read_input_tokens=1200, cache_creation_input_tokens=0),
+    ])
+
+    provider.batch_triage([{"titulo": "Choque en Gonzalitos"}])
+    provider.batch_triage([{"titulo": "Incendio en Cumbres"}])
+
+    kwargs = provider._client.messages.create.call_args.kwargs
+    assert kwargs["system"] == [{
+        "type": "text",
+        "text": TRIAGE_SYSTEM_PROMPT,
+        "cache_control": {"type": "ephemeral"},
+    }]
+    primera, segunda = provider.prompt_cache.recent()
+    assert (primera.hit, primera.cache_write_tokens) == (False, 1200)
+    assert (segunda.hit, segunda.cache_read_tokens, segunda.input_tokens) == (True, 1200, 280)
+    assert provider.prompt_cache.summary() == {
+        "calls": 2, "hits": 1, "misses": 1,
+        "input_tokens": 580, "cache_read_tokens": 1200, "cache_write_tokens": 1200,
+    }
+
+
+def test_anthropic_deep_analyze_se_registra_como_analysis():
+    provider = _anthropic([SimpleNamespace(input_tokens=900)])
+    provider.deep_analyze("Choque", "Texto del artículo")
+
+    assert [u.kind for u in provider.prompt_cache.recent()] == ["analysis"]
+    assert provider.prompt_cache.recent()[0].cache_read_tokens == 0
+
+
+def test_openai_system_primero_y_registra_cached_tokens():
+    provider = _openai([
+        SimpleNamespace(prompt_tokens=1500, prompt_tokens_details=SimpleNamespace(cached_tokens=1024)),
+        SimpleNamespace(prompt_tokens=1500, prompt_tokens_details=None),
+    ])
+
+    provider.batch_triage([{"titulo": "Choque en Gonzalitos"}])
+    provider.batch_triage([{"titulo": "Choque en Gonzalitos"}])
+
+    mensajes = provider._client.chat.completions.create.call_args.kwargs["messages"]
+    assert mensajes[0] == {"role": "system", "content": TRIAGE_SYSTEM_PROMPT}
+    assert [(u.hit, u.cache_read_tokens) for u in provider.prompt_cache.recent()] == [
+        (True, 1024), (False, 0),
+    ]
+
+
+def test_respuesta_sin_usage_no_rompe():
+    provider = _anthropic([None])
+    assert provider.batch_triage([{"titulo": "a"}])[0].index == 0
+    assert provider.prompt_cache.calls == 0
+
+
+def test_scheduler_registra_el_resumen_de_la_cache(capsys):
+    stats = PromptCacheStats()
+    stats.record(CallUsage("triage", input_tokens=900, cache_read_tokens=0, cache_write_tokens=1100))
+    stats.record(CallUsage("triage", input_tokens=40, cache_read_tokens=1100, cache_write_tokens=0))
+    pipeline = SimpleNamespace(_triage=SimpleNamespace(_ai=SimpleNamespace(prompt_cache=stats)))
+
+    scheduler._log_prompt_cache(pipeline)
+
+    salida = capsys.readouterr().out
+    assert "1/2 llamadas con hit" in salida
+    assert "1100 tokens desde caché" in salida
+
+
+def test_scheduler_sin_llamadas_o_sin_stats_no_registra(capsys):
+    scheduler._log_prompt_cache(SimpleNamespace(_triage=SimpleNamespace(_ai=MagicMock(prompt_cache=None))))
+    scheduler._log_prompt_cache(
+        SimpleNamespace(_triage=SimpleNamespace(_ai=SimpleNamespace(prompt_cache=PromptCacheStats())))
+    )
+    assert capsys.readouterr().out == ""
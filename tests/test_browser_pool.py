@@ -0,0 +1,145 @@
+"""
+Tests de BrowserPool (app/infrastructure/sources/browser_pool.py).
+
+Un solo event loop en su hilo, crawlers calientes reusados entre URLs,
+reciclaje tras max_pages o ante error/timeout. El crawler se inyecta con
+crawler_factory — nada lanza Chromium.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.sources.browser_pool import BrowserPool
+from app.infrastructure.sources.deep_reader import MultiStrategyReader
+
+_TEXTO = "Incendio en bodega cercana a Costco Cumbres, sin lesionados. " * 20
+
+
+class _CrawlerFalso:
+    creados: list["_CrawlerFalso"] = []
+
+    def __init__(self, demora: float = 0.0, falla: bool = False):
+        self.demora = demora
+        self.falla = falla
+        self.paginas = 0
+        self.cerrado = False
+        self.hilos: set[str] = set()
+        _CrawlerFalso.creados.append(self)
+
+    async def start(self):
+        self.hilos.add(threading.current_thread().name)
+
+    async def arun(self, url, config=None):
+        self.hilos.add(threading.current_thread().name)
+        self.paginas += 1
+        if self.demora:
+            await asyncio.sleep(self.demora)
+        if self.falla:
+            raise RuntimeError("page crashed")
+        return SimpleNamespace(success=True, markdown=f"{url}\n{_TEXTO}")
+
+    async def close(self):
+        self.cerrado = True
+
+
+@pytest.fixture(autouse=True)
+def _limpiar():
+    _CrawlerFalso.creados = []
+    yield
+
+
+def _pool(**kw) -> BrowserPool:
+    fabrica = kw.pop("fabrica", _CrawlerFalso)
+    return BrowserPool(crawler_factory=fabrica, run_config=object(), **kw)
+
+
+def test_reusa_el_mismo_navegador_entre_urls():
+    pool = _pool(size=2)
+    try:
+        for i in range(5):
+            assert pool.fetch(f"https://ejemplo.test/{i}").endswith(_TEXTO)
+    finally:
+        pool.close()
+
+    assert pool.launches == 1
+    assert _CrawlerFalso.creados[0].paginas == 5
+    assert _CrawlerFalso.creados[0].hilos == {"browser-pool"}
+
+
+def test_concurrencia_acotada_por_size():
+    pool = _pool(size=2, fabrica=lambda: _CrawlerFalso(demora=0.05))
+    try:
+        with ThreadPoolExecutor(max_workers=6) as ex:
+            textos = list(ex.map(pool.fetch, [f"https://ejemplo.test/{i}" for i in range(6)]))
+    finally:
+        pool.close()
+
+    assert all(textos)
+    assert pool.launches == 2
+
+
+def test_recicla_tras_max_pages():
+    pool = _pool(size=1, max_pages=2)
+    try:
+        for i in range(5):
+            pool.fetch(f"https://ejemplo.test/{i}")
+    finally:
+        pool.close()
+
+    assert pool.launches == 3
+    assert [c.paginas for c in _CrawlerFalso.creados] == [2, 2, 1]
+    assert all(c.cerrado for c in _CrawlerFalso.creados)
+
+
+def test_error_devuelve_none_y_recicla_el_navegador():
+    fabricas = iter([_CrawlerFalso(falla=True), _CrawlerFalso()])
+    pool = _pool(size=1, fabrica=lambda: next(fabricas))
+    try:
+        assert pool.fetch("https://ejemplo.test/roto") is None
+        assert pool.fetch("https://ejemplo.test/bien") is not None
+    finally:
+        pool.close()
+
+    roto, sano = _CrawlerFalso.creados
+    assert roto.cerrado
+    assert sano.paginas == 1
+
+
+def test_timeout_devuelve_none_y_libera_el_lugar():
+    fabricas = iter([_CrawlerFalso(demora=5.0), _CrawlerFalso()])
+    pool = _pool(size=1, timeout_secs=0.1, fabrica=lambda: next(fabricas))
+    try:
+        assert pool.fetch("https://ejemplo.test/lento") is None
+        assert pool.fetch("https://ejemplo.test/rapido") is not None
+    finally:
+        pool.close()
+
+    assert _CrawlerFalso.creados[0].cerrado
+
+
+def test_close_detiene_el_hilo_y_es_idempotente():
+    pool = _pool()
+    pool.fetch("https://ejemplo.test/1")
+    pool.close()
+    pool.close()
+
+    assert not any(t.name == "browser-pool" for t in threading.enumerate())
+    assert _CrawlerFalso.creados[0].cerrado
+
+
+def test_el_lector_usa_el_pool_como_navegador():
+    pool = _pool()
+    lector = MultiStrategyReader(
+        session=SimpleNamespace(), cheap_strategies=[], browser_pool=pool
+    )
+    try:
+        assert lector.extract("https://ejemplo.test/js") is not None
+        assert lector.domain_strategies == {"ejemplo.test": "Crawl4AI"}
+    finally:
+        lector.close()
@@ -225,3 +225,150 @@ def test_lote_vacio_es_consistente():
 
     assert primera is True, "La primera corrida (aunque vacía) debe procesarse"
     assert segunda is False, "Dos lotes vacíos consecutivos son idénticos: sin cambio"
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Delta por noticia (changed_items / forget / commit)
+# ════════════════════════════════════════════════════════════════════════════
+
+def test_changed_items_solo_devuelve_lo_nuevo_tras_commit():
+    hasher = ContentHasher()
+    n1 = _noticia("Choque en Gonzalitos", url="http://a")
+    n2 = _noticia("Incendio en bodega", url="http://b")
+
+    assert hasher.changed_items([n1]) == [n1]
+    hasher.commit()
+
+    delta = hasher.changed_items([n1, n2])
+    assert delta == [n2], "Solo la noticia nueva debe pasar al resto del pipeline"
+    assert hasher.consecutive_no_change == 0
+
+
+def test_changed_items_sin_delta_incrementa_el_contador():
+    hasher = ContentHasher()
+    lote = [_noticia("Bloqueo en Constitución", url="http://a")]
+    hasher.changed_items(lote)
+    hasher.commit()
+
+    assert hasher.changed_items(lote) == []
+    hasher.commit()
+    assert hasher.changed_items(list(reversed(lote))) == []
+    assert hasher.consecutive_no_change == 2
+
+
+def test_titulo_corregido_en_la_misma_url_cuenta_como_cambio():
+    hasher = ContentHasher()
+    hasher.changed_items([_noticia("Choque en Lincoln", url="http://a")])
+    hasher.commit()
+
+    corregida = _noticia("Choque múltiple en Lincoln deja 3 heridos", url="http://a")
+    assert hasher.changed_items([corregida]) == [corregida]
+
+
+def test_sin_commit_el_delta_se_repite_en_el_siguiente_ciclo():
+    """Si el ciclo revienta antes de commit(), las noticias no se pierden."""
+    hasher = ContentHasher()
+    n = _noticia("Balacera en Escobedo", url="http://a")
+
+    hasher.changed_items([n])
+    assert hasher.changed_items([n]) == [n]
+
+
+def test_forget_hace_que_la_noticia_vuelva_a_reportarse():
+    hasher = ContentHasher()
+    n1 = _noticia("Persecución en Fundadores", url="http://a")
+    n2 = _noticia("Choque en Vasconcelos", url="http://b")
+
+    hasher.changed_items([n1, n2])
+    hasher.forget(n1)  # p.ej. envío a Telegram fallido
+    hasher.commit()
+
+    assert hasher.changed_items([n1, n2]) == [n1]
+
+
+def test_huellas_que_salen_de_los_feeds_expiran():
+    hasher = ContentHasher(max_idle_cycles=2)
+    vieja = _noticia("Nota que sale del feed", url="http://a")
+    otra = _noticia("Otra nota", url="http://b")
+
+    hasher.changed_items([vieja])
+    hasher.commit()
+    for _ in range(3):
+        hasher.changed_items([otra])
+        hasher.commit()
+
+    assert hasher.changed_items([vieja, otra]) == [vieja]
+
+
+def test_pipeline_reintenta_solo_la_alerta_que_fallo():
+    """Con el delta por noticia, un envío fallido debe volver a procesarse
+    en el siguiente ciclo aunque los feeds no cambien."""
+    from unittest.mock import MagicMock
+
+    from app.domain.models import TriageResult
+    from app.services.pipeline import MonitoringPipeline
+
+    nota = _noticia("Balacera cerca de Costco Valle Oriente", url="http://a")
+    source = MagicMock()
+    source.source_name.return_value = "stub"
+    source.collect.return_value = [nota]
+    triage = MagicMock()
+    triage.triage.side_effect = lambda news: [(n, TriageResult()) for n in news]
+    deep = MagicMock()
+    deep.analyze.return_value = MagicMock()
+    notifier = MagicMock()
+    notifier.send_alert.side_effect = [False, True]
+    storage = MagicMock()
+    storage.is_processed.return_value = False
+
+    pipeline = MonitoringPipeline(
+        sources=[source], triage=triage, deep=deep, notifier=notifier,
+        repository=None, file_storage=storage, hasher=ContentHasher(),
+        max_age_hours=999999,
+    )
+
+    assert pipeline.run_once()["alerts"] == 0
+    assert pipeline.run_once()["alerts"] == 1
+    assert notifier.send_alert.call_count == 2
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# Persistencia entre reinicios (state_path)
+# ════════════════════════════════════════════════════════════════════════════
+
+def test_estado_sobrevive_a_un_reinicio(tmp_path):
+    ruta = str(tmp_path / "content_hasher_state.json")
+    lote = [_noticia("Choque en Garza Sada", url="http://a")]
+
+    antes = ContentHasher(state_path=ruta)
+    antes.changed_items(lote)
+    antes.commit()
+    antes.changed_items(lote)
+    antes.commit()
+    assert antes.consecutive_no_change == 1
+
+    despues = ContentHasher(state_path=ruta)  # "reinicio del contenedor"
+    assert despues.consecutive_no_change == 1
+    assert despues.changed_items(lote) == [], (
+        "Tras reiniciar, lo ya visto no debe volver a pasar por dedup/triage"
+    )
+    assert despues.consecutive_no_change == 2
+
+
+def test_delta_sin_commit_no_se_persiste(tmp_path):
+    ruta = str(tmp_path / "content_hasher_state.json")
+    n = _noticia("Incendio en Apodaca", url="http://a")
+
+    ContentHasher(state_path=ruta).changed_items([n])  # ciclo que revienta
+
+    assert ContentHasher(state_path=ruta).changed_items([n]) == [n]
+
+
+def test_estado_corrupto_arranca_de_cero(tmp_path, capsys):
+    ruta = tmp_path / "content_hasher_state.json"
+    ruta.write_text("{no es json", encoding="utf-8")
+
+    hasher = ContentHasher(state_path=str(ruta))
+
+    assert hasher.consecutive_no_change == 0
+    assert "ilegible" in capsys.readouterr().out
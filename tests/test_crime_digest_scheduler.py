@@ -2,8 +2,8 @@
 Tests del digest mensual programado (scheduler) y del sondeo de cortes
 SESNSP (SESNSPMunicipalData.probe_beyond).
 
-Sin red: requests.head va mockeado, generar_digest se reemplaza con
-monkeypatch y el marcador persistente se escribe en tmp_path.
+Sin red: la sesión HTTP (session.head) se inyecta como doble, generar_digest
+se reemplaza con monkeypatch y el marcador persistente se escribe en tmp_path.
 """
 
 from __future__ import annotations
@@ -140,9 +140,10 @@ def test_digest_excepcion_no_propaga_ni_marca(marcador_en_tmp, monkeypatch):
 _URL_DIC25 = "https://repodatos.atdt.gob.mx/api_update/sesnsp/IDM_NM_dic25.csv"
 
 
-def _mock_head(monkeypatch, existentes: set[str]):
-    """requests.head falso: 200 si el archivo está 'publicado', 503 si no
-    (el comportamiento real observado en repodatos.atdt.gob.mx)."""
+def _mock_head(existentes: set[str]):
+    """session.head falso: 200 si el archivo está 'publicado', 503 si no
+    (el comportamiento real observado en repodatos.atdt.gob.mx).
+    Devuelve (sesión inyectable, lista de URLs consultadas)."""
     llamadas = []
 
     def fake_head(url, **kwargs):
@@ -150,23 +151,20 @@ def _mock_head(monkeypatch, existentes: set[str]):
         nombre = url.rsplit("/", 1)[-1]
         return SimpleNamespace(status_code=200 if nombre in existentes else 503)
 
-    monkeypatch.setattr(
-        "app.infrastructure.sources.sesnsp_municipal.requests.head", fake_head
-    )
-    return llamadas
+    return SimpleNamespace(head=fake_head), llamadas
 
 
-def test_probe_beyond_encuentra_el_corte_mas_nuevo(monkeypatch):
-    llamadas = _mock_head(monkeypatch, {"IDM_NM_ene26.csv", "IDM_NM_feb26.csv"})
-    url = SESNSPMunicipalData().probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
+def test_probe_beyond_encuentra_el_corte_mas_nuevo():
+    session, llamadas = _mock_head({"IDM_NM_ene26.csv", "IDM_NM_feb26.csv"})
+    url = SESNSPMunicipalData(session).probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
     assert url.endswith("IDM_NM_feb26.csv")
     # Sondea de ene26 a jun26 (hasta el mes actual, inclusive)
     assert len(llamadas) == 6
 
 
-def test_probe_beyond_sin_cortes_nuevos_conserva_y_avisa_rezago(monkeypatch, capsys):
-    _mock_head(monkeypatch, set())  # nada publicado después de dic25
-    url = SESNSPMunicipalData().probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
+def test_probe_beyond_sin_cortes_nuevos_conserva_y_avisa_rezago(capsys):
+    session, _ = _mock_head(set())  # nada publicado después de dic25
+    url = SESNSPMunicipalData(session).probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
     assert url == _URL_DIC25
     salida = capsys.readouterr().out
     # dic25 vs jun26 = 6 meses de rezago (> 2) → advertencia
@@ -174,26 +172,23 @@ def test_probe_beyond_sin_cortes_nuevos_conserva_y_avisa_rezago(monkeypatch, cap
     assert "dic25" in salida
 
 
-def test_probe_beyond_rezago_normal_no_avisa(monkeypatch, capsys):
+def test_probe_beyond_rezago_normal_no_avisa(capsys):
     """Corte de hace 1 mes (lo normal): sin advertencia de rezago."""
     url_may26 = _URL_DIC25.replace("dic25", "may26")
-    _mock_head(monkeypatch, set())
-    url = SESNSPMunicipalData().probe_beyond(url_may26, hoy=date(2026, 6, 10))
+    session, _ = _mock_head(set())
+    url = SESNSPMunicipalData(session).probe_beyond(url_may26, hoy=date(2026, 6, 10))
     assert url == url_may26
     assert "sin publicar" not in capsys.readouterr().out
 
 
-def test_probe_beyond_url_sin_patron_no_sondea(monkeypatch):
-    head = MagicMock()
-    monkeypatch.setattr(
-        "app.infrastructure.sources.sesnsp_municipal.requests.head", head
-    )
+def test_probe_beyond_url_sin_patron_no_sondea():
+    session = MagicMock()
     url_rara = "https://repodatos.atdt.gob.mx/otro_dataset.csv"
-    assert SESNSPMunicipalData().probe_beyond(url_rara, hoy=date(2026, 6, 10)) == url_rara
-    head.assert_not_called()
+    assert SESNSPMunicipalData(session).probe_beyond(url_rara, hoy=date(2026, 6, 10)) == url_rara
+    session.head.assert_not_called()
 
 
-def test_probe_beyond_tolera_errores_de_red(monkeypatch):
+def test_probe_beyond_tolera_errores_de_red():
     """Un timeout en un mes no aborta el sondeo de los siguientes."""
     import requests as _requests
 
@@ -203,10 +198,8 @@ def test_probe_beyond_tolera_errores_de_red(monkeypatch):
             raise _requests.exceptions.ConnectTimeout("timeout simulado")
         return SimpleNamespace(status_code=200 if nombre == "IDM_NM_feb26.csv" else 503)
 
-    monkeypatch.setattr(
-        "app.infrastructure.sources.sesnsp_municipal.requests.head", fake_head
-    )
-    url = SESNSPMunicipalData().probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
+    session = SimpleNamespace(head=fake_head)
+    url = SESNSPMunicipalData(session).probe_beyond(_URL_DIC25, hoy=date(2026, 6, 10))
     assert url.endswith("IDM_NM_feb26.csv")
 
 
@@ -0,0 +1,141 @@
+"""
+Tests del paso 6 en paralelo (MonitoringPipeline + DeepAnalysisService).
+
+  - las candidatas se analizan a la vez (pool acotado por deep_workers);
+  - cada alerta se notifica apenas termina su análisis, sin esperar a las lentas;
+  - los semáforos por etapa limitan lecturas y llamadas al LLM simultáneas;
+  - RateLimiter espacía las llamadas a Nominatim aunque vengan de varios hilos.
+
+Dobles locales con sleeps cortos — nada toca la red.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from app.domain.models import AnalysisResult, NewsItem, TriageResult
+from app.services.content_hasher import ContentHasher
+from app.services.deep_analysis import DeepAnalysisService
+from app.services.pipeline import MonitoringPipeline
+from app.services.rate_limit import RateLimiter
+
+
+class Concurrencia:
+    """Cuenta cuántas llamadas están en curso a la vez (máximo observado)."""
+
+    def __init__(self, segundos: float) -> None:
+        self._segundos = segundos
+        self._lock = threading.Lock()
+        self.activas = 0
+        self.maximo = 0
+
+    def __call__(self, *args):
+        with self._lock:
+            self.activas += 1
+            self.maximo = max(self.maximo, self.activas)
+        time.sleep(self._segundos)
+        with self._lock:
+            self.activas -= 1
+
+
+def _nota(n: int) -> NewsItem:
+    return NewsItem(titulo=f"Nota {n} en Monterrey", url=f"https://ejemplo.test/{n}", fuente="stub")
+
+
+def _pipeline(notas, deep, notifier, workers: int) -> MonitoringPipeline:
+    source = MagicMock()
+    source.source_name.return_value = "stub"
+    source.collect.return_value = notas
+    triage = MagicMock()
+    triage.triage.side_effect = lambda news: [(n, TriageResult()) for n in news]
+    storage = MagicMock()
+    storage.is_processed.return_value = False
+    return MonitoringPipeline(
+        sources=[source], triage=triage, deep=deep, notifier=notifier,
+        repository=None, file_storage=storage, hasher=ContentHasher(),
+        max_age_hours=999999, deep_workers=workers,
+    )
+
+
+def test_candidatas_en_paralelo_y_alerta_apenas_termina_cada_una():
+    notas = [_nota(i) for i in range(4)]
+    demoras = {notas[0].url: 0.6, notas[1].url: 0.05, notas[2].url: 0.05, notas[3].url: 0.05}
+    enviadas: list[tuple[str, float]] = []
+    inicio = time.monotonic()
+
+    deep = MagicMock()
+    deep.analyze.side_effect = lambda item, triage: time.sleep(demoras[item.url]) or MagicMock(url=item.url)
+    notifier = MagicMock()
+    notifier.send_alert.side_effect = lambda alert: enviadas.append(
+        (alert.url, time.monotonic() - inicio)
+    ) or True
+
+    stats = _pipeline(notas, deep, notifier, workers=4).run_once()
+
+    assert stats["alerts"] == 4
+    transcurrido = time.monotonic() - inicio
+    assert transcurrido < 1.0, "En serie serían ~0.75 s + overhead; en paralelo ≈ la más lenta"
+    # Las rápidas salen antes que la lenta, sin esperarla
+    assert enviadas[-1][0] == notas[0].url
+    assert all(t < 0.4 for url, t in enviadas[:-1])
+
+
+def test_deep_workers_1_conserva_el_orden_secuencial():
+    notas = [_nota(i) for i in range(3)]
+    deep = MagicMock()
+    deep.analyze.side_effect = lambda item, triage: MagicMock(url=item.url)
+    notifier = MagicMock()
+    notifier.send_alert.return_value = True
+
+    _pipeline(notas, deep, notifier, workers=1).run_once()
+
+    assert [c.args[0].url for c in notifier.send_alert.call_args_list] == [n.url for n in notas]
+
+
+def test_semaforos_limitan_lecturas_y_llamadas_ia():
+    lecturas = Concurrencia(0.05)
+    llamadas_ia = Concurrencia(0.05)
+
+    reader = MagicMock()
+    reader.extract.side_effect = lambda url: lecturas(url) or ""
+    ai = MagicMock()
+    ai.deep_analyze.side_effect = lambda titulo, contenido: llamadas_ia() or AnalysisResult(
+        is_relevant=False
+    )
+    servicio = DeepAnalysisService(
+        ai=ai, reader=reader, geo=MagicMock(), reader_concurrency=3, ai_concurrency=1
+    )
+
+    hilos = [
+        threading.Thread(target=servicio.analyze, args=(_nota(i), TriageResult()))
+        for i in range(6)
+    ]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    assert 1 < lecturas.maximo <= 3
+    assert llamadas_ia.maximo == 1
+
+
+def test_rate_limiter_espacia_llamadas_de_varios_hilos():
+    reloj = [0.0]
+    esperas: list[float] = []
+
+    def dormir(segundos: float) -> None:
+        esperas.append(round(segundos, 6))
+        reloj[0] += segundos
+
+    limiter = RateLimiter(1.0, clock=lambda: reloj[0], sleep=dormir)
+    hilos = [threading.Thread(target=limiter.acquire) for _ in range(3)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    # La primera pasa sin esperar; cada siguiente espera su segundo
+    assert esperas == [1.0, 1.0]
+    assert reloj[0] == 2.0
@@ -0,0 +1,277 @@
+"""
+Tests de MultiStrategyReader (app/infrastructure/sources/deep_reader.py).
+
+Las estrategias baratas compiten en paralelo y gana la primera con texto
+suficiente; el navegador solo entra si todas fallan o traen poco. Cada
+dominio recuerda qué estrategia funcionó la última vez — el del medio, no el
+de news.google.com: los enlaces de agregador se resuelven antes de leer.
+
+Con caché (SQLiteKVCache real en tmp_path), una URL ya leída — aunque
+llegue con otros parámetros de rastreo — no vuelve a la red.
+
+Las estrategias se inyectan como funciones falsas — nada toca la red.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+from app.infrastructure.sources.deep_reader import (
+    MAX_CONTENT_LENGTH,
+    MultiStrategyReader,
+    canonical_url,
+)
+
+_LARGO = "Choque múltiple en Constitución a la altura de Costco. " * 20   # ~1100 chars
+_FLACO = "Nota breve sobre un choque en Gonzalitos, sin más detalle. " * 3  # ~180 chars
+_URL = "https://www.ejemplo.test/local/choque-123"
+
+
+class _Estrategia:
+    """Función de extracción falsa que cuenta llamadas y puede tardar."""
+
+    def __init__(self, texto=None, demora=0.0, error=None):
+        self.texto = texto
+        self.demora = demora
+        self.error = error
+        self.llamadas = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        with self.lock:
+            self.llamadas += 1
+        if self.demora:
+            time.sleep(self.demora)
+        if self.error:
+            raise self.error
+        return self.texto
+
+
+def _lector(baratas: dict, navegador=None, **kw) -> MultiStrategyReader:
+    return MultiStrategyReader(
+        session=SimpleNamespace(),
+        cheap_strategies=list(baratas.items()),
+        browser_strategy=("Crawl4AI", navegador or _Estrategia()),
+        **kw,
+    )
+
+
+def test_gana_la_primera_barata_con_contenido_sin_esperar_a_las_lentas():
+    lenta = _Estrategia(_LARGO, demora=2.0)
+    rapida = _Estrategia(_LARGO)
+    navegador = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": lenta, "requests+bs4": rapida}, navegador)
+
+    inicio = time.monotonic()
+    texto = lector.extract(_URL)
+
+    assert texto == _LARGO.strip()[:MAX_CONTENT_LENGTH]
+    assert time.monotonic() - inicio < 1.0
+    assert navegador.llamadas == 0
+    assert lector.domain_strategies == {"ejemplo.test": "requests+bs4"}
+
+
+def test_navegador_solo_si_las_baratas_fallan():
+    navegador = _Estrategia(_LARGO)
+    lector = _lector(
+        {"newspaper3k": _Estrategia(None), "gnews": _Estrategia(error=RuntimeError("403"))},
+        navegador,
+    )
+
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert navegador.llamadas == 1
+    assert lector.domain_strategies["ejemplo.test"] == "Crawl4AI"
+
+
+def test_contenido_flaco_intenta_navegador_y_se_queda_con_el_mas_largo():
+    navegador = _Estrategia(None)
+    lector = _lector({"newspaper3k": _Estrategia(_FLACO)}, navegador)
+
+    # El navegador no trajo nada: el texto flaco sigue siendo mejor que nada
+    assert lector.extract(_URL) == _FLACO.strip()
+    assert navegador.llamadas == 1
+
+
+def test_menos_de_100_caracteres_no_cuenta():
+    lector = _lector({"newspaper3k": _Estrategia("Ver video")}, _Estrategia("Cargando..."))
+    assert lector.extract(_URL) is None
+    assert lector.domain_strategies == {}
+
+
+def test_el_dominio_recuerda_la_estrategia_ganadora_y_la_usa_sola():
+    newspaper = _Estrategia(None)
+    bs4 = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": newspaper, "requests+bs4": bs4})
+    lector.extract(_URL)
+    newspaper.llamadas = bs4.llamadas = 0
+
+    lector.extract("https://ejemplo.test/otra-nota")
+
+    assert bs4.llamadas == 1
+    assert newspaper.llamadas == 0  # no hizo falta la carrera
+
+
+def test_dominio_que_necesita_navegador_va_directo():
+    barata = _Estrategia(None)
+    navegador = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": barata}, navegador)
+    lector.extract(_URL)
+    barata.llamadas = navegador.llamadas = 0
+
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert navegador.llamadas == 1
+    assert barata.llamadas == 0
+
+
+def test_si_la_recordada_falla_se_corre_la_carrera_completa():
+    newspaper = _Estrategia(_LARGO)
+    gnews = _Estrategia(None)
+    lector = _lector({"newspaper3k": newspaper, "gnews": gnews})
+    lector._winners["ejemplo.test"] = "gnews"
+
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert lector.domain_strategies["ejemplo.test"] == "newspaper3k"
+
+
+def test_timeout_de_la_carrera_pasa_al_navegador():
+    navegador = _Estrategia(_LARGO)
+    lector = _lector(
+        {"newspaper3k": _Estrategia(_LARGO, demora=1.0)}, navegador, race_timeout_secs=0.05
+    )
+
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert navegador.llamadas == 1
+
+
+def test_timeout_de_la_carrera_es_uno_solo_para_todas():
+    # Cada estrategia termina antes del timeout, pero todas juntas lo pasan
+    lector = _lector(
+        {f"flaca{i}": _Estrategia(_FLACO, demora=0.1 * (i + 1)) for i in range(6)},
+        _Estrategia(_LARGO),
+        race_timeout_secs=0.25,
+    )
+
+    inicio = time.monotonic()
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert time.monotonic() - inicio < 0.45
+
+
+# ── Enlaces de Google News ───────────────────────────────────
+
+
+_GOOGLE_A = "https://news.google.com/rss/articles/CBMiAAA?oc=5"
+_GOOGLE_B = "https://news.google.com/rss/articles/CBMiBBB?oc=5"
+
+
+class _PorUrl(_Estrategia):
+    """Estrategia que solo trae texto para las URLs de un medio."""
+
+    def __init__(self, prefijo):
+        super().__init__(_LARGO)
+        self.prefijo = prefijo
+        self.urls = []
+
+    def __call__(self, url):
+        self.urls.append(url)
+        return super().__call__(url) if url.startswith(self.prefijo) else None
+
+
+def test_google_news_recuerda_el_dominio_de_cada_medio():
+    resuelve = {_GOOGLE_A: "https://www.milenio.com/policia/choque-1",
+                _GOOGLE_B: "https://www.elnorte.com/local/incendio-2"}.get
+    newspaper = _PorUrl("https://www.milenio.com")
+    bs4 = _PorUrl("https://www.elnorte.com")
+    lector = _lector({"newspaper3k": newspaper, "requests+bs4": bs4}, resolver=resuelve)
+
+    assert lector.extract(_GOOGLE_A) == _LARGO.strip()
+    assert lector.extract(_GOOGLE_B) == _LARGO.strip()
+
+    # Las estrategias leen la URL del medio, y cada medio guarda su ganadora
+    assert newspaper.urls[0] == "https://www.milenio.com/policia/choque-1"
+    assert lector.domain_strategies == {"milenio.com": "newspaper3k", "elnorte.com": "requests+bs4"}
+
+
+def test_google_news_sin_resolver_no_recuerda_ganadora():
+    newspaper = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": newspaper}, resolver=lambda url: None)
+
+    assert lector.extract(_GOOGLE_A) == _LARGO.strip()
+    assert lector.domain_strategies == {}
+
+
+def test_resolucion_por_enlace_en_la_pagina_intermedia():
+    pagina = SimpleNamespace(
+        url=_GOOGLE_A,
+        text='<c-wiz><a data-n-au="https://www.milenio.com/policia/choque-1">Milenio</a></c-wiz>',
+    )
+    sesion = SimpleNamespace(get=lambda url, **kw: pagina)
+    lector = MultiStrategyReader(session=sesion, cheap_strategies=[("newspaper3k", _Estrategia(_LARGO))],
+                                 browser_strategy=("Crawl4AI", _Estrategia()))
+
+    lector.extract(_GOOGLE_A)
+
+    assert lector.domain_strategies == {"milenio.com": "newspaper3k"}
+
+
+# ── Caché de extracción ──────────────────────────────────────
+
+
+def test_canonical_url_ignora_rastreo_fragmento_y_www():
+    a = "https://www.Ejemplo.test/local/nota-1/?utm_source=gn&id=7&fbclid=xyz#comentarios"
+    b = "http://ejemplo.test/local/nota-1?id=7"
+    assert canonical_url(a) == canonical_url(b) == "https://ejemplo.test/local/nota-1?id=7"
+    assert canonical_url("https://ejemplo.test/nota?id=8") != canonical_url(b)
+
+
+def test_cache_evita_la_red_al_releer(tmp_path):
+    cache = SQLiteKVCache(str(tmp_path / "cache.db"), namespace="extract")
+    newspaper = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": newspaper}, cache=cache)
+
+    primero = lector.extract(_URL + "?utm_medium=rss")
+    segundo = lector.extract(_URL)
+
+    assert primero == segundo == _LARGO.strip()
+    assert newspaper.llamadas == 1
+    assert cache.get(canonical_url(_URL))["strategy"] == "newspaper3k"
+
+
+def test_cache_sobrevive_al_reinicio(tmp_path):
+    ruta = str(tmp_path / "cache.db")
+    _lector({"newspaper3k": _Estrategia(_LARGO)},
+            cache=SQLiteKVCache(ruta, namespace="extract")).extract(_URL)
+
+    newspaper = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": newspaper}, cache=SQLiteKVCache(ruta, namespace="extract"))
+
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert newspaper.llamadas == 0
+
+
+def test_extraccion_fallida_no_se_cachea(tmp_path):
+    cache = SQLiteKVCache(str(tmp_path / "cache.db"), namespace="extract")
+    newspaper = _Estrategia(None)
+    lector = _lector({"newspaper3k": newspaper}, cache=cache)
+
+    assert lector.extract(_URL) is None
+    newspaper.texto = _LARGO
+    assert lector.extract(_URL) == _LARGO.strip()
+    assert newspaper.llamadas == 2
+
+
+def test_cache_por_url_del_medio_entre_enlaces_de_google_distintos(tmp_path):
+    cache = SQLiteKVCache(str(tmp_path / "cache.db"), namespace="extract")
+    medio = "https://www.milenio.com/policia/choque-1"
+    resuelve = {_GOOGLE_A: medio, _GOOGLE_B: medio + "?utm_source=gn"}.get
+    newspaper = _Estrategia(_LARGO)
+    lector = _lector({"newspaper3k": newspaper}, cache=cache, resolver=resuelve)
+
+    assert lector.extract(_GOOGLE_A) == _LARGO.strip()
+    assert lector.extract(_GOOGLE_B) == _LARGO.strip()
+
+    assert newspaper.llamadas == 1
+    assert cache.get(canonical_url(medio))["strategy"] == "newspaper3k"
+    assert cache.get(canonical_url(_GOOGLE_B))["strategy"] == "newspaper3k"
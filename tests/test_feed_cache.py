@@ -0,0 +1,106 @@
+"""
+Tests de FeedCache (app/infrastructure/sources/feed_cache.py).
+
+GET condicional por URL: guarda ETag/Last-Modified, los reenvía como
+If-None-Match/If-Modified-Since y ante un 304 devuelve las entries ya
+parseadas sin volver a llamar a feedparser.
+
+La sesión HTTP se inyecta como doble (respuestas sintéticas) — nada toca la red.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+import app.infrastructure.sources.feed_cache as feed_cache_mod
+from app.infrastructure.sources.feed_cache import FeedCache
+
+_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>Choque en Fundadores</title><link>https://ejemplo.test/1</link></item>
+<item><title>Incendio en Valle Oriente</title><link>https://ejemplo.test/2</link></item>
+</channel></rss>"""
+
+_URL = "https://ejemplo.test/rss.xml"
+
+
+def _respuesta(status: int, content: bytes = b"", headers: dict | None = None):
+    resp = SimpleNamespace(status_code=status, content=content, headers=headers or {})
+
+    def raise_for_status():
+        if status >= 400:
+            raise requests.HTTPError(f"{status}")
+
+    resp.raise_for_status = raise_for_status
+    return resp
+
+
+@pytest.fixture
+def fake_get():
+    return MagicMock()
+
+
+def _cache(fake_get) -> FeedCache:
+    return FeedCache(session=SimpleNamespace(get=fake_get))
+
+
+def test_primera_descarga_parsea_y_no_manda_validadores(fake_get):
+    fake_get.return_value = _respuesta(200, _RSS, {"ETag": '"v1"'})
+    cache = _cache(fake_get)
+
+    entries = cache.fetch_entries(_URL, headers={"User-Agent": "ua"})
+
+    assert [e.title for e in entries] == ["Choque en Fundadores", "Incendio en Valle Oriente"]
+    enviados = fake_get.call_args.kwargs["headers"]
+    assert enviados == {"User-Agent": "ua"}
+    assert cache.misses == 1
+
+
+def test_304_devuelve_entries_previas_sin_reparsear(fake_get, monkeypatch):
+    fake_get.return_value = _respuesta(
+        200, _RSS, {"ETag": '"v1"', "Last-Modified": "Wed, 10 Jun 2026 10:00:00 GMT"}
+    )
+    cache = _cache(fake_get)
+    primeras = cache.fetch_entries(_URL)
+
+    parse = MagicMock()
+    monkeypatch.setattr(feed_cache_mod.feedparser, "parse", parse)
+    fake_get.return_value = _respuesta(304)
+
+    segundas = cache.fetch_entries(_URL)
+
+    enviados = fake_get.call_args.kwargs["headers"]
+    assert enviados["If-None-Match"] == '"v1"'
+    assert enviados["If-Modified-Since"] == "Wed, 10 Jun 2026 10:00:00 GMT"
+    parse.assert_not_called()
+    assert [e.title for e in segundas] == [e.title for e in primeras]
+    assert cache.hits == 1
+
+
+def test_feed_sin_validadores_no_se_guarda(fake_get):
+    fake_get.return_value = _respuesta(200, _RSS)
+    cache = _cache(fake_get)
+    cache.fetch_entries(_URL)
+    cache.fetch_entries(_URL)
+
+    assert "If-None-Match" not in fake_get.call_args.kwargs["headers"]
+    assert cache.misses == 2
+
+
+def test_error_http_se_propaga_como_raise_for_status(fake_get):
+    fake_get.return_value = _respuesta(503)
+    with pytest.raises(requests.HTTPError):
+        _cache(fake_get).fetch_entries(_URL)
+
+
+def test_modificar_la_lista_devuelta_no_altera_la_cache(fake_get):
+    fake_get.return_value = _respuesta(200, _RSS, {"ETag": '"v1"'})
+    cache = _cache(fake_get)
+    cache.fetch_entries(_URL).clear()
+
+    fake_get.return_value = _respuesta(304)
+    assert len(cache.fetch_entries(_URL)) == 2
@@ -120,3 +120,39 @@ def test_archivo_inexistente_arranca_vacio(tmp_path):
     fs = FileStorage(str(tmp_path / "no-existe.txt"))
     assert fs._order == []
     assert fs.cleanup(max_entries=5) == 0
+
+
+# ============================================================
+# mark_processed_many — un solo open + fsync por lote
+# ============================================================
+
+def test_mark_processed_many_escribe_el_lote_en_una_sola_apertura(tmp_path, monkeypatch):
+    import builtins
+    import os
+
+    fs = FileStorage(str(tmp_path / "processed_urls.txt"))
+    fs.mark_processed("https://ejemplo.test/previa")
+
+    aperturas, fsyncs = [], []
+    open_real, fsync_real = builtins.open, os.fsync
+    monkeypatch.setattr(builtins, "open", lambda *a, **k: aperturas.append(a) or open_real(*a, **k))
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync_real(fd))
+
+    urls = _urls(100)
+    fs.mark_processed_many(urls + ["https://ejemplo.test/previa", "", urls[0]])
+
+    assert len(aperturas) == 1
+    assert len(fsyncs) == 1
+    assert (tmp_path / "processed_urls.txt").read_text(
+        encoding="utf-8"
+    ).splitlines() == ["https://ejemplo.test/previa"] + urls
+
+
+def test_mark_processed_many_sin_urls_nuevas_no_toca_el_archivo(tmp_path):
+    fs = _storage_con(tmp_path, _urls(2))
+    archivo = tmp_path / "processed_urls.txt"
+    antes = archivo.stat().st_mtime_ns
+
+    fs.mark_processed_many(_urls(2))
+
+    assert archivo.stat().st_mtime_ns == antes
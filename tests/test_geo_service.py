@@ -198,7 +198,7 @@ def test_fallback_de_zona_usa_la_coincidencia_mas_especifica():
     with mock.patch("app.services.geo_service.Nominatim") as nominatim_cls:
         # Nominatim mockeado: nunca toca red y "falla" para forzar el fallback
         nominatim_cls.return_value.geocode.return_value = None
-        geocoder = NominatimGeocoder()
+        geocoder = NominatimGeocoder(min_interval_secs=0)
 
         with mock.patch.dict(
             "app.services.geo_service.ZONE_COORDS", zonas_sinteticas, clear=True
@@ -217,7 +217,7 @@ def test_texto_monterrey_generico_no_geolocaliza_por_fallback():
     del radio de Valle Oriente."""
     with mock.patch("app.services.geo_service.Nominatim") as nominatim_cls:
         nominatim_cls.return_value.geocode.return_value = None
-        geocoder = NominatimGeocoder()
+        geocoder = NominatimGeocoder(min_interval_secs=0)
 
         coords = geocoder.geocode("Monterrey")
 
@@ -252,7 +252,7 @@ def test_geocodificador_si_consulta_nominatim_antes_del_fallback():
     with mock.patch("app.services.geo_service.Nominatim") as nominatim_cls:
         resultado_nominatim = mock.Mock(latitude=25.65, longitude=-100.33)
         nominatim_cls.return_value.geocode.return_value = resultado_nominatim
-        geocoder = NominatimGeocoder()
+        geocoder = NominatimGeocoder(min_interval_secs=0)
 
         coords = geocoder.geocode("Av Lázaro Cárdenas 800, San Pedro")
 
@@ -271,7 +271,7 @@ def test_fallback_de_zona_aplica_tambien_cuando_nominatim_lanza_excepcion():
         nominatim_cls.return_value.geocode.side_effect = RuntimeError(
             "timeout sintético de Nominatim"
         )
-        geocoder = NominatimGeocoder()
+        geocoder = NominatimGeocoder(min_interval_secs=0)
 
         coords = geocoder.geocode("operativo en Santa Catarina")
 
@@ -436,3 +436,190 @@ def test_solo_se_monitorean_tiendas_activas():
     assert len(activos) < len(COSTCO_LOCATIONS), (
         "Debe haber al menos una tienda inactiva filtrada"
     )
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# CachedGeocoder — caché persistente de geocodificación (positivos y negativos)
+# ════════════════════════════════════════════════════════════════════════════
+
+class CacheEnMemoria:
+    """Doble del puerto KeyValueCache: dict + TTLs registrados."""
+
+    def __init__(self) -> None:
+        self.datos: dict = {}
+        self.ttls: dict = {}
+
+    def get(self, key):
+        return self.datos.get(key)
+
+    def set(self, key, value, ttl_secs):
+        self.datos[key] = value
+        self.ttls[key] = ttl_secs
+
+
+def test_cached_geocoder_resuelve_repetidas_sin_llamar_al_geocoder():
+    from app.services.geo_service import CachedGeocoder
+
+    interno = GeocoderFalso(CENTRO_MONTERREY)
+    cache = CacheEnMemoria()
+    geocoder = CachedGeocoder(interno, cache, ttl_secs=100, negative_ttl_secs=10)
+
+    assert geocoder.geocode("Av. Lázaro Cárdenas") == CENTRO_MONTERREY
+    # Mismo lugar escrito distinto → misma clave canónica
+    assert geocoder.geocode("avenida lazaro cardenas") == CENTRO_MONTERREY
+    assert interno.llamadas == ["Av. Lázaro Cárdenas"]
+    assert cache.ttls == {"avenida lazaro cardenas": 100}
+
+
+def test_cached_geocoder_cachea_negativos_con_ttl_corto():
+    from app.services.geo_service import CachedGeocoder
+
+    interno = GeocoderFalso(None)
+    cache = CacheEnMemoria()
+    geocoder = CachedGeocoder(interno, cache, ttl_secs=100, negative_ttl_secs=10)
+
+    assert geocoder.geocode("Colonia Inexistente") is None
+    assert geocoder.geocode("colonia inexistente") is None
+    assert len(interno.llamadas) == 1
+    assert cache.ttls == {"colonia inexistente": 10}
+
+
+def test_cached_geocoder_no_cachea_tras_error_de_red():
+    from app.services.geo_service import CachedGeocoder
+
+    nominatim = NominatimGeocoder(min_interval_secs=0)
+    cache = CacheEnMemoria()
+    geocoder = CachedGeocoder(nominatim, cache)
+
+    with mock.patch.object(nominatim._geocoder, "geocode", side_effect=TimeoutError("timeout")):
+        assert geocoder.geocode("Lugar sin zona conocida") is None
+
+    assert nominatim.last_lookup_errored
+    assert cache.datos == {}
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# GazetteerGeocoder — primer nivel offline, Nominatim solo como respaldo
+# ════════════════════════════════════════════════════════════════════════════
+
+def test_gazetteer_resuelve_punto_conocido_sin_llamar_al_fallback():
+    from app.services.geo_service import GazetteerGeocoder
+
+    respaldo = GeocoderFalso(SALTILLO)
+    geocoder = GazetteerGeocoder(fallback=respaldo)
+
+    coords = geocoder.geocode("Choque frente a Plaza Fiesta San Agustin, Av. Lázaro Cárdenas")
+
+    assert coords == (25.6494, -100.3353)
+    assert respaldo.llamadas == []
+
+
+def test_gazetteer_prefiere_el_lugar_mas_preciso():
+    from app.config.gazetteer import Place
+    from app.services.geo_service import GazetteerGeocoder
+
+    geocoder = GazetteerGeocoder([
+        Place("colonia centro", 25.0, -100.0, "colonia", 1.0),
+        Place("museo de prueba", 25.5, -100.5, "punto", 0.1),
+    ])
+    assert geocoder.geocode("Colonia Centro, junto al Museo de Prueba") == (25.5, -100.5)
+
+
+def test_gazetteer_delega_lo_desconocido_y_lo_impreciso():
+    from app.config.gazetteer import Place
+    from app.services.geo_service import GazetteerGeocoder
+
+    respaldo = GeocoderFalso(CENTRO_MONTERREY)
+    geocoder = GazetteerGeocoder(
+        [Place("avenida larga", 25.0, -100.0, "calle", 8.0)],
+        fallback=respaldo,
+        max_extent_km=1.5,
+    )
+
+    assert geocoder.geocode("Avenida Larga y calle 5") == CENTRO_MONTERREY
+    assert geocoder.geocode("Tampico, Tamaulipas") == CENTRO_MONTERREY
+    assert len(respaldo.llamadas) == 2
+    assert GazetteerGeocoder([]).geocode("Tampico") is None
+
+
+def test_gazetteer_colonia_con_calle_prefiere_el_resultado_remoto():
+    from app.services.geo_service import GazetteerGeocoder
+
+    calle = (25.6421, -100.3170)
+    respaldo = GeocoderFalso(calle)
+    geocoder = GazetteerGeocoder(fallback=respaldo)
+
+    assert geocoder.geocode("Av. Lázaro Cárdenas 1000, col. Valle Oriente") == calle
+    # Solo la colonia: el centroide basta, sin red
+    assert geocoder.geocode("Choque en Valle Oriente") == (25.6397, -100.3176)
+    assert len(respaldo.llamadas) == 1
+
+
+def test_gazetteer_colonia_con_calle_sin_resultado_remoto_usa_el_centroide():
+    from app.services.geo_service import GazetteerGeocoder
+
+    geocoder = GazetteerGeocoder(fallback=GeocoderFalso(None))
+
+    assert geocoder.geocode("Calle Río Nazas, colonia del Valle") == (25.6560, -100.3620)
+
+
+def test_gazetteer_no_aplica_si_el_texto_nombra_otra_ciudad():
+    from app.services.geo_service import GazetteerGeocoder
+
+    cdmx = (19.3720, -99.1650)
+    respaldo = GeocoderFalso(cdmx)
+    geocoder = GazetteerGeocoder(fallback=respaldo)
+
+    # "Colonia del Valle" también existe en la CDMX: no es la de San Pedro
+    assert geocoder.geocode("Asalto en Colonia del Valle, CDMX") == cdmx
+    assert geocoder.lookup("Colonia del Valle, Ciudad de México") is None
+    # "Carretera a Saltillo" es una vía de NL, no otra ciudad
+    assert geocoder.lookup("Choque en Valle Alto, carretera a Saltillo").name == "valle alto"
+    assert len(respaldo.llamadas) == 1
+
+
+def test_gazetteer_respeta_limites_de_palabra():
+    from app.services.geo_service import GazetteerGeocoder
+
+    assert GazetteerGeocoder().lookup("Macroplazas del norte") is None
+
+
+def test_gazetteer_carga_tsv_adicional(tmp_path):
+    from app.services.geo_service import GazetteerGeocoder
+
+    tsv = tmp_path / "osm.tsv"
+    tsv.write_text(
+        "# nombre\tlat\tlon\ttipo\textensión\n"
+        "Parque Rufino Tamayo\t25.6560\t-100.3680\tpunto\t0.3\n"
+        "fila rota\tx\n",
+        encoding="utf-8",
+    )
+    geocoder = GazetteerGeocoder.load_tsv(str(tsv))
+
+    assert geocoder.geocode("Incendio en el parque Rufino Tamayo") == (25.656, -100.368)
+    assert geocoder.lookup("Macroplaza").name == "macroplaza"
+
+
+def test_build_gazetteer_convierte_overpass_y_descarta_nombres_ambiguos():
+    from build_gazetteer import element_to_place, to_tsv, unambiguous
+
+    elementos = [
+        {"type": "way", "tags": {"name": "Colonia Contry", "place": "neighbourhood"},
+         "bounds": {"minlat": 25.630, "minlon": -100.285, "maxlat": 25.640, "maxlon": -100.275}},
+        {"type": "node", "lat": 25.651, "lon": -100.289, "tags": {"name": "Hospital Zambrano", "amenity": "hospital"}},
+        # "Centro" en dos municipios lejanos: ambiguo
+        {"type": "node", "lat": 25.670, "lon": -100.310, "tags": {"name": "Centro", "place": "suburb"}},
+        {"type": "node", "lat": 25.780, "lon": -100.190, "tags": {"name": "Centro", "place": "suburb"}},
+        {"type": "node", "lat": 25.7, "lon": -100.3, "tags": {"amenity": "hospital"}},  # sin nombre
+    ]
+    lugares = unambiguous(filter(None, map(element_to_place, elementos)))
+
+    assert [(p.name, p.kind) for p in lugares] == [
+        ("Colonia Contry", "colonia"),
+        ("Hospital Zambrano", "punto"),
+    ]
+    assert 0.6 < lugares[0].extent_km < 0.8  # media diagonal del bounding box
+    assert lugares[1].extent_km == 0.3
+
+    tsv = to_tsv(lugares)
+    assert tsv.splitlines()[1] == "Colonia Contry\t25.635\t-100.28\tcolonia\t" + str(lugares[0].extent_km)
@@ -0,0 +1,44 @@
+"""
+Tests de la sesión HTTP compartida (app/infrastructure/http.py).
+
+Solo configuración: ningún request sale a la red (HTTPAdapter.send se
+reemplaza por un doble que registra los kwargs).
+"""
+
+from __future__ import annotations
+
+from requests.adapters import HTTPAdapter
+
+from app.infrastructure import http
+
+
+def test_build_session_monta_adapter_con_reintentos_y_pool():
+    session = http.build_session(retries=3, backoff_factor=0.2, pool_maxsize=7)
+    adapter = session.get_adapter("https://news.google.com/rss")
+
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.2
+    assert 429 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    assert adapter._pool_maxsize == 7
+
+
+def test_timeout_por_default_solo_si_el_llamador_no_pasa_uno(monkeypatch):
+    enviados = []
+
+    def fake_send(self, request, **kwargs):
+        enviados.append(kwargs.get("timeout"))
+        return "ok"
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    adapter = http._TimeoutAdapter(timeout=12.5)
+
+    adapter.send(object())
+    adapter.send(object(), timeout=3)
+
+    assert enviados == [12.5, 3]
+
+
+def test_shared_session_es_unica(monkeypatch):
+    monkeypatch.setattr(http, "_shared", None)
+    assert http.shared_session() is http.shared_session()
@@ -0,0 +1,94 @@
+"""
+Tests del matcher de keywords (app/config/keywords.py).
+
+Un solo regex compilado al importar: devuelve todas las categorías y
+exclusiones en una pasada, ignora acentos y conserva la semántica de
+check_high_impact (exclusiones primero, luego la primera categoría del
+diccionario).
+"""
+
+from __future__ import annotations
+
+import re
+
+from app.config.keywords import (
+    IMPACT_KEYWORDS,
+    _KeywordMatcher,
+    check_high_impact,
+    match_keywords,
+)
+from app.domain.text import normalize, trie_regex
+
+
+def test_devuelve_todas_las_categorias_en_orden_del_diccionario():
+    r = match_keywords("Bloqueo por manifestación tras balacera y choque en Constitución")
+    assert r.categories == ("accidente_vial", "seguridad", "bloqueo")
+    assert r.exclusions == ()
+
+
+def test_acentos_indistintos_en_texto_y_diccionario():
+    assert check_high_impact("Reportan RAFAGAS en Guadalupe") == (True, "seguridad")
+    assert check_high_impact("Colision en Gonzalitos") == (True, "accidente_vial")
+    assert check_high_impact("Inundacion en avenida Morones Prieto") == (True, "desastre_natural")
+
+
+def test_exclusion_gana_sobre_categorias():
+    r = match_keywords("Actor sufre choque en CDMX")
+    assert r.categories == ("accidente_vial",)
+    assert r.exclusions == ("actor", "cdmx")
+    assert check_high_impact("Actor sufre choque en CDMX") == (False, None)
+
+
+def test_palabra_prefijo_de_otra_mas_larga_tambien_cuenta():
+    """"cierre de avenida" (accidente_vial) contiene "cierre" (bloqueo) en la misma posición."""
+    r = match_keywords("Anuncian cierre de avenida Lázaro Cárdenas")
+    assert "accidente_vial" in r.categories
+    assert "bloqueo" in r.categories
+
+
+def test_coincidencias_traslapadas_se_reportan():
+    # "edificio en llamas" y "llamas" empiezan en posiciones distintas
+    r = match_keywords("Edificio en llamas en el centro")
+    assert r.categories == ("incendio",)
+
+
+def test_sin_coincidencias():
+    assert match_keywords("Inauguran parque en Escobedo").categories == ()
+    assert check_high_impact("") == (False, None)
+
+
+def test_mismo_resultado_que_el_escaneo_lineal():
+    textos = [
+        "Choque y tráiler volcado en carretera a Laredo",
+        "Incendio en bodega; bomberos controlan las llamas",
+        "Protesta cerrada en Pesquería",
+        "Hombres armados y detonaciones en San Nicolás",
+        "Granizada y tromba en Apodaca",
+    ]
+    for texto in textos:
+        norm = normalize(texto)
+        esperado = next(
+            (cat for cat, words in IMPACT_KEYWORDS.items()
+             if any(normalize(w) in norm for w in words)),
+            None,
+        )
+        assert match_keywords(texto).categories[:1] == ((esperado,) if esperado else ())
+
+
+def test_escala_a_miles_de_keywords():
+    impacto = {"zona": [f"colonia {i}" for i in range(5000)]}
+    matcher = _KeywordMatcher(impacto, [f"municipio {i}" for i in range(5000)])
+
+    r = matcher.match("Choque en colonia 4321 cerca de municipio 17")
+
+    assert r.categories == ("zona",)
+    # Semántica de subcadena: "municipio 1" también está contenido en el texto
+    assert r.exclusions == ("municipio 1", "municipio 17")
+
+
+def test_trie_regex_prefiere_la_palabra_mas_larga():
+    patron = re.compile(trie_regex(["cierre", "cierre de avenida", "a.b"]))
+    assert patron.match("cierre de avenida norte").group(0) == "cierre de avenida"
+    assert patron.match("a.b").group(0) == "a.b"
+    assert patron.match("axb") is None
+    assert re.compile(trie_regex([])).search("lo que sea") is None
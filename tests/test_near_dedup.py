@@ -0,0 +1,125 @@
+"""
+Tests de NearDuplicateClusterer (app/services/near_dedup.py).
+
+Agrupa copias casi idénticas de una misma historia (titular reescrito,
+sufijo de medio distinto, acentos) y deja separadas las notas distintas,
+incluso cuando solo cambia la vialidad. La memoria entre ciclos reconoce una
+historia ya decidida aunque la reescritura llegue después, hasta que vence.
+"""
+
+from __future__ import annotations
+
+from app.domain.models import NewsItem
+from app.services.near_dedup import NearDuplicateClusterer, jaccard, minhash, shingles
+
+
+def _nota(titulo: str, contenido: str = "", fuente: str = "stub") -> NewsItem:
+    return NewsItem(titulo=titulo, contenido=contenido, fuente=fuente)
+
+
+def _titulos(clusters) -> list[list[str]]:
+    return [[n.titulo for n in c] for c in clusters]
+
+
+def test_sufijo_de_medio_y_acentos_no_separan_la_historia():
+    a = _nota("Choque en avenida Fundadores deja dos heridos - Milenio")
+    b = _nota("Choque en Avenida Fundadores deja dos heridos - El Norte")
+    c = _nota("Choque en avenida Fundadóres deja dos heridos")
+
+    clusters = NearDuplicateClusterer().cluster([a, b, c])
+
+    assert len(clusters) == 1
+    assert clusters[0][0] is a, "El representativo es la primera del lote"
+
+
+def test_titular_ampliado_se_agrupa():
+    a = _nota("Balacera en San Pedro Garza García deja un muerto")
+    b = _nota("Balacera en San Pedro Garza García deja un muerto y un herido")
+    assert len(NearDuplicateClusterer().cluster([a, b])) == 1
+
+
+def test_misma_plantilla_en_otra_vialidad_no_se_agrupa():
+    a = _nota("Choque en avenida Fundadores deja dos heridos")
+    b = _nota("Choque en avenida Constitución deja dos heridos")
+    assert len(NearDuplicateClusterer().cluster([a, b])) == 2
+
+
+def test_orden_del_lote_y_de_los_clusters_se_conserva():
+    notas = [
+        _nota("Incendio consume bodega en Santa Catarina"),
+        _nota("Bloqueo en carretera a Laredo por manifestación"),
+        _nota("Incendio consume bodega en Santa Catarina - ABC Noticias"),
+    ]
+    assert _titulos(NearDuplicateClusterer().cluster(notas)) == [
+        [notas[0].titulo, notas[2].titulo],
+        [notas[1].titulo],
+    ]
+
+
+def test_sin_encadenamiento_solo_se_compara_contra_representativos():
+    """B se parece a A y a C, pero A y C no se parecen: C abre su propio cluster."""
+    a = _nota("uno dos tres cuatro cinco")
+    b = _nota("uno dos tres cuatro cinco seis")
+    c = _nota("uno dos tres cuatro cinco seis siete")
+    # Umbral 0.8: A~B (5/6), B~C (6/7), A≁C (5/7)
+    clusters = NearDuplicateClusterer(threshold=0.8).cluster([a, b, c])
+    assert _titulos(clusters) == [[a.titulo, b.titulo], [c.titulo]]
+
+
+def test_snippet_cuenta_para_la_similitud():
+    a = _nota("Accidente en Gonzalitos", "Un tráiler volcó frente a la clínica 25 del IMSS")
+    b = _nota("Accidente en Gonzalitos", "Se reporta choque leve entre dos autos particulares")
+    assert len(NearDuplicateClusterer().cluster([a, b])) == 2
+
+
+def test_titulo_vacio_no_se_agrupa_con_nada():
+    notas = [_nota(""), _nota("")]
+    assert len(NearDuplicateClusterer().cluster(notas)) == 2
+
+
+def test_firma_determinista_y_coherente_con_jaccard():
+    a = shingles(_nota("Choque en avenida Fundadores deja dos heridos"))
+    b = shingles(_nota("Choque múltiple en avenida Fundadores deja dos heridos"))
+    assert minhash(a) == minhash(a)
+
+    sig_a, sig_b = minhash(a), minhash(b)
+    estimado = sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+    assert abs(estimado - jaccard(a, b)) < 0.25
+
+
+# ── Memoria entre ciclos ─────────────────────────────────────
+
+_DIA = 86400
+
+
+def test_memoria_reconoce_la_historia_en_otro_ciclo_y_sobrevive_al_reinicio(tmp_path):
+    ruta = str(tmp_path / "near_dup_state.json")
+    NearDuplicateClusterer(state_path=ruta).remember(
+        [_nota("Choque en avenida Fundadores deja dos heridos - Milenio")]
+    )
+
+    reiniciado = NearDuplicateClusterer(state_path=ruta)
+
+    assert reiniciado.recent_match(_nota("Choque en Avenida Fundadores deja dos heridos - El Norte")) == (
+        "Choque en avenida Fundadores deja dos heridos - Milenio"
+    )
+    assert reiniciado.recent_match(_nota("Choque en avenida Constitución deja dos heridos")) is None
+
+
+def test_memoria_vence_por_ttl_y_respeta_el_tope(reloj):
+    dedup = NearDuplicateClusterer(memory_ttl_secs=_DIA, memory_size=2, clock=reloj)
+    vieja = _nota("Incendio consume bodega en Santa Catarina")
+    dedup.remember([vieja])
+
+    reloj.t += 2 * _DIA
+    assert dedup.recent_match(vieja) is None
+
+    notas = [_nota(f"Bloqueo número {i} en carretera a Laredo por manifestación") for i in ("uno", "dos", "tres")]
+    dedup.remember(notas)
+    assert [dedup.recent_match(n) is not None for n in notas] == [False, True, True]
+
+
+def test_memoria_ilegible_empieza_de_cero(tmp_path):
+    ruta = tmp_path / "near_dup_state.json"
+    ruta.write_text("{no es json", encoding="utf-8")
+    assert NearDuplicateClusterer(state_path=str(ruta)).recent_match(_nota("Choque en Gonzalitos")) is None
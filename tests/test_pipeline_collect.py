@@ -0,0 +1,174 @@
+"""
+Tests de MonitoringPipeline._collect — recolección concurrente con plazo global.
+
+Las fuentes son dobles locales (sin red) que duermen para simular latencia:
+  - el paso 1 dura lo que la fuente más lenta, no la suma;
+  - una fuente que excede collect_timeout_secs se omite y el resto llega;
+  - el lote respeta el orden de las fuentes (no el de llegada);
+  - un error en una fuente no tumba la recolección de las demás;
+  - el deadline llega a cada fuente, que devuelve sus resultados parciales
+    (p. ej. Nitter con una cuenta colgada entrega los tweets de las demás).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+from unittest.mock import MagicMock
+
+from app.domain.models import NewsItem
+from app.domain.ports import NewsSource
+from app.infrastructure.sources.nitter_source import TWITTER_ACCOUNTS, NitterSource
+from app.infrastructure.sources.parallel import map_until
+from app.services.content_hasher import ContentHasher
+from app.services.pipeline import MonitoringPipeline
+
+
+class FuenteLenta(NewsSource):
+    def __init__(self, nombre: str, segundos: float, titulos: list[str]) -> None:
+        self._nombre = nombre
+        self._segundos = segundos
+        self._titulos = titulos
+
+    def source_name(self) -> str:
+        return self._nombre
+
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
+        time.sleep(self._segundos)
+        return [NewsItem(titulo=t, fuente=self._nombre) for t in self._titulos]
+
+
+class FuenteRota(NewsSource):
+    def source_name(self) -> str:
+        return "rota"
+
+    def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
+        raise RuntimeError("feed caído")
+
+
+def _pipeline(sources, timeout: float = 5.0) -> MonitoringPipeline:
+    return MonitoringPipeline(
+        sources=sources,
+        triage=MagicMock(),
+        deep=MagicMock(),
+        notifier=MagicMock(),
+        repository=None,
+        file_storage=MagicMock(),
+        hasher=ContentHasher(),
+        collect_timeout_secs=timeout,
+    )
+
+
+def test_fuentes_corren_en_paralelo():
+    fuentes = [FuenteLenta(f"f{i}", 0.3, [f"nota {i}"]) for i in range(5)]
+
+    inicio = time.monotonic()
+    items = _pipeline(fuentes)._collect()
+    transcurrido = time.monotonic() - inicio
+
+    assert len(items) == 5
+    # En serie serían ~1.5 s; en paralelo ≈ la más lenta (0.3 s)
+    assert transcurrido < 1.0
+
+
+def test_fuente_que_excede_el_plazo_se_omite_y_el_resto_llega():
+    liberar = threading.Event()
+
+    class FuenteColgada(NewsSource):
+        def source_name(self) -> str:
+            return "colgada"
+
+        def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
+            liberar.wait(5)
+            return [NewsItem(titulo="tarde")]
+
+    fuentes = [FuenteLenta("rapida", 0.0, ["a tiempo"]), FuenteColgada()]
+    try:
+        inicio = time.monotonic()
+        items = _pipeline(fuentes, timeout=0.3)._collect()
+        transcurrido = time.monotonic() - inicio
+    finally:
+        liberar.set()
+
+    assert [i.titulo for i in items] == ["a tiempo"]
+    assert transcurrido < 2.0
+
+
+def test_el_lote_respeta_el_orden_de_las_fuentes():
+    fuentes = [
+        FuenteLenta("lenta", 0.2, ["primera"]),
+        FuenteLenta("rapida", 0.0, ["segunda"]),
+    ]
+    items = _pipeline(fuentes)._collect()
+    assert [i.titulo for i in items] == ["primera", "segunda"]
+
+
+def test_error_en_una_fuente_no_afecta_a_las_demas(capsys):
+    fuentes = [FuenteRota(), FuenteLenta("ok", 0.0, ["nota"])]
+    items = _pipeline(fuentes)._collect()
+    assert [i.titulo for i in items] == ["nota"]
+    assert "feed caído" in capsys.readouterr().out
+
+
+def test_sin_fuentes_devuelve_lista_vacia():
+    assert _pipeline([])._collect() == []
+
+
+def test_fuente_recibe_el_deadline_y_sus_parciales_llegan():
+    liberar = threading.Event()
+
+    class FuenteConParciales(NewsSource):
+        def source_name(self) -> str:
+            return "parciales"
+
+        def collect(self, deadline: Optional[float] = None) -> list[NewsItem]:
+            def fetch(titulo: str) -> list[NewsItem]:
+                if titulo == "colgada":
+                    liberar.wait(5)
+                return [NewsItem(titulo=titulo)]
+
+            per_request = map_until(fetch, ["uno", "colgada", "dos"], 3, deadline)
+            return [item for fetched in per_request if fetched for item in fetched]
+
+    try:
+        items = _pipeline([FuenteConParciales()], timeout=0.5)._collect()
+    finally:
+        liberar.set()
+
+    # La fuente no se omite entera: entrega lo que alcanzó antes del plazo
+    assert [i.titulo for i in items] == ["uno", "dos"]
+
+
+def test_map_until_sin_deadline_espera_todo_en_orden():
+    def fetch(n: int) -> int:
+        time.sleep(0.05 * (3 - n))
+        return n * 10
+
+    assert map_until(fetch, [0, 1, 2], 3) == [0, 10, 20]
+    assert map_until(fetch, [], 3) == []
+
+
+def test_nitter_con_una_cuenta_colgada_devuelve_las_demas():
+    liberar = threading.Event()
+    colgada = TWITTER_ACCOUNTS[0]["handle"]
+
+    def fetch_entries(url, headers=None):
+        if f"/{colgada}/" in url:
+            liberar.wait(5)
+        return [{"title": f"tweet de {url}", "id": "1"}]
+
+    feed_cache = MagicMock()
+    feed_cache.fetch_entries.side_effect = fetch_entries
+    source = NitterSource(instances=["https://nitter.test"], feed_cache=feed_cache)
+
+    try:
+        inicio = time.monotonic()
+        items = source.collect(deadline=time.monotonic() + 0.3)
+        transcurrido = time.monotonic() - inicio
+    finally:
+        liberar.set()
+
+    assert len(items) == len(TWITTER_ACCOUNTS) - 1
+    assert all(colgada not in i.fuente for i in items)
+    assert transcurrido < 2.0
@@ -0,0 +1,251 @@
+"""
+Tests del marcado de procesadas en MonitoringPipeline.run_once.
+
+Las URLs decididas en el ciclo (descartes del triage, rechazos de geo/análisis,
+alertas enviadas) se escriben con un solo mark_processed_many al final; las
+alertas cuyo envío falló NO se marcan, para reintentarlas.
+
+Fuente, triage, análisis y notificador son dobles — nada toca la red.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from app.domain.models import NewsItem, TriageResult
+from app.domain.ports import AIUnavailableError
+from app.services.content_hasher import ContentHasher
+from app.services.pipeline import MonitoringPipeline
+
+
+def _nota(n: int) -> NewsItem:
+    return NewsItem(titulo=f"Nota {n} en Monterrey", url=f"https://ejemplo.test/{n}", fuente="stub")
+
+
+def _pipeline(notas, candidatas, alertas, envios, storage=None):
+    """candidatas: índices que el triage deja pasar; alertas/envios: por candidata."""
+    source = MagicMock()
+    source.source_name.return_value = "stub"
+    source.collect.return_value = notas
+    triage = MagicMock()
+    triage.triage.side_effect = lambda news: [(news[i], TriageResult()) for i in candidatas]
+    deep = MagicMock()
+    deep.analyze.side_effect = [MagicMock() if a else None for a in alertas]
+    notifier = MagicMock()
+    notifier.send_alert.side_effect = envios
+    if storage is None:
+        storage = MagicMock()
+        storage.is_processed.return_value = False
+    pipeline = MonitoringPipeline(
+        sources=[source], triage=triage, deep=deep, notifier=notifier,
+        repository=None, file_storage=storage, hasher=ContentHasher(),
+        max_age_hours=999999,
+    )
+    return pipeline, storage
+
+
+def _marcadas(storage) -> list[str]:
+    storage.mark_processed.assert_not_called()
+    assert storage.mark_processed_many.call_count == 1
+    return storage.mark_processed_many.call_args.args[0]
+
+
+def test_un_solo_flush_con_descartes_rechazos_y_enviadas():
+    notas = [_nota(i) for i in range(5)]
+    # 1 → enviada, 2 → rechazada por geo, 3 → envío fallido; 0 y 4 descartadas por triage
+    pipeline, storage = _pipeline(notas, [1, 2, 3], [True, False, True], [True, False])
+
+    assert pipeline.run_once()["alerts"] == 1
+
+    assert sorted(_marcadas(storage)) == sorted(
+        n.url for n in (notas[0], notas[4], notas[1], notas[2])
+    )
+
+
+def test_sin_candidatas_igual_marca_los_descartes_del_triage():
+    notas = [_nota(i) for i in range(3)]
+    pipeline, storage = _pipeline(notas, [], [], [])
+
+    pipeline.run_once()
+
+    assert _marcadas(storage) == [n.url for n in notas]
+
+
+def test_si_el_analisis_revienta_la_candidata_se_reintenta_y_el_resto_sigue():
+    notas = [_nota(i) for i in range(3)]
+    pipeline, storage = _pipeline(notas, [1, 2], [True], [True])
+    pipeline._deep.analyze.side_effect = [MagicMock(), AIUnavailableError("IA caída")]
+
+    assert pipeline.run_once()["alerts"] == 1
+
+    # La que falló no se marca y vuelve a salir en el siguiente ciclo
+    assert sorted(_marcadas(storage)) == sorted([notas[0].url, notas[1].url])
+    assert pipeline._hasher.changed_items(notas) == [notas[2]]
+
+
+def test_envio_fallido_se_reintenta_hasta_el_tope_y_luego_se_marca():
+    notas = [_nota(1)]
+    pipeline, storage = _pipeline(notas, [0], [True] * 3, [False] * 3)
+    pipeline._max_retry_attempts = 3
+
+    # Los dos primeros ciclos: no se marca y la nota vuelve al siguiente
+    pipeline.run_once()
+    pipeline.run_once()
+    storage.mark_processed_many.assert_not_called()
+
+    pipeline.run_once()
+
+    assert pipeline._deep.analyze.call_count == 3
+    assert _marcadas(storage) == [notas[0].url]
+    assert pipeline._retry_attempts == {}
+
+
+def test_otro_error_en_el_analisis_no_se_reintenta():
+    notas = [_nota(1)]
+    pipeline, storage = _pipeline(notas, [0], [], [])
+    pipeline._deep.analyze.side_effect = ValueError("JSON inválido de la IA")
+
+    pipeline.run_once()
+
+    assert _marcadas(storage) == [notas[0].url]
+    assert pipeline._hasher.changed_items(notas) == []
+
+
+def test_contador_de_reintentos_olvida_lo_que_ya_no_es_candidata():
+    notas = [_nota(1)]
+    pipeline, storage = _pipeline(notas, [0], [True], [False])
+    pipeline.run_once()
+    assert pipeline._retry_attempts == {notas[0].url: 1}
+
+    # La nota salió de los feeds: otra candidata distinta en el siguiente ciclo
+    pipeline._sources[0].collect.return_value = [_nota(2)]
+    pipeline._deep.analyze.side_effect = [None]
+    pipeline.run_once()
+
+    assert pipeline._retry_attempts == {}
+
+
+def test_cien_descartes_cuestan_una_escritura_en_file_storage(tmp_path, monkeypatch):
+    import os
+
+    from app.infrastructure.persistence.file_storage import FileStorage
+
+    fsyncs = []
+    fsync_real = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: fsyncs.append(fd) or fsync_real(fd))
+
+    storage = FileStorage(str(tmp_path / "processed_urls.txt"))
+    notas = [_nota(i) for i in range(100)]
+    pipeline, _ = _pipeline(notas, [], [], [], storage=storage)
+
+    pipeline.run_once()
+
+    assert len(fsyncs) == 1
+    assert all(storage.is_processed(n.url) for n in notas)
+
+
+# ============================================================
+# Casi-duplicados — un representativo al triage, copias con su misma suerte
+# ============================================================
+
+def _con_copias(pipeline):
+    from app.services.near_dedup import NearDuplicateClusterer
+
+    pipeline._near_dedup = NearDuplicateClusterer()
+    return pipeline
+
+
+def _historia(n: int, medio: str) -> NewsItem:
+    return NewsItem(
+        titulo=f"Choque en avenida Fundadores deja dos heridos - {medio}",
+        url=f"https://{medio.lower()}.test/{n}",
+        fuente=medio,
+    )
+
+
+def test_solo_el_representativo_va_al_triage_y_las_copias_se_marcan():
+    notas = [_historia(1, "Milenio"), _nota(9), _historia(2, "Norte")]
+    pipeline, storage = _pipeline(notas, [0], [False], [])
+    _con_copias(pipeline)
+
+    pipeline.run_once()
+
+    triageadas = pipeline._triage.triage.call_args.args[0]
+    assert triageadas == [notas[0], notas[1]]
+    assert sorted(_marcadas(storage)) == sorted(n.url for n in notas)
+
+
+def test_reescritura_en_un_ciclo_posterior_no_vuelve_al_triage():
+    pipeline, storage = _pipeline([_historia(1, "Milenio"), _nota(9)], [], [], [])
+    _con_copias(pipeline)
+    pipeline.run_once()
+
+    # Ciclo siguiente: otro medio publica la misma historia
+    tarde = _historia(2, "Norte")
+    pipeline._sources[0].collect.return_value = [tarde, _nota(10)]
+    storage.mark_processed_many.reset_mock()
+    pipeline._triage.triage.reset_mock()
+
+    pipeline.run_once()
+
+    assert pipeline._triage.triage.call_args.args[0] == [pipeline._sources[0].collect.return_value[1]]
+    assert tarde.url in _marcadas(storage)
+
+
+def test_mismo_titular_un_dia_despues_vuelve_al_triage(reloj):
+    from app.services.near_dedup import NearDuplicateClusterer
+
+    pipeline, storage = _pipeline([_historia(1, "Milenio")], [], [], [])
+    pipeline._near_dedup = NearDuplicateClusterer(memory_ttl_secs=6 * 3600, clock=reloj)
+    pipeline.run_once()
+
+    reloj.t += 86400
+    otra_vez = _historia(2, "Milenio")
+    pipeline._sources[0].collect.return_value = [otra_vez]
+    pipeline._triage.triage.reset_mock()
+
+    pipeline.run_once()
+
+    assert pipeline._triage.triage.call_args.args[0] == [otra_vez]
+
+
+def test_una_candidata_no_se_recuerda_y_su_repeticion_va_al_triage():
+    pipeline, storage = _pipeline([_historia(1, "Milenio")], [0], [True], [True])
+    _con_copias(pipeline)
+    pipeline.run_once()
+
+    otra_vez = _historia(2, "Norte")
+    pipeline._sources[0].collect.return_value = [otra_vez]
+    pipeline._triage.triage.side_effect = lambda news: []
+    pipeline._triage.triage.reset_mock()
+
+    pipeline.run_once()
+
+    assert pipeline._triage.triage.call_args.args[0] == [otra_vez]
+
+
+def test_envio_fallido_tampoco_marca_las_copias():
+    notas = [_historia(1, "Milenio"), _historia(2, "Norte")]
+    pipeline, storage = _pipeline(notas, [0], [True], [False])
+    _con_copias(pipeline)
+
+    assert pipeline.run_once()["alerts"] == 0
+    storage.mark_processed_many.assert_not_called()
+    # Ambas vuelven en el siguiente ciclo aunque los feeds no cambien
+    assert pipeline._hasher.changed_items(notas) == notas
+
+
+def test_la_pista_de_keywords_de_una_copia_pasa_al_representativo():
+    notas = [
+        NewsItem(titulo="Reportan humo en bodega de Apodaca", url="https://a.test/1"),
+        NewsItem(titulo="Reportan humo en bodega de Apodaca - Info7", url="https://b.test/2"),
+    ]
+    notas[1].keyword_hint = "incendio"
+    pipeline, _ = _pipeline(notas, [], [], [])
+    _con_copias(pipeline)
+
+    reps, copias = pipeline._cluster(notas)
+
+    assert reps == [notas[0]]
+    assert copias[id(notas[0])] == [notas[1]]
+    assert notas[0].keyword_hint == "incendio"
@@ -12,12 +12,14 @@ cursor son mocks. Cubre:
 (d) el INSERT incluye fecha_evento y usa el placeholder "sin-url:<hash>"
     cuando news.url es None o vacía;
 (e) pool: putconn(close=False) en éxito y putconn(close=True) tras
-    OperationalError (conexión rota se descarta del pool).
+    OperationalError (conexión rota se descarta del pool);
+(f) find_duplicates resuelve el lote completo en una sola consulta;
+(g) caché LRU/TTL de dedup: positivos y save_incident evitan ir a la BD.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
@@ -215,3 +217,122 @@ def test_operational_error_descarta_la_conexion_con_close_true(pool_falso):
     # Conexión rota: ni commit ni rollback, y se descarta del pool
     pool_falso.conn.rollback.assert_not_called()
     pool_falso.pool.putconn.assert_called_once_with(pool_falso.conn, close=True)
+
+
+# ============================================================
+# (f) find_duplicates — dedup del lote en una sola consulta
+# ============================================================
+
+def _noticia(titulo: str, url: str | None, fuente: str = "fuente") -> NewsItem:
+    return NewsItem(titulo=titulo, url=url, fuente=fuente)
+
+
+def test_find_duplicates_hace_una_sola_consulta(pool_falso):
+    pool_falso.cursor.fetchall.return_value = []
+    lote = [_noticia(f"nota {i}", f"https://ejemplo.test/{i}") for i in range(30)]
+
+    assert _repo().find_duplicates(lote) == set()
+
+    assert pool_falso.cursor.execute.call_count == 1
+    pool_falso.pool.getconn.assert_called_once()
+    sql, params = pool_falso.cursor.execute.call_args.args
+    assert "ANY(%s)" in sql and "unnest" in sql
+    assert len(params[1]) == 30            # hashes
+    assert params[2] == [n.url for n in lote]
+    assert params[3] == ["fuente"] * 30
+
+
+def test_find_duplicates_coincide_por_hash_o_por_url_fuente(pool_falso):
+    por_hash = _noticia("Balacera en Lázaro Cárdenas", "https://a.test/1")
+    por_url = _noticia("Titular reescrito", "https://b.test/2", fuente="Milenio")
+    misma_url_otra_fuente = _noticia("Otro", "https://b.test/2", fuente="El Norte")
+    sin_url = _noticia("Nota sin url", None)
+    nueva = _noticia("Nota nueva", "https://c.test/3")
+
+    detectada = datetime.now(_TZ)
+    pool_falso.cursor.fetchall.return_value = [
+        (PostgresRepository._hash_title("balacera en  LÁZARO cárdenas"), "x", "y", detectada),
+        ("otrohash", "https://b.test/2", "Milenio", detectada),
+    ]
+
+    dups = _repo().find_duplicates(
+        [por_hash, por_url, misma_url_otra_fuente, sin_url, nueva]
+    )
+
+    assert dups == {0, 1}
+    # Las noticias sin URL no mandan par (url, fuente)
+    _, params = pool_falso.cursor.execute.call_args.args
+    assert None not in params[2]
+
+
+def test_find_duplicates_lote_vacio_no_consulta(pool_falso):
+    assert _repo().find_duplicates([]) == set()
+    pool_falso.cls.assert_not_called()
+
+
+# ============================================================
+# (g) Caché de dedup delante de Postgres
+# ============================================================
+
+def test_positivo_de_is_duplicate_se_responde_desde_cache(pool_falso):
+    repo = _repo()
+    titulo, url = "Choque en Gonzalitos", "https://ejemplo.test/n"
+    pool_falso.cursor.fetchone.return_value = (
+        PostgresRepository._hash_title(titulo), url, "fuente", datetime.now(_TZ)
+    )
+
+    assert repo.is_duplicate(titulo, url, "fuente") is True
+    assert repo.is_duplicate(titulo, url, "fuente") is True
+    assert pool_falso.cursor.execute.call_count == 1
+
+
+def test_negativos_no_se_cachean(pool_falso):
+    repo = _repo()
+    pool_falso.cursor.fetchone.return_value = None
+
+    repo.is_duplicate("nota", "https://ejemplo.test/n", "fuente")
+    repo.is_duplicate("nota", "https://ejemplo.test/n", "fuente")
+
+    assert pool_falso.cursor.execute.call_count == 2
+
+
+def test_entrada_cacheada_fuera_de_la_ventana_vuelve_a_consultar(pool_falso):
+    repo = _repo()
+    titulo = "Incendio en bodega"
+    vieja = datetime.now(_TZ) - timedelta(hours=30)
+    pool_falso.cursor.fetchone.return_value = (
+        PostgresRepository._hash_title(titulo), "u", "f", vieja
+    )
+    repo.is_duplicate(titulo, "u", "f", max_hours=48)  # llena la caché
+
+    pool_falso.cursor.fetchone.return_value = None
+    assert repo.is_duplicate(titulo, "u", "f", max_hours=24) is False
+    assert pool_falso.cursor.execute.call_count == 2
+
+
+def test_save_incident_mantiene_la_cache_al_dia(pool_falso):
+    repo = _repo()
+    alerta = _alerta()
+    pool_falso.cursor.fetchone.return_value = (7,)
+    repo.save_incident(alerta)
+    llamadas = pool_falso.cursor.execute.call_count
+
+    # Mismo título con otra URL (Google reescribe la redirección) y misma URL con otro título
+    assert repo.is_duplicate(alerta.news.titulo, "https://otra.test/x", "otra") is True
+    assert repo.is_duplicate("titular distinto", alerta.news.url, alerta.news.fuente) is True
+    assert repo.find_duplicates([alerta.news]) == {0}
+    assert pool_falso.cursor.execute.call_count == llamadas
+
+
+def test_find_duplicates_solo_consulta_lo_que_no_esta_en_cache(pool_falso):
+    repo = _repo()
+    conocida = _noticia("Conocida", "https://ejemplo.test/1")
+    nueva = _noticia("Nueva", "https://ejemplo.test/2")
+    repo._remember(
+        PostgresRepository._hash_title(conocida.titulo), conocida.url, "fuente", datetime.now(_TZ)
+    )
+    pool_falso.cursor.fetchall.return_value = []
+
+    assert repo.find_duplicates([conocida, nueva]) == {0}
+    _, params = pool_falso.cursor.execute.call_args.args
+    assert params[2] == ["https://ejemplo.test/2"]
@@ -0,0 +1,116 @@
+"""
+Tests de ProximityEngine (app/services/proximity.py).
+
+Haversine vectorizado para filtrar, geodésica exacta para decidir en la franja
+del borde del radio: los resultados deben coincidir con el loop de
+geopy.geodesic al que reemplaza. Bien adentro del radio no se llama a
+geodesic y la distancia reportada es la haversine (≤ 0.5 % de diferencia).
+"""
+
+from __future__ import annotations
+
+import random
+
+from geopy.distance import geodesic
+
+from app.config.locations import get_active_locations
+from app.domain.models import Coordinates, CostcoLocation
+from app.services.proximity import ProximityEngine
+
+
+def _tienda(i: int, lat: float, lon: float) -> CostcoLocation:
+    return CostcoLocation(
+        nombre=f"Tienda {i}", coords=Coordinates(lat=lat, lon=lon), direccion="x"
+    )
+
+
+def _tiendas_mexico(n: int, semilla: int = 7) -> list[CostcoLocation]:
+    rng = random.Random(semilla)
+    return [_tienda(i, rng.uniform(15.0, 32.0), rng.uniform(-117.0, -87.0)) for i in range(n)]
+
+
+def _dentro_por_loop(tiendas, punto, radio):
+    return [
+        i for i, t in enumerate(tiendas)
+        if geodesic(punto, t.coords.as_tuple()).kilometers <= radio
+    ]
+
+
+def test_dentro_del_radio_coincide_con_el_loop_geodesico():
+    tiendas = _tiendas_mexico(120)
+    motor = ProximityEngine(tiendas)
+    rng = random.Random(1)
+    puntos = [(rng.uniform(15.0, 32.0), rng.uniform(-117.0, -87.0)) for _ in range(15)]
+
+    resultados = motor.within_radius_batch(puntos, 250.0)
+
+    for punto, hits in zip(puntos, resultados):
+        assert [i for i, _ in hits] == _dentro_por_loop(tiendas, punto, 250.0)
+
+
+def test_borde_del_radio_se_decide_con_geodesica():
+    """Un punto a ~0.3 % del borde: haversine solo no basta para decidir."""
+    tienda = _tienda(0, 25.6455, -100.3255)
+    motor = ProximityEngine([tienda])
+    # Punto al norte a distancia geodésica 5.0 km ± unos metros
+    afuera = (25.6455 + 5.01 / 110.8, -100.3255)
+    adentro = (25.6455 + 4.99 / 110.8, -100.3255)
+
+    assert geodesic(afuera, tienda.coords.as_tuple()).kilometers > 5.0
+    assert geodesic(adentro, tienda.coords.as_tuple()).kilometers <= 5.0
+    assert motor.within_radius(afuera, 5.0) == []
+    assert [i for i, _ in motor.within_radius(adentro, 5.0)] == [0]
+
+
+def test_primera_dentro_respeta_el_orden_de_configuracion():
+    tiendas = [_tienda(0, 25.66, -100.33), _tienda(1, 25.6455, -100.3255)]
+    motor = ProximityEngine(tiendas)
+    punto = (25.6455, -100.3255)  # encima de la tienda 1, a ~2 km de la 0
+
+    idx, dist = motor.first_within(punto, 5.0)
+
+    assert idx == 0
+    assert abs(dist - geodesic(punto, tiendas[0].coords.as_tuple()).kilometers) < 0.01
+
+
+def test_bien_adentro_no_llama_a_geodesic_y_first_within_para_en_la_primera(monkeypatch):
+    tiendas = [_tienda(i, 25.6455 + i * 0.0005, -100.3255) for i in range(50)]
+    tiendas.append(_tienda(50, 25.6455 + 4.99 / 110.8, -100.3255))  # en el borde
+    motor = ProximityEngine(tiendas)
+    llamadas = []
+    original = motor.distance_km
+    monkeypatch.setattr(motor, "distance_km", lambda p, i: llamadas.append(i) or original(p, i))
+    punto = (25.6455, -100.3255)
+
+    hits = motor.within_radius(punto, 5.0)
+
+    assert [i for i, _ in hits] == list(range(51))
+    assert llamadas == [50]  # solo la del borde
+    assert motor.first_within(punto, 5.0) == hits[0]
+    assert llamadas == [50]
+
+
+def test_nearest_k_ordenado_por_distancia_geodesica():
+    tiendas = _tiendas_mexico(500, semilla=3)
+    motor = ProximityEngine(tiendas)
+    punto = (25.6866, -100.3161)
+
+    cercanas = motor.nearest(punto, k=5)
+
+    esperado = sorted(
+        (geodesic(punto, t.coords.as_tuple()).kilometers, i) for i, t in enumerate(tiendas)
+    )[:5]
+    assert [i for i, _ in cercanas] == [i for _, i in esperado]
+    assert all(abs(d - e) < 1e-9 for (_, d), (e, _) in zip(cercanas, esperado))
+
+
+def test_sin_tiendas_o_sin_puntos():
+    vacio = ProximityEngine([])
+    assert vacio.within_radius((25.0, -100.0), 5.0) == []
+    assert vacio.nearest((25.0, -100.0)) == []
+    assert ProximityEngine(get_active_locations()).within_radius_batch([], 5.0) == []
+
+
+def test_k_mayor_que_las_tiendas():
+    motor = ProximityEngine(get_active_locations())
+    assert len(motor.nearest((25.6866, -100.3161), k=10)) == len(get_active_locations())
@@ -0,0 +1,86 @@
+"""
+Tests de RoadIndex (app/services/road_index.py) y su uso en GeoService.
+
+El índice se compila una vez y resuelve todas las vialidades mencionadas en
+una pasada: acentos y abreviaturas ("Av.", "Carr.", "Prol.") indistintos,
+límites de palabra, y el mismo orden tienda → vialidad que el escaneo lineal.
+"""
+
+from __future__ import annotations
+
+from app.config.locations import get_active_locations
+from app.domain.models import Coordinates, CostcoLocation
+from app.services.geo_service import GeoService
+from app.services.road_index import RoadIndex, canonical
+
+
+def _tienda(nombre: str, vialidades: list[str]) -> CostcoLocation:
+    return CostcoLocation(
+        nombre=nombre,
+        coords=Coordinates(lat=25.64, lon=-100.32),
+        direccion="Dirección de prueba",
+        vialidades_clave=vialidades,
+    )
+
+
+def test_canonical_expande_abreviaturas_y_quita_acentos():
+    assert canonical("Av. Lázaro Cárdenas") == "avenida lazaro cardenas"
+    assert canonical("Carr. Nacional, km 268") == "carretera nacional km 268"
+    assert canonical("PROL. Constitución") == "prolongacion constitucion"
+    assert canonical("kilómetro 268") == "km 268"
+
+
+def test_abreviatura_en_el_texto_coincide_con_alias_completo():
+    indice = RoadIndex([_tienda("A", ["avenida fundadores"])])
+    assert indice.matches("Choque en Av. Fundadores esquina Vasconcelos") == [
+        (0, "avenida fundadores")
+    ]
+
+
+def test_alias_abreviado_coincide_con_texto_completo():
+    indice = RoadIndex([_tienda("A", ["prol. constitución"])])
+    assert indice.matches("Cierre en Prolongación Constitucion") == [(0, "prol. constitución")]
+
+
+def test_respeta_limites_de_palabra():
+    indice = RoadIndex([_tienda("A", ["leones", "rodas"])])
+    assert indice.matches("Inauguran la Leonesa en Herodas") == []
+    assert indice.matches("Choque en Paseo de los Leones") == [(0, "leones")]
+
+
+def test_alias_prefijo_de_otro_tambien_se_reporta():
+    indice = RoadIndex([_tienda("A", ["sendero divisorio", "sendero"])])
+    assert indice.matches("Volcadura en Sendero Divisorio") == [
+        (0, "sendero divisorio"),
+        (0, "sendero"),
+    ]
+
+
+def test_orden_por_tienda_y_vialidad_como_en_la_configuracion():
+    indice = RoadIndex([
+        _tienda("A", ["lincoln", "constitución"]),
+        _tienda("B", ["fundadores", "constitución"]),
+    ])
+    texto = "Fundadores y Constitución, luego Lincoln"
+    assert indice.matches(texto) == [
+        (0, "lincoln"),
+        (0, "constitución"),
+        (1, "fundadores"),
+        (1, "constitución"),
+    ]
+
+
+def test_geo_service_usa_el_indice_con_abreviaturas():
+    servicio = GeoService(geocoder=None, locations=get_active_locations())
+    resultado = servicio.check_roads_only("Carambola en Carr. Nacional a la altura de Valle Alto")
+    assert resultado.is_within_radius
+    assert resultado.costco_nombre == "Costco Carretera Nacional"
+    assert resultado.matched_via == "vialidad"
+
+
+def test_muchas_tiendas_y_vialidades():
+    tiendas = [
+        _tienda(f"T{i}", [f"calle {i} {j}" for j in range(50)]) for i in range(50)
+    ]
+    indice = RoadIndex(tiendas)
+    assert indice.matches("Bloqueo en Calle 49 7 y calle 3 12") == [(3, "calle 3 12"), (49, "calle 49 7")]
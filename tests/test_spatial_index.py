@@ -0,0 +1,148 @@
+"""
+Tests del índice espacial (app/services/spatial_index.py) y del historial de
+incidentes de GeoService.
+
+La consulta por radio debe dar exactamente lo mismo que un barrido lineal
+(incluyendo puntos en celdas vecinas y la ventana de tiempo), y los
+incidentes enviados enriquecen las alertas siguientes en la misma zona.
+"""
+
+from __future__ import annotations
+
+import random
+
+from app.domain.models import (
+    Alert,
+    AnalysisResult,
+    Coordinates,
+    CostcoLocation,
+    IncidentCategory,
+    NewsItem,
+    ProximityResult,
+)
+from app.services.geo_service import GeoService
+from app.services.spatial_index import SpatialIndex, haversine_km
+
+MTY = (25.6866, -100.3161)
+
+
+def _barrido(puntos, lat, lon, radio, since=None):
+    return sorted(
+        k for k, (plat, plon, ts) in puntos.items()
+        if haversine_km(lat, lon, plat, plon) <= radio and (since is None or ts >= since)
+    )
+
+
+def test_consulta_coincide_con_barrido_lineal():
+    rng = random.Random(4)
+    indice = SpatialIndex(cell_km=1.0)
+    puntos = {}
+    for i in range(3000):
+        p = (MTY[0] + rng.uniform(-0.2, 0.2), MTY[1] + rng.uniform(-0.2, 0.2), rng.uniform(0, 100))
+        puntos[i] = p
+        indice.insert(i, *p)
+
+    for _ in range(30):
+        lat, lon = MTY[0] + rng.uniform(-0.15, 0.15), MTY[1] + rng.uniform(-0.15, 0.15)
+        for radio in (0.3, 1.0, 2.7):
+            hits = indice.query_radius(lat, lon, radio, since=50)
+            assert sorted(p.key for _, p in hits) == _barrido(puntos, lat, lon, radio, since=50)
+            assert [d for d, _ in hits] == sorted(d for d, _ in hits)
+
+
+def test_insertar_misma_clave_mueve_el_punto_y_remove_lo_borra():
+    indice = SpatialIndex()
+    indice.insert("a", *MTY, timestamp=0)
+    indice.insert("a", 25.0, -100.0, timestamp=1)
+
+    assert len(indice) == 1
+    assert indice.query_radius(*MTY, 1.0) == []
+    indice.remove("a")
+    assert indice.query_radius(25.0, -100.0, 1.0) == []
+    indice.remove("no-existe")
+
+
+def test_prune_elimina_los_viejos():
+    indice = SpatialIndex()
+    indice.insert("viejo", *MTY, timestamp=10)
+    indice.insert("nuevo", *MTY, timestamp=20)
+
+    assert indice.prune(older_than=15) == 1
+    assert [p.key for _, p in indice.query_radius(*MTY, 1.0)] == ["nuevo"]
+
+
+# ════════════════════════════════════════════════════════════════════════════
+# GeoService — historial de incidentes
+# ════════════════════════════════════════════════════════════════════════════
+
+
+TIENDA = CostcoLocation(
+    nombre="Costco Prueba", coords=Coordinates(lat=25.6455, lon=-100.3255), direccion="x"
+)
+
+
+def _servicio(reloj) -> GeoService:
+    return GeoService(
+        geocoder=None, locations=[TIENDA], incident_radius_km=1.0,
+        incident_window_days=7, clock=reloj,
+    )
+
+
+def _alerta(url: str, lat: float, lon: float) -> Alert:
+    return Alert(
+        news=NewsItem(titulo="Choque", url=url),
+        analysis=AnalysisResult(category=IncidentCategory.ACCIDENTE_VIAL),
+        proximity=ProximityResult(event_coords=Coordinates(lat=lat, lon=lon)),
+    )
+
+
+def test_alerta_en_zona_con_incidentes_previos_lleva_historial(reloj):
+    geo = _servicio(reloj)
+    geo.record_incident(_alerta("u1", 25.6500, -100.3300))
+    geo.record_incident(_alerta("u2", 25.7000, -100.2000))  # lejos
+
+    historial = geo.incident_history(_alerta("u3", 25.6505, -100.3305))
+
+    assert historial.count == 1
+    assert historial.categories == ["accidente_vial"]
+    assert (historial.radius_km, historial.days) == (1.0, 7)
+
+
+def test_incidentes_fuera_de_la_ventana_no_cuentan(reloj):
+    geo = _servicio(reloj)
+    geo.record_incident(_alerta("u1", 25.6500, -100.3300))
+
+    reloj.t += 8 * 86400
+    assert geo.incident_history(_alerta("u2", 25.6500, -100.3300)) is None
+
+
+def test_coordenadas_de_la_tienda_o_placeholder_no_entran_al_historial(reloj):
+    geo = _servicio(reloj)
+    geo.record_incident(_alerta("u1", TIENDA.coords.lat, TIENDA.coords.lon))
+    cargados = geo.load_incidents([
+        {"id": 1, "lat": 0, "lon": 0, "timestamp": 1_700_000_000.0},
+        {"id": 2, "lat": 25.65, "lon": -100.33, "timestamp": 1_700_000_000.0, "categoria": "incendio"},
+    ])
+
+    assert cargados == 1
+    assert [d["categoria"] for _, d in geo.nearby_incidents(TIENDA.coords.lat, TIENDA.coords.lon, 5.0)] == ["incendio"]
+
+
+def test_stores_near_usa_el_motor_de_proximidad(reloj):
+    geo = _servicio(reloj)
+    cercanas = geo.stores_near(25.6500, -100.3300, 5.0)
+    assert [t.nombre for t, _ in cercanas] == ["Costco Prueba"]
+    assert geo.stores_near(*MTY, 1.0) == []
+
+
+def test_mensaje_de_telegram_incluye_historial_de_zona():
+    from app.domain.models import IncidentHistory
+    from app.infrastructure.notifications.telegram import TelegramNotifier
+
+    alerta = _alerta("u1", 25.65, -100.33)
+    assert "Zona recurrente" not in TelegramNotifier._format_alert(alerta)
+
+    alerta.history = IncidentHistory(count=3, radius_km=1.0, days=7)
+    assert "🔁 Zona recurrente: 3 incidentes a ≤ 1 km en los últimos 7 días" in (
+        TelegramNotifier._format_alert(alerta)
+    )
@@ -0,0 +1,70 @@
+"""
+Tests de SQLiteKVCache (app/infrastructure/persistence/sqlite_kv_cache.py).
+
+Caché persistente con TTL por entrada, tope LRU por namespace y varios
+namespaces en un mismo archivo. Todo sobre tmp_path con un reloj falso.
+"""
+
+from __future__ import annotations
+
+from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+
+
+def _cache(tmp_path, reloj, namespace="geo", **kwargs) -> SQLiteKVCache:
+    return SQLiteKVCache(str(tmp_path / "cache.db"), namespace, clock=reloj, **kwargs)
+
+
+def test_guarda_y_devuelve_valores_json(tmp_path, reloj):
+    cache = _cache(tmp_path, reloj)
+    cache.set("lazaro cardenas", {"coords": [25.64, -100.32]}, ttl_secs=60)
+
+    assert cache.get("lazaro cardenas") == {"coords": [25.64, -100.32]}
+    assert cache.get("otra") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entrada_vencida_es_miss(tmp_path, reloj):
+    cache = _cache(tmp_path, reloj)
+    cache.set("k", {"v": 1}, ttl_secs=60)
+
+    reloj.t += 61
+    assert cache.get("k") is None
+
+
+def test_persiste_entre_instancias(tmp_path, reloj):
+    _cache(tmp_path, reloj).set("k", [1, 2], ttl_secs=60)
+    assert _cache(tmp_path, reloj).get("k") == [1, 2]
+
+
+def test_tope_lru_descarta_la_menos_usada(tmp_path, reloj):
+    cache = _cache(tmp_path, reloj, max_entries=2)
+    cache.set("a", 1, ttl_secs=600)
+    reloj.t += 1
+    cache.set("b", 2, ttl_secs=600)
+    reloj.t += 1
+    assert cache.get("a") == 1  # "a" pasa a ser la más reciente
+    reloj.t += 1
+
+    cache.set("c", 3, ttl_secs=600)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_namespaces_independientes_en_el_mismo_archivo(tmp_path, reloj):
+    geo = _cache(tmp_path, reloj, namespace="geo", max_entries=1)
+    otra = _cache(tmp_path, reloj, namespace="otra", max_entries=1)
+    geo.set("k", "geo", ttl_secs=60)
+    otra.set("k", "otra", ttl_secs=60)
+
+    assert geo.get("k") == "geo"
+    assert otra.get("k") == "otra"
+
+
+def test_valor_no_serializable_se_ignora_sin_lanzar(tmp_path, capsys, reloj):
+    cache = _cache(tmp_path, reloj)
+    cache.set("k", object(), ttl_secs=60)
+    assert cache.get("k") is None
+    assert "error de escritura" in capsys.readouterr().out
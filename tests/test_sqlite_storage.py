@@ -0,0 +1,113 @@
+"""
+Tests de SQLiteStorage (app/infrastructure/persistence/sqlite_storage.py).
+
+Backend alternativo del puerto DuplicateChecker: tabla indexada en SQLite
+(WAL), escritura en lote en una transacción y expiración por antigüedad.
+Todo sobre tmp_path con un reloj falso — nada de red ni sleeps.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from types import SimpleNamespace
+
+import scheduler
+from app.infrastructure.persistence.sqlite_storage import SQLiteStorage
+
+_DIA = 86400
+
+
+def _storage(tmp_path, reloj, **kwargs) -> SQLiteStorage:
+    return SQLiteStorage(str(tmp_path / "processed.db"), clock=reloj, **kwargs)
+
+
+def test_marca_y_consulta(tmp_path, reloj):
+    fs = _storage(tmp_path, reloj)
+    fs.mark_processed("https://ejemplo.test/1")
+    assert fs.is_processed("https://ejemplo.test/1")
+    assert not fs.is_processed("https://ejemplo.test/2")
+
+
+def test_usa_modo_wal(tmp_path, reloj):
+    _storage(tmp_path, reloj)
+    conn = sqlite3.connect(str(tmp_path / "processed.db"))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_mark_processed_many_en_una_transaccion_y_persiste(tmp_path, reloj):
+    urls = [f"https://ejemplo.test/{i}" for i in range(100)] + ["", "https://ejemplo.test/0"]
+    fs = _storage(tmp_path, reloj)
+    fs.mark_processed_many(urls)
+    fs.close()
+
+    reabierto = _storage(tmp_path, reloj)
+    assert all(reabierto.is_processed(f"https://ejemplo.test/{i}") for i in range(100))
+    n = sqlite3.connect(str(tmp_path / "processed.db")).execute(
+        "SELECT COUNT(*) FROM processed"
+    ).fetchone()[0]
+    assert n == 100
+
+
+def test_expiracion_por_edad(tmp_path, reloj):
+    fs = _storage(tmp_path, reloj, max_age_days=2)
+    fs.mark_processed("https://ejemplo.test/vieja")
+    reloj.t += 3 * _DIA
+    fs.mark_processed("https://ejemplo.test/nueva")
+
+    # Expirada aunque cleanup no haya corrido todavía
+    assert not fs.is_processed("https://ejemplo.test/vieja")
+    assert fs.cleanup() == 1
+    assert fs.is_processed("https://ejemplo.test/nueva")
+
+
+def test_remarcar_una_url_vencida_la_refresca(tmp_path, reloj):
+    fs = _storage(tmp_path, reloj, max_age_days=2)
+    fs.mark_processed("https://ejemplo.test/1")
+    reloj.t += 3 * _DIA
+    assert not fs.is_processed("https://ejemplo.test/1")  # vencida, cleanup no ha corrido
+
+    fs.mark_processed_many(["https://ejemplo.test/1"])
+
+    assert fs.is_processed("https://ejemplo.test/1")
+    assert fs.cleanup() == 0
+
+
+def test_cleanup_respeta_max_entries_como_tope(tmp_path, reloj):
+    fs = _storage(tmp_path, reloj)
+    for i in range(5):
+        reloj.t += 1
+        fs.mark_processed(f"https://ejemplo.test/{i}")
+
+    assert fs.cleanup(max_entries=2) == 3
+    assert [fs.is_processed(f"https://ejemplo.test/{i}") for i in range(5)] == [
+        False, False, False, True, True,
+    ]
+
+
+def test_limpieza_diaria_no_recorta_filas_frescas(tmp_path, reloj):
+    fs = _storage(tmp_path, reloj, max_age_days=2)
+    fs.mark_processed("https://ejemplo.test/vieja")
+    reloj.t += 3 * _DIA
+    n = scheduler.PROCESSED_FILE_MAX_ENTRIES + 500
+    fs.mark_processed_many([f"https://ejemplo.test/{i}" for i in range(n)])
+
+    scheduler._daily_cleanup(SimpleNamespace(_storage=fs))
+
+    filas = sqlite3.connect(str(tmp_path / "processed.db")).execute(
+        "SELECT COUNT(*) FROM processed"
+    ).fetchone()[0]
+    assert filas == n  # solo se fue la vieja
+    assert fs.is_processed("https://ejemplo.test/0")
+
+
+def test_importa_el_archivo_de_file_storage_una_sola_vez(tmp_path, reloj):
+    legacy = tmp_path / "processed_news.txt"
+    legacy.write_text("https://a.test\nhttps://b.test\n", encoding="utf-8")
+
+    fs = _storage(tmp_path, reloj, import_from=str(legacy))
+    assert fs.is_processed("https://a.test") and fs.is_processed("https://b.test")
+    fs.close()
+
+    legacy.write_text("https://c.test\n", encoding="utf-8")
+    fs = _storage(tmp_path, reloj, import_from=str(legacy))
+    assert not fs.is_processed("https://c.test")
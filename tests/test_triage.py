@@ -0,0 +1,258 @@
+"""
+Tests de TriageService (app/services/triage.py).
+
+Chunks armados por presupuesto de tokens (y partidos a la mitad cuando la
+respuesta llega ilegible), re-indexado global, chunks en paralelo (orden del feed
+preservado) y caché de veredictos por título normalizado + fuente: lo ya
+juzgado no vuelve a la IA, y los veredictos UNKNOWN (respuesta ilegible)
+no se guardan.
+
+La IA es un doble que responde según el título; la caché es un
+SQLiteKVCache real en tmp_path.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.domain.models import NewsItem, TriageDecision, TriageResult
+from app.infrastructure.persistence.sqlite_kv_cache import SQLiteKVCache
+from app.domain.text import estimate_tokens
+from app.services.triage import (
+    OUTPUT_TOKENS_PER_ITEM,
+    TriageService,
+    item_token_cost,
+    plan_chunks,
+    triage_fingerprint,
+)
+
+
+def _nota(titulo: str, fuente: str = "Milenio") -> NewsItem:
+    return NewsItem(titulo=titulo, fuente=fuente, url=f"https://ejemplo.test/{hash(titulo)}")
+
+
+def _ia_por_titulo(decisiones: dict[str, TriageDecision] | None = None) -> MagicMock:
+    """batch_triage falso: 'choque'/'incendio' → candidata, lo demás → descartada."""
+    decisiones = decisiones or {}
+
+    def batch_triage(chunk):
+        resultados = []
+        for i, item in enumerate(chunk):
+            titulo = item["titulo"]
+            decision = decisiones.get(titulo)
+            if decision is None:
+                alto = any(p in titulo.lower() for p in ("choque", "incendio"))
+                decision = TriageDecision.CANDIDATE if alto else TriageDecision.DISCARDED
+            resultados.append(TriageResult(index=i, decision=decision, reason="sintético"))
+        return resultados
+
+    ai = MagicMock()
+    ai.batch_triage.side_effect = batch_triage
+    return ai
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteKVCache(str(tmp_path / "cache.db"), namespace="triage")
+
+
+def test_reindexado_global_entre_chunks():
+    notas = [_nota(f"Nota {i}") for i in range(7)] + [_nota("Choque en Gonzalitos")]
+    ai = _ia_por_titulo()
+
+    candidatas = TriageService(ai, chunk_size=3).triage(notas)
+
+    assert ai.batch_triage.call_count == 3
+    assert [(n.titulo, t.index) for n, t in candidatas] == [("Choque en Gonzalitos", 7)]
+
+
+def test_chunks_en_paralelo_conservan_indices_y_orden():
+    notas = [_nota(f"Choque {i}" if i % 4 == 0 else f"Nota {i}") for i in range(20)]
+    en_vuelo = [0]
+    maximo = [0]
+    lock = threading.Lock()
+    base = _ia_por_titulo().batch_triage.side_effect
+
+    def batch_triage(chunk):
+        with lock:
+            en_vuelo[0] += 1
+            maximo[0] = max(maximo[0], en_vuelo[0])
+        # El primer chunk tarda más: llega al final pero debe quedar primero
+        time.sleep(0.15 if chunk[0]["titulo"] == "Choque 0" else 0.05)
+        with lock:
+            en_vuelo[0] -= 1
+        return base(chunk)
+
+    ai = MagicMock()
+    ai.batch_triage.side_effect = batch_triage
+
+    inicio = time.monotonic()
+    candidatas = TriageService(ai, chunk_size=3, parallelism=3).triage(notas)
+    transcurrido = time.monotonic() - inicio
+
+    assert maximo[0] == 3
+    assert transcurrido < 0.5  # 7 chunks en serie serían ≥ 0.45 s
+    assert [(n.titulo, t.index) for n, t in candidatas] == [
+        (f"Choque {i}", i) for i in range(0, 20, 4)
+    ]
+
+
+# ── Presupuesto de tokens ────────────────────────────────────
+
+
+def test_estimate_tokens_sobreestima_un_poco():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Choque en Gonzalitos") == 6  # 20 chars / 3.5
+
+
+def test_plan_respeta_tope_de_items_y_presupuestos():
+    costos = [(100, 90)] * 10
+    assert plan_chunks(costos, max_items=4, input_budget=10_000, output_budget=10_000) == [
+        [0, 1, 2, 3], [4, 5, 6, 7], [8, 9],
+    ]
+    assert [len(c) for c in plan_chunks(costos, 25, input_budget=350, output_budget=10_000)] == [3] * 3 + [1]
+    assert [len(c) for c in plan_chunks(costos, 25, input_budget=10_000, output_budget=200)] == [2] * 5
+
+
+def test_item_que_excede_el_presupuesto_va_solo():
+    costos = [(100, 90), (5000, 90), (100, 90)]
+    assert plan_chunks(costos, 25, input_budget=1000, output_budget=1000) == [[0], [1], [2]]
+
+
+def test_snippets_largos_llenan_el_chunk_antes():
+    cortas = [_nota(f"Nota {i}") for i in range(30)]
+    largas = [NewsItem(titulo=f"Hilo {i}", contenido="palabra " * 200, fuente="Nitter")
+              for i in range(30)]
+    ai = _ia_por_titulo()
+    servicio = TriageService(ai, chunk_size=25, input_token_budget=2000)
+
+    servicio.triage(cortas)
+    assert [len(c.args[0]) for c in ai.batch_triage.call_args_list] == [25, 5]
+
+    ai.batch_triage.reset_mock()
+    servicio.triage(largas)
+    por_chunk = [len(c.args[0]) for c in ai.batch_triage.call_args_list]
+    costo = item_token_cost(largas[0])[0]
+    assert max(por_chunk) == 2000 // costo
+    assert sum(por_chunk) == 30
+    assert item_token_cost(largas[0])[1] == OUTPUT_TOKENS_PER_ITEM
+
+
+def _ia_que_trunca_con_mas_de(limite: int) -> MagicMock:
+    """Como _ia_por_titulo, pero chunks de más de `limite` llegan ilegibles."""
+    base = _ia_por_titulo().batch_triage.side_effect
+
+    def batch_triage(chunk):
+        if len(chunk) > limite:
+            return [TriageResult(index=i, decision=TriageDecision.UNKNOWN, fallback=True)
+                    for i in range(len(chunk))]
+        return base(chunk)
+
+    ai = MagicMock()
+    ai.batch_triage.side_effect = batch_triage
+    return ai
+
+
+def test_respuesta_ilegible_parte_el_chunk_y_reintenta_las_mitades():
+    notas = [_nota(f"Choque {i}" if i == 5 else f"Nota {i}") for i in range(8)]
+    ai = _ia_que_trunca_con_mas_de(2)
+
+    candidatas = TriageService(ai, chunk_size=8).triage(notas)
+
+    # 8 → 4+4 → 2+2+2+2: solo sale la candidata real, no las 8 como UNKNOWN
+    assert [(n.titulo, t.index) for n, t in candidatas] == [("Choque 5", 5)]
+    assert [len(c.args[0]) for c in ai.batch_triage.call_args_list] == [8, 4, 2, 2, 4, 2, 2]
+
+
+def test_noticia_sola_ilegible_queda_unknown():
+    ai = _ia_que_trunca_con_mas_de(0)
+
+    candidatas = TriageService(ai).triage([_nota("Nota rara"), _nota("Otra rara")])
+
+    assert [t.decision for _, t in candidatas] == [TriageDecision.UNKNOWN] * 2
+    assert ai.batch_triage.call_count == 3
+
+
+def test_error_de_api_no_parte_el_chunk():
+    ai = MagicMock()
+    ai.batch_triage.side_effect = lambda chunk: [
+        TriageResult(index=i, decision=TriageDecision.UNKNOWN) for i in range(len(chunk))
+    ]
+
+    candidatas = TriageService(ai).triage([_nota(f"Nota {i}") for i in range(6)])
+
+    assert ai.batch_triage.call_count == 1
+    assert len(candidatas) == 6
+
+
+# ── Caché de veredictos ──────────────────────────────────────
+
+
+def test_fingerprint_ignora_acentos_mayusculas_y_puntuacion():
+    a = _nota("Incendio en bodega, cerca de Costco Cumbres!", "Milenio")
+    b = _nota("incendio en BODEGA cerca de costco cumbres", "milenio")
+    c = _nota("Incendio en bodega, cerca de Costco Cumbres!", "El Norte")
+
+    assert triage_fingerprint(a) == triage_fingerprint(b)
+    assert triage_fingerprint(a) != triage_fingerprint(c)
+
+
+def test_veredictos_cacheados_no_vuelven_a_la_ia(cache):
+    ai = _ia_por_titulo()
+    servicio = TriageService(ai, cache=cache)
+    notas = [_nota("Choque en Constitución"), _nota("Resultados de la liga")]
+    servicio.triage(notas)
+
+    # Misma historia con otra URL de redirect + una nota nueva
+    ai.batch_triage.reset_mock()
+    otra_vez = [_nota("Choque en Constitución"), _nota("Resultados de la liga"),
+                _nota("Incendio en Valle Oriente")]
+    for nota in otra_vez:
+        nota.url = "https://news.google.com/rss/articles/otro"
+
+    candidatas = servicio.triage(otra_vez)
+
+    enviados = ai.batch_triage.call_args.args[0]
+    assert [d["titulo"] for d in enviados] == ["Incendio en Valle Oriente"]
+    assert [(n.titulo, t.index) for n, t in candidatas] == [
+        ("Choque en Constitución", 0),
+        ("Incendio en Valle Oriente", 2),
+    ]
+
+
+def test_todo_en_cache_no_llama_a_la_ia(cache):
+    notas = [_nota("Choque en Constitución"), _nota("Clima para mañana")]
+    TriageService(_ia_por_titulo(), cache=cache).triage(notas)
+
+    ai = _ia_por_titulo()
+    candidatas = TriageService(ai, cache=cache).triage(notas)
+
+    ai.batch_triage.assert_not_called()
+    assert [n.titulo for n, _ in candidatas] == ["Choque en Constitución"]
+    assert candidatas[0][1].reason == "sintético"
+
+
+def test_unknown_no_se_cachea(cache):
+    ai = _ia_por_titulo({"Nota ambigua": TriageDecision.UNKNOWN})
+    servicio = TriageService(ai, cache=cache)
+    servicio.triage([_nota("Nota ambigua")])
+    servicio.triage([_nota("Nota ambigua")])
+
+    assert ai.batch_triage.call_count == 2
+
+
+def test_ttl_vencido_vuelve_a_la_ia(tmp_path):
+    ahora = [1000.0]
+    cache = SQLiteKVCache(str(tmp_path / "cache.db"), namespace="triage", clock=lambda: ahora[0])
+    ai = _ia_por_titulo()
+    servicio = TriageService(ai, cache=cache, cache_ttl_secs=60)
+    servicio.triage([_nota("Choque en Constitución")])
+
+    ahora[0] += 61
+    servicio.triage([_nota("Choque en Constitución")])
+
+    assert ai.batch_triage.call_count == 2
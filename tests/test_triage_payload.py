@@ -0,0 +1,78 @@
+"""
+Tests del formato compacto del prompt de triage.
+
+NewsItem.to_triage_dict (sin url/fecha, título sin " - Medio", fuente
+recortada, extracto por tokens), serialize_triage_articles (JSON sin
+sangría) y el arnés measure_triage_tokens.py que compara contra el formato
+anterior.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+from app.domain.models import NewsItem
+from app.domain.text import estimate_tokens, truncate_tokens
+from app.infrastructure.ai.prompts import serialize_triage_articles
+from measure_triage_tokens import measure
+
+_SNIPPET = (
+    "Un choque múltiple entre tres vehículos se registró la mañana de este martes "
+    "sobre avenida Constitución, a la altura del puente Zaragoza, lo que provocó "
+    "carga vehicular en dirección al centro de Monterrey. Elementos de Protección "
+    "Civil y Tránsito atendieron el reporte; no se reportan personas lesionadas. "
+) * 3
+
+
+def _google() -> NewsItem:
+    return NewsItem(
+        titulo="Choque múltiple en Constitución - Milenio",
+        contenido=_SNIPPET,
+        url="https://news.google.com/rss/articles/CBMi" + "x" * 180,
+        fuente="Milenio",
+        fecha_pub=datetime(2026, 10, 17, 8, 30),
+        keyword_hint="accidente_vial",
+    )
+
+
+def test_to_triage_dict_recorta_lo_que_no_sirve_para_clasificar():
+    d = _google().to_triage_dict(snippet_tokens=40)
+
+    assert set(d) == {"titulo", "fuente", "contenido", "keyword_hint"}
+    assert d["titulo"] == "Choque múltiple en Constitución"
+    assert d["fuente"] == "Milenio"
+    assert estimate_tokens(d["contenido"]) <= 40
+    assert d["contenido"].endswith("…")
+
+
+def test_fuente_de_nitter_queda_en_el_handle_y_sin_contenido_repetido():
+    tweet = NewsItem(
+        titulo="Reportan incendio en bodega de Apodaca",
+        contenido="Reportan incendio en bodega de Apodaca",
+        fuente="Twitter @pc_nl — Protección Civil Nuevo León",
+    )
+    assert tweet.to_triage_dict() == {"titulo": tweet.titulo, "fuente": "@pc_nl"}
+
+
+def test_truncate_tokens_corta_en_palabra_y_no_toca_textos_cortos():
+    assert truncate_tokens("  Choque   en\nGonzalitos ", 50) == "Choque en Gonzalitos"
+    corto = truncate_tokens("uno dos tres cuatro cinco seis siete ocho", 4)
+    assert corto == "uno dos tres…"
+
+
+def test_serializacion_compacta_es_json_valido_con_index():
+    texto = serialize_triage_articles([_google().to_triage_dict(), {"titulo": "b"}])
+
+    assert "\n" not in texto and ": " not in texto
+    assert [a["index"] for a in json.loads(texto)] == [0, 1]
+
+
+def test_arnes_reporta_menos_tokens_por_noticia():
+    news = [_google() for _ in range(10)]
+
+    r = measure(news, estimate_tokens, snippet_tokens=120)
+
+    assert r["items"] == 10
+    assert r["after_per_item"] < r["before_per_item"]
+    assert r["reduction_pct"] > 30
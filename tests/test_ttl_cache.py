@@ -0,0 +1,39 @@
+"""
+Tests de TTLCache (app/infrastructure/ttl_cache.py): expiración por TTL y
+desalojo LRU con un reloj falso (sin sleeps).
+"""
+
+from __future__ import annotations
+
+from app.infrastructure.ttl_cache import TTLCache
+
+
+def test_entrada_expira_al_cumplir_el_ttl(reloj):
+    cache = TTLCache(maxsize=10, ttl_secs=60, clock=reloj)
+    cache.set("k", "v")
+
+    reloj.t += 59
+    assert cache.get("k") == "v"
+    reloj.t += 1
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_desaloja_la_menos_usada_recientemente(reloj):
+    cache = TTLCache(maxsize=2, ttl_secs=60, clock=reloj)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")        # "a" pasa a ser la más reciente
+    cache.set("c", 3)     # desaloja "b"
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_contadores_de_hits_y_misses(reloj):
+    cache = TTLCache(clock=reloj)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("z")
+    assert (cache.hits, cache.misses) == (1, 1)